@@ -0,0 +1,70 @@
+"""
+Benchmark: registrar comandos de plugin na gramática, um a um.
+
+Cada comando acrescenta um terminal `cmd_plugin_i`, um não terminal `Plugin_i` e as
+produções `Command → Plugin_i` e `Plugin_i → cmd_plugin_i Expr ;`. Compara:
+- reconstrução: uma `Grammar` e uma `LL1Table` novas a cada registro;
+- incremental: `Grammar.add_productions` seguido de `LL1Table.update`.
+
+Uso: python benchmarks/bench_add_productions.py [--commands 100]
+"""
+
+import argparse
+import time
+
+import common  # noqa: F401 (coloca src/turtle_script no sys.path)
+from colorama import Fore
+from grammar import Command, Expr, grammar, ponto_virgula
+from table_parser_ll1 import Grammar, LL1Table, NonTerminal, Terminal
+
+
+def plugin(index: int) -> tuple[Terminal, NonTerminal, list]:
+    keyword = Terminal(f"cmd_plugin_{index}", rf"\b(plugin_{index})\b")
+    command = NonTerminal(f"Plugin_{index}")
+    return keyword, command, [Command >> command, command >> [keyword, Expr, ponto_virgula]]
+
+
+def fresh_grammar() -> Grammar:
+    return Grammar(grammar.start_symbol, grammar.terminals, grammar.non_terminals, grammar.productions)
+
+
+def rebuild(commands: int) -> tuple[float, LL1Table]:
+    base = fresh_grammar()
+    terminals, non_terminals, productions = base.terminals, base.non_terminals, base.productions
+    start = time.perf_counter()
+    for index in range(commands):
+        keyword, command, new = plugin(index)
+        # A mesma posição que `add_productions` escolhe (antes do identificador)
+        terminals = list(terminals)
+        terminals.insert(Grammar.insertion_point(keyword, terminals), keyword)
+        non_terminals = non_terminals + [command]
+        productions = productions + new
+        table = LL1Table(Grammar(base.start_symbol, terminals, non_terminals, productions))
+    return time.perf_counter() - start, table
+
+
+def incremental(commands: int) -> tuple[float, LL1Table]:
+    table = LL1Table(fresh_grammar())
+    start = time.perf_counter()
+    for index in range(commands):
+        keyword, command, new = plugin(index)
+        table.update(table.grammar.add_productions(new, [keyword], [command]))
+    return time.perf_counter() - start, table
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--commands", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    rebuild_time, rebuilt = min((rebuild(args.commands) for _ in range(3)), key=lambda run: run[0])
+    incremental_time, updated = min((incremental(args.commands) for _ in range(3)), key=lambda run: run[0])
+    assert updated.cells == rebuilt.cells and updated.offsets == rebuilt.offsets
+
+    print(Fore.YELLOW + f"Registro de {args.commands} comandos, um a um (melhor de 3)" + Fore.RESET)
+    for label, seconds in [("reconstrução", rebuild_time), ("incremental", incremental_time)]:
+        print(
+            f"{label:<14} total {seconds * 1000:>8.1f} ms   "
+            f"por comando {seconds / args.commands * 1000:>6.3f} ms"
+        )
+    print(f"ganho: {rebuild_time / incremental_time:.1f}x")
@@ -0,0 +1,89 @@
+"""
+Benchmark: AST pelas ações semânticas no driver LL(1) versus árvore de derivação
+seguida de `get_ast_root`.
+
+- derivação + AST: `LL1ParserTable.parse` constrói um nó por símbolo (inclusive ε)
+  e `get_ast_root` percorre a árvore para construir a AST;
+- ações: `LL1ParserTable(actions=ast_actions(grammar))` reduz cada produção na pilha
+  de valores e só aloca os nós da AST.
+As duas variantes rodam também com o `ExpressionParser`. Mede o tempo, os nós
+alocados e o pico de memória (tracemalloc), e confere que as ASTs são idênticas.
+
+Uso: python benchmarks/bench_ast_actions.py [--size 5000]
+"""
+
+import argparse
+import tracemalloc
+
+from anytree import PreOrderIter, RenderTree
+from colorama import Fore
+from common import best_of, load_corpus, synthetic_script
+from abstract_syntax_tree import ast_actions, get_ast_root
+from grammar import expression_parser, grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+
+def count_nodes(root) -> int:
+    return sum(1 for _ in PreOrderIter(root))
+
+
+def peak_memory(fn) -> int:
+    """Pico de memória alocada (bytes) durante `fn`."""
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=5_000)
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    actions = ast_actions(grammar)
+    variants = [
+        (
+            "LL(1)",
+            LL1ParserTable(table, grammar.start_symbol),
+            LL1ParserTable(table, grammar.start_symbol, actions=actions),
+        ),
+        (
+            "precedência",
+            LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser),
+            LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser, actions=actions),
+        ),
+    ]
+    inputs = load_corpus() + [("sintético", synthetic_script(args.size))]
+
+    print(Fore.YELLOW + "Derivação + get_ast_root versus ações (melhor de 5)" + Fore.RESET)
+    print(
+        f"{'entrada':<14} {'variante':<12} {'tokens':>7} {'nós':>17} "
+        f"{'ms':>19} {'ganho':>7} {'pico KB':>19}"
+    )
+    for name, text in inputs:
+        tokens = Tokenizer.tokenize(text, grammar)
+        for variant, derivation, direct in variants:
+
+            def two_passes():
+                return get_ast_root(derivation.parse(tokens)[1])
+
+            def one_pass():
+                return direct.parse(tokens)[1]
+
+            # Nós da árvore de derivação contados antes de `get_ast_root`, que a desmonta
+            derivation_nodes = count_nodes(derivation.parse(tokens)[1])
+            expected, ast = two_passes(), one_pass()
+            assert RenderTree(expected).by_attr() == RenderTree(ast).by_attr()
+            ast_nodes = count_nodes(ast)
+
+            number = max(1, 2_000 // len(tokens))
+            before, after = best_of(two_passes, number), best_of(one_pass, number)
+            memory = [peak_memory(two_passes) / 1024, peak_memory(one_pass) / 1024]
+            print(
+                f"{name:<14} {variant:<12} {len(tokens):>7} "
+                f"{derivation_nodes + ast_nodes:>8} → {ast_nodes:<6} "
+                f"{before * 1000:>8.2f} → {after * 1000:<8.2f} {before / after:>6.2f}x "
+                f"{memory[0]:>8.0f} → {memory[1]:<8.0f}"
+            )
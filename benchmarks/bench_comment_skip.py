@@ -0,0 +1,66 @@
+"""
+Benchmark (tracemalloc): pico de memória da tokenização de um script com comentários.
+
+A versão original removia os comentários com `re.sub(r"//.*?$", "", text)` antes
+da varredura, alocando uma segunda cópia da fonte. A atual pula os comentários
+na própria varredura. A entrada é o laço `repita` de `inputs/entrada3.txt`
+repetido até o tamanho pedido.
+
+Uso: python benchmarks/bench_comment_skip.py [--size-mb 50]
+"""
+
+import argparse
+import gc
+import os
+import re
+import time
+import tracemalloc
+
+from colorama import Fore
+from common import INPUTS_DIR, synthetic_script
+from grammar import grammar
+from table_parser_ll1 import Tokenizer
+
+
+def tokenize_prepass(text: str):
+    """Tokenização precedida da remoção de comentários da versão original."""
+    return Tokenizer.tokenize(re.sub(r"//.*?$", "", text, flags=re.MULTILINE), grammar)
+
+
+def tokenize_fused(text: str):
+    return Tokenizer.tokenize(text, grammar)
+
+
+def measure(tokenize, text: str) -> tuple[int, float]:
+    """Pico de memória (bytes) acima do texto já carregado e tempo (s) de `tokenize`."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    tokenize(text)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size-mb", type=float, default=50)
+    args = arg_parser.parse_args()
+
+    with open(os.path.join(INPUTS_DIR, "entrada3.txt"), "r", encoding="utf-8") as f:
+        example = f.read()
+    loop = example[example.index("    repita") : example.index("fim_repita;") + len("fim_repita;\n")]
+    text = synthetic_script(int(args.size_mb * 2**20), body=loop)
+    comments = sum(len(match.group()) for match in re.finditer(r"//.*?$", text, re.MULTILINE))
+
+    print(
+        Fore.YELLOW
+        + f"Tokenização de {len(text) / 2**20:.1f} MB ({comments / len(text):.0%} em comentários)"
+        + Fore.RESET
+    )
+    print(f"{'versão':<24} {'pico (MB)':>10} {'tempo (s)':>10}")
+    for name, tokenize in [("re.sub + varredura", tokenize_prepass), ("comentários na varredura", tokenize_fused)]:
+        peak, elapsed = measure(tokenize, text)
+        print(f"{name:<24} {peak / 2**20:>10.1f} {elapsed:>10.2f}")
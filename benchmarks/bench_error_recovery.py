@@ -0,0 +1,87 @@
+"""
+Benchmark: recuperação de erros do `LL1ParserTable` (`parse(tokens, errors)`).
+
+- entradas válidas: `parse` sem e com a lista `errors`, com e sem o parser de
+  precedência; o custo da recuperação em entrada válida é só a contagem da posição
+  dos tokens;
+- entradas com erros: o script sintético com um erro injetado a cada `--every`
+  comandos; erros encontrados numa passada e tempo, contra `parse` (que para no
+  primeiro erro).
+
+Uso: python benchmarks/bench_error_recovery.py [--size 20000] [--every 10]
+"""
+
+import argparse
+import time
+
+from colorama import Fore
+from common import SCRIPT_BODY, best_of, load_corpus, synthetic_script
+from grammar import expression_parser, grammar, synchronizing
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+# Um comando com a expressão faltando e outro com um token a mais
+BROKEN_BODY = SCRIPT_BODY.replace("avancar lado;", "avancar ;").replace("girar_direita 90;", "girar_direita 90 90;")
+
+
+def interleaved_best(functions: list, number: int = 1, repeat: int = 30) -> list[float]:
+    """Como `best_of`, alternando as funções a cada rodada: o ruído da máquina afeta todas igualmente."""
+    best = [float("inf")] * len(functions)
+    for _ in range(repeat):
+        for index, fn in enumerate(functions):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            best[index] = min(best[index], (time.perf_counter() - start) / number)
+    return best
+
+
+def with_errors(size: int, every: int) -> tuple[str, int]:
+    """Script sintético em que um a cada `every` blocos tem dois erros; retorna (texto, erros)."""
+    text = synthetic_script(size)
+    blocks = text.split(SCRIPT_BODY)
+    broken = 0
+    for index in range(1, len(blocks) - 1, every):
+        blocks[index] = BROKEN_BODY + blocks[index]
+        broken += 2
+    return SCRIPT_BODY.join(blocks), broken
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=20_000)
+    arg_parser.add_argument("--every", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    parsers = [
+        ("ll1", LL1ParserTable(table, grammar.start_symbol, synchronizing=synchronizing)),
+        (
+            "ll1+precedência",
+            LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser, synchronizing=synchronizing),
+        ),
+    ]
+    inputs = load_corpus() + [("sintético", synthetic_script(args.size))]
+
+    print(Fore.YELLOW + "Entrada válida: parse sem e com `errors` (ms, melhor de 30, alternados)" + Fore.RESET)
+    print(f"{'entrada':<14} {'tokens':>7}" + "".join(f" {name:>30}" for name, _ in parsers))
+    for name, text in inputs:
+        tokens = Tokenizer.tokenize(text, grammar)
+        cells = []
+        for _, parser in parsers:
+            errors = []
+            assert parser.parse(tokens)[0] and parser.parse(tokens, errors)[0] and not errors
+            number = max(1, 2_000 // len(tokens))
+            plain, recovering = interleaved_best([lambda: parser.parse(tokens), lambda: parser.parse(tokens, [])], number)
+            cells.append(f"{plain * 1000:>8.2f} {recovering * 1000:>8.2f} {recovering / plain - 1:>+11.1%}")
+        print(f"{name:<14} {len(tokens):>7}" + "".join(f" {cell:>30}" for cell in cells))
+
+    text, injected = with_errors(args.size, args.every)
+    tokens = Tokenizer.tokenize(text, grammar)
+    print(Fore.YELLOW + f"\nEntrada com {injected} erros injetados ({len(tokens)} tokens)" + Fore.RESET)
+    print(f"{'parser':<16} {'encontrados':>11} {'parse ms':>9} {'recuperação ms':>15}")
+    for name, parser in parsers:
+        errors = []
+        parser.parse(tokens, errors)
+        plain = best_of(lambda: parser.parse(tokens))
+        recovering = best_of(lambda: parser.parse(tokens, []))
+        print(f"{name:<16} {len(errors):>11} {plain * 1000:>9.2f} {recovering * 1000:>15.2f}")
@@ -0,0 +1,74 @@
+"""
+Benchmark: expressões pelo driver LL(1) e pelo `ExpressionParser` (precedência).
+
+Sem o parser de precedência, cada operando desce por Expr → OrExpr → AndExpr →
+NotExpr → AddExpr → MulExpr → Primary, com uma cauda ε em cada nível. Mede, para
+scripts com muitas expressões e para cadeias `v0 + v1 + ... + vn`:
+- nós da árvore de derivação;
+- tempo de parse e de parse seguido de `get_ast_root`.
+Confere que as duas ASTs são idênticas.
+
+Uso: python benchmarks/bench_expression_parser.py [--size 5000] [--chains 26 100 250]
+"""
+
+import argparse
+
+from anytree import PreOrderIter, RenderTree
+from colorama import Fore
+from common import best_of, synthetic_script
+from abstract_syntax_tree import get_ast_root
+from grammar import expression_parser, grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+EXPRESSION_BODY = """\
+    lado = (lado + 5) * 2 - lado / 3 % 7;
+    se lado > 100 && !(lado == 150) || lado <= 10 entao
+        avancar lado * 2 + 1;
+        ir_para lado - 1 lado + 1;
+    fim_se;
+"""
+
+
+def measure(name: str, text: str, ll1: LL1ParserTable, pratt: LL1ParserTable):
+    tokens = Tokenizer.tokenize(text, grammar)
+    (accepted, expected), (pratt_accepted, root) = ll1.parse(tokens), pratt.parse(tokens)
+    assert accepted and pratt_accepted
+    # Contados antes de `get_ast_root`, que move a AST da expressão para a árvore nova
+    nodes = [sum(1 for _ in PreOrderIter(tree)) for tree in (expected, root)]
+    assert RenderTree(get_ast_root(expected)).by_attr() == RenderTree(get_ast_root(root)).by_attr()
+
+    number = max(1, 2_000 // len(tokens))
+    timings = [
+        best_of(lambda: ll1.parse(tokens), number),
+        best_of(lambda: pratt.parse(tokens), number),
+        best_of(lambda: get_ast_root(ll1.parse(tokens)[1]), number),
+        best_of(lambda: get_ast_root(pratt.parse(tokens)[1]), number),
+    ]
+    print(
+        f"{name:<16} {len(tokens):>7} {nodes[0]:>7} → {nodes[1]:<6} "
+        f"{timings[0] * 1000:>9.2f} {timings[1] * 1000:>9.2f} {timings[0] / timings[1]:>6.2f}x "
+        f"{timings[2] * 1000:>9.2f} {timings[3] * 1000:>9.2f} {timings[2] / timings[3]:>6.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=5_000)
+    # Cadeias muito longas esgotam a recursão de `f_expr` na AST do driver LL(1)
+    arg_parser.add_argument("--chains", type=int, nargs="+", default=[26, 100, 250])
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    ll1 = LL1ParserTable(table, grammar.start_symbol)
+    pratt = LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser)
+
+    print(Fore.YELLOW + "Parse e parse + AST, LL(1) versus precedência (melhor de 5)" + Fore.RESET)
+    print(
+        f"{'entrada':<16} {'tokens':>7} {'nós':>16} "
+        f"{'LL(1) ms':>9} {'prec. ms':>9} {'ganho':>7} {'+AST ms':>9} {'+AST ms':>9} {'ganho':>7}"
+    )
+    measure("expressões", synthetic_script(args.size, EXPRESSION_BODY), ll1, pratt)
+    measure("script padrão", synthetic_script(args.size), ll1, pratt)
+    for length in args.chains:
+        chain = " + ".join(f"v{i}" for i in range(length))
+        measure(f"cadeia de {length}", f"inicio\n    avancar {chain};\nfim\n", ll1, pratt)
@@ -0,0 +1,63 @@
+"""
+Benchmark (tracemalloc): memória dos tokens materializados com lexemas lidos.
+
+A árvore de derivação guarda um `Token` por folha e o semântico/gerador leem os
+seus lexemas. Sem compartilhamento, cada ocorrência recorta um lexema novo da
+fonte. Com os lexemas compartilhados, terminais de grafia única (`;`, `fim_se`,
+`girar_direita`, ...) usam um único objeto e os identificadores são internados.
+
+Uso: python benchmarks/bench_flyweight_tokens.py [--tokens 1000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from colorama import Fore
+from common import synthetic_script
+from grammar import grammar
+from table_parser_ll1 import TokenArray, Tokenizer
+
+
+def materialize(tokens: TokenArray) -> list:
+    """Cria os `Token`s e lê os lexemas, como as folhas da árvore após o semântico."""
+    leaves = list(tokens)
+    for token in leaves:
+        token.lexeme
+    return leaves
+
+
+def retained(build) -> int:
+    """Memória (bytes) ainda alocada pelo resultado de `build()`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--tokens", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    # Cerca de 7,1 caracteres por token no corpo sintético
+    text = synthetic_script(int(args.tokens * 7.1))
+    shared = Tokenizer.tokenize(text, grammar)
+    # Mesmos arrays, sem lexemas compartilhados: um recorte da fonte por ocorrência
+    plain = TokenArray(shared.source, shared.terminals)
+    plain.kinds, plain.starts, plain.ends = shared.kinds, shared.starts, shared.ends
+
+    plain_bytes = retained(lambda: materialize(plain))
+    shared_bytes = retained(lambda: materialize(shared))
+    distinct = len({id(token.lexeme) for token in materialize(shared)})
+
+    print(Fore.YELLOW + f"Memória de {len(shared)} tokens materializados com lexemas" + Fore.RESET)
+    for label, size in [("lexema por ocorrência", plain_bytes), ("lexemas compartilhados", shared_bytes)]:
+        print(f"{label:<24} {size / 2**20:>8.1f} MB  {size / len(shared):>6.1f} B/token")
+    print(f"objetos de lexema distintos: {distinct}")
+    print(Fore.GREEN + f"Redução: {1 - shared_bytes / plain_bytes:.0%}" + Fore.RESET)
@@ -0,0 +1,179 @@
+"""
+Benchmark: construção de `Grammar` (validação, FIRST e FOLLOW) em gramáticas sintéticas.
+
+Gera gramáticas no estilo de `grammar.py` (declarações, N comandos com argumentos,
+blocos aninhados e uma cadeia de níveis de precedência de expressões) e compara a
+versão original, que repete passadas sobre todas as produções até nada mudar e
+valida com buscas em listas, com a atual (listas de trabalho e algoritmo
+"digraph" de DeRemer e Pennello, validação com conjuntos).
+
+Uso: python benchmarks/bench_grammar_analysis.py [--max-commands 2000]
+"""
+
+import argparse
+from collections import defaultdict
+
+from colorama import Fore
+from common import best_of
+from table_parser_ll1 import Grammar, NonTerminal, Production, Terminal
+
+
+class OriginalGrammar(Grammar):
+    """`Grammar` com a validação e o cálculo de FIRST/FOLLOW originais."""
+
+    def _validate_productions(self):
+        erros = []
+        for prod in self.productions:
+            if not isinstance(prod, Production):
+                erros.append(f"Expected Production but got '{type(prod).__name__}'")
+            if prod.lhs not in self.non_terminals:
+                erros.append(f"LHS '{prod.lhs}' is not in non_terminals list")
+            for sym in prod.rhs:
+                if isinstance(sym, Terminal) and sym not in self.terminals:
+                    erros.append(f"Terminal '{sym}' is not in terminals list")
+                elif isinstance(sym, NonTerminal) and sym not in self.non_terminals:
+                    erros.append(f"NonTerminal '{sym}' is not in non_terminals list")
+        if erros:
+            raise ValueError("Errors in productions:\n" + "\n".join(erros))
+
+    def compute_first_sets(self):
+        first = defaultdict(set)
+
+        def first_of(symbol):
+            if isinstance(symbol, Terminal):
+                return {symbol}
+            return first[symbol]
+
+        changed = True
+        while changed:
+            changed = False
+            for prod in self.productions:
+                lhs, rhs = prod.lhs, prod.rhs
+                original_size = len(first[lhs])
+                if len(rhs) == 1 and rhs[0] == Grammar.EPSILON:
+                    first[lhs].add(Grammar.EPSILON)
+                else:
+                    nullable = True
+                    for symbol in rhs:
+                        symbol_first = first_of(symbol)
+                        first[lhs].update(symbol_first - {Grammar.EPSILON})
+                        if Grammar.EPSILON not in symbol_first:
+                            nullable = False
+                            break
+                    if nullable:
+                        first[lhs].add(Grammar.EPSILON)
+                if len(first[lhs]) > original_size:
+                    changed = True
+        return first
+
+    def compute_follow_sets(self):
+        follow = defaultdict(set)
+        follow[self.start_symbol].add(Grammar.EOF)
+        changed = True
+        while changed:
+            changed = False
+            for prod in self.productions[::-1]:
+                lhs, rhs = prod.lhs, prod.rhs
+                trailer = follow[lhs].copy()
+                for i in reversed(range(len(rhs))):
+                    symbol = rhs[i]
+                    if isinstance(symbol, NonTerminal):
+                        original_size = len(follow[symbol])
+                        follow[symbol].update(trailer)
+                        if Grammar.EPSILON in self.first_sets[symbol]:
+                            trailer = trailer.union(self.first_sets[symbol] - {Grammar.EPSILON})
+                        else:
+                            trailer = self.first_sets[symbol] - {Grammar.EPSILON}
+                        if len(follow[symbol]) > original_size:
+                            changed = True
+                    elif isinstance(symbol, Terminal):
+                        trailer = {symbol}
+        return follow
+
+
+def synthetic_grammar(commands: int) -> dict:
+    """Argumentos de `Grammar` no estilo de `grammar.py`, com `commands` comandos."""
+    T, N = Terminal, NonTerminal
+    inicio, fim, var, dois_pontos = T("inicio"), T("fim"), T("var"), T(":")
+    pv, virgula, abre, fecha = T(";"), T(","), T("("), T(")")
+    iden, num, entao = T("iden"), T("num"), T("entao")
+    terminals = [inicio, fim, var, dois_pontos, pv, virgula, abre, fecha, iden, num, entao]
+    Program, Decls, Decl, Cmds, Cmd = N("Program"), N("Decls"), N("Decl"), N("Cmds"), N("Cmd")
+    non_terminals = [Program, Decls, Decl, Cmds, Cmd]
+
+    # Cadeia de precedência: Expr_0 → Expr_1 Resto_0 ... Expr_k → ( Expr_0 ) | iden | num
+    levels = max(4, commands // 20)
+    exprs = [N(f"Expr_{level}") for level in range(levels + 1)]
+    rests = [N(f"Resto_{level}") for level in range(levels)]
+    ops = [T(f"op_{level}") for level in range(levels)]
+    terminals += ops
+    non_terminals += exprs + rests
+    productions = [
+        Program >> [inicio, Decls, Cmds, fim],
+        Decls >> [Decl, Decls],
+        Decls >> [],
+        Decl >> [var, iden, dois_pontos, iden, pv],
+        Cmds >> [Cmd, pv, Cmds],
+        Cmds >> [],
+    ]
+    for level in range(levels):
+        productions += [
+            exprs[level] >> [exprs[level + 1], rests[level]],
+            rests[level] >> [ops[level], exprs[level + 1], rests[level]],
+            rests[level] >> [],
+        ]
+    productions += [exprs[-1] >> [abre, exprs[0], fecha], exprs[-1] >> iden, exprs[-1] >> num]
+
+    for index in range(commands):
+        keyword, command = T(f"kw_{index}"), N(f"Cmd_{index}")
+        args, tail = N(f"Args_{index}"), N(f"ArgsResto_{index}")
+        terminals.append(keyword)
+        non_terminals += [command, args, tail]
+        productions.append(Cmd >> command)
+        if index % 10 == 0:  # bloco aninhado: kw_i Expr entao Cmds fim_i
+            end = T(f"fim_{index}")
+            terminals.append(end)
+            productions.append(command >> [keyword, exprs[0], entao, Cmds, end])
+        else:
+            productions.append(command >> [keyword, args])
+        productions += [
+            args >> [exprs[0], tail],
+            args >> [],
+            tail >> [virgula, exprs[0], tail],
+            tail >> [],
+        ]
+    terminals.append(Grammar.EOF)
+    return dict(
+        start_symbol=Program,
+        terminals=terminals,
+        non_terminals=non_terminals,
+        productions=productions,
+    )
+
+
+def same_sets(a: dict, b: dict) -> bool:
+    """Compara conjuntos por símbolo, tratando chaves ausentes como conjuntos vazios."""
+    return all(a.get(key, set()) == b.get(key, set()) for key in a.keys() | b.keys())
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--max-commands", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    print(Fore.YELLOW + "Construção de Grammar: original × lista de trabalho/digraph" + Fore.RESET)
+    print(f"{'comandos':>9} {'produções':>10} {'original (s)':>13} {'atual (s)':>10} {'ganho':>7}")
+    commands = 25
+    while commands <= args.max_commands:
+        arguments = synthetic_grammar(commands)
+        original, current = OriginalGrammar(**arguments), Grammar(**arguments)
+        assert same_sets(original.first_sets, current.first_sets)
+        assert same_sets(original.follow_sets, current.follow_sets)
+        # FIRST e FOLLOW são calculados no primeiro acesso
+        original_time = best_of(lambda: OriginalGrammar(**arguments).follow_sets, repeat=1)
+        current_time = best_of(lambda: Grammar(**arguments).follow_sets, repeat=3)
+        print(
+            f"{commands:>9} {len(arguments['productions']):>10} {original_time:>13.3f}"
+            f" {current_time:>10.4f} {original_time / current_time:>6.0f}x"
+        )
+        commands *= 2
@@ -0,0 +1,66 @@
+"""
+Benchmark: latência edição→tokens da retokenização incremental.
+
+Para um script de ~10 mil linhas, aplica edições aleatórias (inserção ou remoção
+de alguns caracteres) e compara `retokenize`, que varre apenas o trecho afetado,
+com `Tokenizer.tokenize` do texto editado inteiro.
+
+Uso: python benchmarks/bench_incremental_lexer.py [--lines 10000] [--edits 200]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from colorama import Fore
+from common import SCRIPT_BODY, synthetic_script
+from grammar import grammar
+from incremental_lexer import retokenize
+from table_parser_ll1 import Tokenizer
+
+FRAGMENTS = ["a", "1", " ", "\n", ";", "lado", "+ 5", "se"]
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--lines", type=int, default=10000)
+    arg_parser.add_argument("--edits", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    lines_per_body = SCRIPT_BODY.count("\n")
+    text = synthetic_script(args.lines // lines_per_body * len(SCRIPT_BODY))
+    tokens = Tokenizer.tokenize(text, grammar)
+
+    rng = random.Random(2025)
+    incremental, full, changed = [], [], []
+    for _ in range(args.edits):
+        offset = rng.randrange(len(text))
+        deleted = rng.choice([0, 0, 1, 2])
+        inserted = rng.choice(FRAGMENTS) if rng.random() < 0.75 else ""
+        if '"' in text[offset : offset + deleted]:
+            continue  # mantém os textos entre aspas fechados: o script segue tokenizável
+        edited = text[:offset] + inserted + text[offset + deleted :]
+
+        start = time.perf_counter()
+        result, change = retokenize(tokens, grammar, offset, deleted, inserted)
+        incremental.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        Tokenizer.tokenize(edited, grammar)
+        full.append(time.perf_counter() - start)
+
+        changed.append(change.new_end - change.start)
+        text, tokens = edited, result
+
+    print(
+        Fore.YELLOW
+        + f"{text.count(chr(10))} linhas, {len(tokens)} tokens, {len(full)} edições"
+        + Fore.RESET
+    )
+    print(f"{'método':<14} {'mediana (ms)':>13} {'p95 (ms)':>10}")
+    for name, times in [("retokenize", incremental), ("tokenize", full)]:
+        times = sorted(times)
+        p95 = times[int(len(times) * 0.95)]
+        print(f"{name:<14} {statistics.median(times) * 1000:>13.3f} {p95 * 1000:>10.3f}")
+    print(f"tokens reescritos por edição (mediana): {statistics.median(changed)}")
@@ -0,0 +1,64 @@
+"""
+Benchmark: parse com a gramática original e com `Grammar.inline_units`.
+
+Para cada entrada de `inputs/` mede:
+- nós da árvore de derivação (o anytree domina o tempo de parse);
+- consultas à tabela (um por nó de não terminal);
+- tempo de parse e de parse seguido de `expand` (necessário para a AST).
+Confere que a árvore expandida e a AST são idênticas às da gramática original.
+
+Uso: python benchmarks/bench_inline_units.py
+"""
+
+from anytree import PreOrderIter, RenderTree
+from colorama import Fore
+from common import best_of, load_corpus
+from abstract_syntax_tree import get_ast_root
+from grammar import grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, NonTerminal, Token, Tokenizer
+
+
+def shape(root) -> list:
+    return [
+        (node.name.terminal if isinstance(node.name, Token) else node.name, node.depth)
+        for node in PreOrderIter(root)
+    ]
+
+
+def counts(root) -> tuple[int, int]:
+    """Total de nós e nós de não terminais (consultas à tabela)."""
+    nodes = list(PreOrderIter(root))
+    return len(nodes), sum(isinstance(node.name, NonTerminal) for node in nodes)
+
+
+if __name__ == "__main__":
+    inlined = grammar.inline_units()
+    original = LL1ParserTable(LL1Table(grammar), grammar.start_symbol)
+    reduced = LL1ParserTable(LL1Table(inlined), inlined.start_symbol)
+    print(
+        Fore.YELLOW
+        + f"Gramática: {len(grammar.productions)} → {len(inlined.productions)} produções, "
+        + f"{len(grammar.non_terminals)} → {len(inlined.non_terminals)} não terminais"
+        + Fore.RESET
+    )
+    print(
+        f"{'entrada':<14} {'nós':>11} {'consultas':>11} "
+        f"{'original (ms)':>14} {'reduzida (ms)':>14} {'+expand (ms)':>13}"
+    )
+    for name, text in load_corpus():
+        tokens = Tokenizer.tokenize(text, grammar)
+        accepted, expected = original.parse(tokens)
+        assert accepted and reduced.parse(tokens)[0]
+        root = reduced.parse(tokens)[1]
+        (nodes, lookups), (reduced_nodes, reduced_lookups) = counts(expected), counts(root)
+        assert shape(inlined.expand(root)) == shape(expected)
+        ast = RenderTree(get_ast_root(reduced.parse(tokens)[1], inlined)).by_attr()
+        assert ast == RenderTree(get_ast_root(expected)).by_attr()
+
+        before = best_of(lambda: original.parse(tokens), 20)
+        after = best_of(lambda: reduced.parse(tokens), 20)
+        expanded = best_of(lambda: inlined.expand(reduced.parse(tokens)[1]), 20)
+        print(
+            f"{name:<14} {nodes:>5} → {reduced_nodes:<4} {lookups:>5} → {reduced_lookups:<4} "
+            f"{before * 1000:>14.3f} {after * 1000:>14.3f} {expanded * 1000:>13.3f}"
+        )
@@ -0,0 +1,49 @@
+"""
+Benchmark: classificação de palavras-chave por tabela em scripts com muitos identificadores.
+
+Compara o regex mestre com todas as palavras-chave como alternativas (cada
+identificador testa todas antes de `identificador`) com a varredura que casa um
+único lexema e o classifica por dicionário. Também mostra como o custo por token
+evolui quando a gramática ganha novos comandos.
+
+Uso: python benchmarks/bench_keyword_table.py
+"""
+
+from colorama import Fore
+from common import best_of, synthetic_script
+from grammar import grammar, terminals, productions, non_terminals
+from table_parser_ll1 import CompiledLexer, Grammar, Terminal, Tokenizer
+
+IDENTIFIER_BODY = """\
+    largura_total = altura_base + deslocamento_x * fator_escala - margem_interna;
+    se contador_passos < limite_maximo entao
+        posicao_atual = posicao_anterior + incremento_passo;
+    fim_se;
+"""
+
+
+def grammar_with_commands(extra: int) -> Grammar:
+    """Gramática do TurtleScript com `extra` comandos fictícios a mais."""
+    commands = [Terminal(f"cmd_extra_{i}", rf"\b(comando_extra_{i})\b") for i in range(extra)]
+    # Novos comandos entram antes de `identificador`, como os já existentes
+    index = terminals.index(next(t for t in terminals if t.name == "identificador"))
+    extended = terminals[:index] + commands + terminals[index:]
+    return Grammar(grammar.start_symbol, extended, non_terminals, productions)
+
+
+def per_token(lexer: CompiledLexer, text: str) -> float:
+    n_tokens = len(Tokenizer._tokenize(text, lexer))
+    return best_of(lambda: Tokenizer._tokenize(text, lexer), repeat=3) / n_tokens
+
+
+if __name__ == "__main__":
+    text = synthetic_script(256 * 1024, IDENTIFIER_BODY)
+    print(Fore.YELLOW + "Custo por token (ns), script de 256 KB com muitos identificadores" + Fore.RESET)
+    print(f"{'palavras-chave':>15} {'alternância':>12} {'tabela':>8}")
+    for extra in (0, 100, 300):
+        extended = grammar_with_commands(extra)
+        lexer = CompiledLexer(extended)
+        n_keywords = sum(len(table) for table in lexer.keywords if table)
+        full = per_token(CompiledLexer(extended, keyword_table=False), text)
+        table = per_token(lexer, text)
+        print(f"{n_keywords:>15} {full * 1e9:>12.0f} {Fore.GREEN}{table * 1e9:>8.0f}{Fore.RESET}")
@@ -0,0 +1,39 @@
+"""
+Benchmark: vazão (MB/s) dos motores léxicos "regex" e "dfa".
+
+Uso: python benchmarks/bench_lexer_dfa.py [--size-mb 2]
+"""
+
+import argparse
+import time
+
+from colorama import Fore
+from common import best_of, load_corpus, synthetic_script
+from grammar import grammar
+from table_parser_ll1 import CompiledLexer, Tokenizer
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=float, default=2)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dfa = CompiledLexer.of(grammar).dfa()
+    print(
+        f"AFD construído em {(time.perf_counter() - start) * 1e3:.1f} ms: "
+        f"{dfa.n_states} estados, {dfa.n_classes} classes de símbolos"
+    )
+
+    inputs = [("corpus inputs/", "\n".join(text for _, text in load_corpus()))]
+    inputs.append((f"sintético {args.size_mb:g} MB", synthetic_script(int(args.size_mb * 2**20))))
+
+    print(Fore.YELLOW + "Vazão de Tokenizer.tokenize (MB/s)" + Fore.RESET)
+    print(f"{'entrada':<20} {'regex':>8} {'dfa':>8}")
+    for name, text in inputs:
+        mb = len(text.encode("utf-8")) / 2**20
+        number = max(1, int(0.05 / mb))
+        rates = [
+            mb / best_of(lambda: Tokenizer.tokenize(text, grammar, engine=engine), number, 3)
+            for engine in Tokenizer.ENGINES
+        ]
+        print(f"{name:<20} {rates[0]:>8.2f} {Fore.GREEN}{rates[1]:>8.2f}{Fore.RESET}")
@@ -0,0 +1,81 @@
+"""
+Benchmark: tokenização de arquivos grandes com `read()` e com `mmap`.
+
+- read: `f.read()` + `Tokenizer.tokenize` (texto inteiro em memória, mais a
+  cópia sem comentários);
+- mmap: `Tokenizer.tokenize_file` (varredura em bytes sobre o arquivo mapeado).
+
+Para cada caminho mede a latência até o primeiro token (`iter_tokens` com o
+arquivo aberto ou com o caminho), o tempo total e o pico de memória residente
+(RSS). Cada medição roda em um subprocesso, para que o pico de um caminho não
+contamine o outro.
+
+Uso: python benchmarks/bench_mmap_input.py [--size-mb 200]
+"""
+
+import argparse
+import os
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from colorama import Fore
+from common import synthetic_script
+from grammar import grammar
+from table_parser_ll1 import Tokenizer
+
+
+def run(mode: str, path: str) -> None:
+    """Executa um caminho e imprime: primeiro token (s), total (s), tokens, pico RSS (KB)."""
+    start = time.perf_counter()
+    if mode == "read":
+        with open(path, "r", encoding="utf-8") as f:
+            next(Tokenizer.iter_tokens(f, grammar))
+    else:
+        next(Tokenizer.iter_tokens(pathlib.Path(path), grammar))
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if mode == "read":
+        with open(path, "r", encoding="utf-8") as f:
+            tokens = Tokenizer.tokenize(f.read(), grammar)
+    else:
+        tokens = Tokenizer.tokenize_file(path, grammar)
+    total = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(first, total, len(tokens), peak)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size-mb", type=float, default=200)
+    arg_parser.add_argument("--mode", choices=["read", "mmap"])
+    arg_parser.add_argument("--path")
+    args = arg_parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.path)
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "entrada.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(synthetic_script(int(args.size_mb * 2**20)))
+
+        print(Fore.YELLOW + f"Tokenização de um arquivo de {args.size_mb:g} MB" + Fore.RESET)
+        print(f"{'caminho':<8} {'1º token (ms)':>14} {'total (s)':>10} {'tokens':>12} {'pico RSS (MB)':>14}")
+        for mode in ["read", "mmap"]:
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            first, total, count, peak = output.split()
+            print(
+                f"{mode:<8} {float(first) * 1000:>14.2f} {float(total):>10.2f}"
+                f" {int(count):>12} {int(peak) / 1024:>14.1f}"
+            )
@@ -0,0 +1,111 @@
+"""
+Benchmark: motores de parsing sobre as mesmas entradas.
+
+- ll1: `LL1ParserTable`, árvore de derivação;
+- lalr1: `LALR1Parser` na mesma gramática, mesma árvore de derivação;
+- lalr1+ações: `LALR1Parser` com as expressões reescritas de forma recursiva à
+  esquerda (sem não terminais de cauda) e ações de redução que constroem a AST
+  das expressões diretamente; os demais nós continuam os da árvore de derivação.
+
+Mede tokens por segundo e nós alocados (nós da árvore resultante).
+
+Uso: python benchmarks/bench_parse_engines.py [--size 5000]
+"""
+
+import argparse
+import time
+
+from anytree import Node, PreOrderIter
+from colorama import Fore
+from common import best_of, load_corpus, synthetic_script
+import grammar as turtle
+from parsers import create_parser
+from table_parser_lalr1 import LALR1Parser, LALR1Table
+from table_parser_ll1 import Grammar, Tokenizer
+
+EXPRESSIONS = {
+    turtle.Expr,
+    turtle.OrExpr,
+    turtle.OrExprTail,
+    turtle.AndExpr,
+    turtle.AndExprTail,
+    turtle.NotExpr,
+    turtle.AddExpr,
+    turtle.AddExprTail,
+    turtle.MulExpr,
+    turtle.MulExprTail,
+    turtle.Primary,
+}
+
+
+def binary(left, op, right) -> Node:
+    return Node(op, children=[left, right])
+
+
+def left_recursive_expressions() -> tuple[Grammar, dict]:
+    """`grammar.py` com as expressões recursivas à esquerda e as ações que montam a AST."""
+    g = turtle
+    levels = [
+        (g.OrExpr, g.AndExpr, [g.op_ou]),
+        (g.AndExpr, g.NotExpr, [g.op_e]),
+        (g.AddExpr, g.MulExpr, [p.rhs[0] for p in g.productions if p.lhs == g.AddExprTail and p.rhs]),
+        (g.MulExpr, g.Primary, [p.rhs[0] for p in g.productions if p.lhs == g.MulExprTail and p.rhs]),
+    ]
+    actions = {g.Expr >> g.OrExpr: lambda value: value}
+    for lhs, operand, operators in levels:
+        actions[lhs >> operand] = lambda value: value
+        for operator in operators:
+            actions[lhs >> [lhs, operator, operand]] = binary
+    actions[g.NotExpr >> [g.op_nao, g.NotExpr]] = lambda op, value: Node(op, children=[value])
+    actions[g.NotExpr >> g.AddExpr] = lambda value: value
+    for production in g.productions:
+        if production.lhs == g.Primary:
+            if len(production.rhs) == 1:
+                actions[production] = lambda token: Node(token)
+            else:
+                actions[production] = lambda _, value, __: value
+
+    productions = [p for p in g.productions if p.lhs not in EXPRESSIONS] + list(actions)
+    non_terminals = [nt for nt in g.non_terminals if nt not in {g.OrExprTail, g.AndExprTail, g.AddExprTail, g.MulExprTail}]
+    variant = Grammar(g.grammar.start_symbol, g.grammar.terminals, non_terminals, productions)
+    return variant, actions
+
+
+def count_nodes(root: Node) -> int:
+    return sum(1 for _ in PreOrderIter(root))
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=5_000)
+    args = arg_parser.parse_args()
+
+    grammar = turtle.grammar
+    start = time.perf_counter()
+    ll1 = create_parser(grammar, "ll1")
+    ll1_build = time.perf_counter() - start
+    start = time.perf_counter()
+    lalr1 = create_parser(grammar, "lalr1")
+    lalr1_build = time.perf_counter() - start
+    variant, actions = left_recursive_expressions()
+    with_actions = LALR1Parser(LALR1Table(variant), actions)
+    print(
+        f"construção: ll1 {ll1_build * 1000:.1f} ms, lalr1 {lalr1_build * 1000:.1f} ms "
+        f"({lalr1.table.n_states} estados, {lalr1.table.nbytes / 1024:.1f} KB)"
+    )
+
+    engines = [("ll1", ll1), ("lalr1", lalr1), ("lalr1+ações", with_actions)]
+    inputs = [(name, text) for name, text in load_corpus()]
+    inputs.append(("sintético", synthetic_script(args.size)))
+
+    print(Fore.YELLOW + "Tokens por segundo e nós alocados (melhor de 5)" + Fore.RESET)
+    print(f"{'entrada':<14} {'tokens':>7}" + "".join(f" {name:>22}" for name, _ in engines))
+    for name, text in inputs:
+        tokens = Tokenizer.tokenize(text, grammar)
+        cells = []
+        for _, parser in engines:
+            accepted, root = parser.parse(tokens)
+            assert accepted
+            seconds = best_of(lambda: parser.parse(tokens), max(1, 1_000 // len(tokens)))
+            cells.append(f"{len(tokens) / seconds:>12,.0f} {count_nodes(root):>9}")
+        print(f"{name:<14} {len(tokens):>7}" + "".join(f" {cell:>22}" for cell in cells))
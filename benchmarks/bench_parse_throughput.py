@@ -0,0 +1,114 @@
+"""
+Benchmark: tokens por segundo através de `LL1ParserTable.parse`.
+
+Compara o driver atual (ids inteiros, tabela densa em `array`) com o driver
+anterior, reproduzido aqui: tabela em dicionário com chaves
+(NonTerminal, Terminal), uma tupla e dois `Symbol.__hash__` por consulta. O driver
+anterior também é medido com o hash antigo de `Symbol`, recalculado a cada chamada.
+A construção dos nós domina o parse; a segunda tabela troca `TreeNode` por um nó
+mínimo, sem lista de filhos, para medir apenas o driver.
+
+Uso: python benchmarks/bench_parse_throughput.py [--tokens 2000]
+"""
+
+import argparse
+import contextlib
+import sys
+from collections import deque
+
+from anytree import Node
+from colorama import Fore
+from common import best_of, load_corpus, synthetic_script
+from grammar import grammar
+import table_parser_ll1
+from table_parser_ll1 import Grammar, LL1ParserTable, LL1Table, Symbol, Terminal, Token, Tokenizer
+
+
+def dict_parse(table: dict, start_symbol, tokens) -> tuple[bool, Node]:
+    """O driver LL(1) anterior, sobre a tabela em dicionário."""
+    stack = deque()
+    root = Node(start_symbol)
+    stack.append((start_symbol, root))
+    tokens = iter(tokens)
+    end_of_input = Token(Grammar.EOF, "$")
+    current_token = next(tokens, end_of_input)
+
+    while stack:
+        top_symbol, top_node = stack.pop()
+        if isinstance(top_symbol, Terminal):
+            if top_symbol != current_token.terminal:
+                return False, root
+            top_node.name = current_token
+            current_token = next(tokens, end_of_input)
+            continue
+        production = table.get((top_symbol, current_token.terminal))
+        if production is None:
+            return False, root
+        children = []
+        for symbol in production.rhs:
+            if symbol == Grammar.EPSILON:
+                Node(Grammar.EPSILON, parent=top_node)
+                continue
+            children.append((symbol, Node(symbol, parent=top_node)))
+        for symbol, child in reversed(children):
+            stack.append((symbol, child))
+    return current_token is end_of_input, root
+
+
+def uncached_hash(self):
+    return hash((self.name, type(self)))
+
+
+class LightNode:
+    """Nó mínimo, sem a lista de filhos nem a verificação de ciclos do anytree."""
+
+    __slots__ = ("name", "parent")
+
+    def __init__(self, name, parent=None):
+        self.name, self.parent = name, parent
+
+
+@contextlib.contextmanager
+def patched(owner, name: str, value):
+    original = getattr(owner, name)
+    setattr(owner, name, value)
+    try:
+        yield
+    finally:
+        setattr(owner, name, original)
+
+
+def measure(parser: LL1ParserTable, table: dict, inputs: list, title: str):
+    print(Fore.YELLOW + title + Fore.RESET)
+    print(f"{'entrada':<16} {'tokens':>7} {'anterior':>10} {'dict':>10} {'ids':>10} {'ganho':>7}")
+    for name, tokens in inputs:
+        assert parser.parse(tokens)[0] and dict_parse(table, grammar.start_symbol, tokens)[0]
+        number = max(1, 2_000 // len(tokens))
+        current = best_of(lambda: parser.parse(tokens), number)
+        previous = best_of(lambda: dict_parse(table, grammar.start_symbol, tokens), number)
+        with patched(Symbol, "__hash__", uncached_hash):
+            original = best_of(lambda: dict_parse(table, grammar.start_symbol, tokens), number)
+        rates = [len(tokens) / seconds for seconds in (original, previous, current)]
+        print(
+            f"{name:<16} {len(tokens):>7} {rates[0]:>10,.0f} {rates[1]:>10,.0f} "
+            f"{rates[2]:>10,.0f} {original / current:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--tokens", type=int, default=2_000)
+    args = arg_parser.parse_args()
+
+    ll1_table = LL1Table(grammar)
+    parser = LL1ParserTable(ll1_table, grammar.start_symbol)
+    table = ll1_table.table
+
+    # Cerca de 7,1 caracteres por token no corpo sintético
+    inputs = [(name, Tokenizer.tokenize(text, grammar)) for name, text in load_corpus()]
+    inputs.append(("sintético", Tokenizer.tokenize(synthetic_script(int(args.tokens * 7.1)), grammar)))
+
+    print("anterior: dicionário e hash sem cache; dict: dicionário com hash em cache; ids: atual")
+    measure(parser, table, inputs, "Tokens por segundo em parse (melhor de 5)")
+    with patched(table_parser_ll1, "TreeNode", LightNode), patched(sys.modules[__name__], "Node", LightNode):
+        measure(parser, table, inputs, "\nApenas o driver (nós mínimos)")
@@ -0,0 +1,73 @@
+"""
+Benchmark: `LL1ParserTable.recognize` versus `parse` (árvore de derivação) e
+`parse` com as ações da AST.
+
+- scripts por segundo sobre o corpus e scripts sintéticos (tokens já prontos);
+- pico de memória (tracemalloc) com o léxico em fluxo (`Tokenizer.iter_tokens`):
+  `recognize` não retém nada além da pilha; a coluna "léxico" só consome os tokens,
+  para separar o que é do próprio léxico.
+
+Uso: python benchmarks/bench_recognize.py [--size 20000] [--stream-mb 0.1 1 2]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections import deque
+
+from colorama import Fore
+from common import best_of, load_corpus, synthetic_script
+from abstract_syntax_tree import ast_actions
+from grammar import grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+
+def peak(run) -> int:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    run()
+    result = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return result
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=20_000)
+    arg_parser.add_argument("--stream-mb", type=float, nargs="+", default=[0.1, 1, 2])
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    parser = LL1ParserTable(table, grammar.start_symbol)
+    direct = LL1ParserTable(table, grammar.start_symbol, actions=ast_actions(grammar))
+
+    print(Fore.YELLOW + "Scripts por segundo (melhor de 5)" + Fore.RESET)
+    print(f"{'entrada':<14} {'tokens':>7} {'parse':>10} {'ações':>10} {'recognize':>10} {'ganho':>7}")
+    inputs = load_corpus() + [("sintético", synthetic_script(args.size))]
+    for name, text in inputs:
+        tokens = Tokenizer.tokenize(text, grammar)
+        assert parser.recognize(tokens) == (True, None)
+        number = max(1, 5_000 // len(tokens))
+        timings = [
+            best_of(lambda: parser.parse(tokens), number),
+            best_of(lambda: direct.parse(tokens), number),
+            best_of(lambda: parser.recognize(tokens), number),
+        ]
+        print(
+            f"{name:<14} {len(tokens):>7} "
+            + " ".join(f"{1 / seconds:>10,.0f}" for seconds in timings)
+            + f" {timings[0] / timings[2]:>6.2f}x"
+        )
+
+    print(Fore.YELLOW + "\nPico de memória com `Tokenizer.iter_tokens` (KB)" + Fore.RESET)
+    print(f"{'script':>10} {'tokens':>9} {'léxico':>10} {'ações':>10} {'recognize':>10}")
+    for megabytes in args.stream_mb:
+        text = synthetic_script(int(megabytes * 2**20))
+        count = sum(1 for _ in Tokenizer.iter_tokens(text, grammar))
+        memory = [
+            peak(lambda: deque(Tokenizer.iter_tokens(text, grammar), maxlen=0)),
+            peak(lambda: direct.parse(Tokenizer.iter_tokens(text, grammar))),
+            peak(lambda: parser.recognize(Tokenizer.iter_tokens(text, grammar))),
+        ]
+        print(f"{megabytes:>7g} MB {count:>9} " + " ".join(f"{value / 1024:>10,.0f}" for value in memory))
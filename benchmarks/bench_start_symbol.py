@@ -0,0 +1,104 @@
+"""
+Benchmark: expressões avulsas com `parse(tokens, start=Expr)` na tabela de `Program`.
+
+Latência por chamada (µs, tokens já prontos) para trechos de expressão, como num
+REPL:
+- start=Expr: a tabela da gramática completa, a partir da linha de Expr;
+- programa: o trecho dentro de `inicio avancar ...; fim`, o contorno anterior;
+- dedicada: uma gramática só com as produções alcançáveis de Expr (como em
+  `expr.py`), cujo custo de construção (análise, tabela, léxico e parser) também
+  é medido.
+
+Uso: python benchmarks/bench_start_symbol.py [--repeat 5]
+"""
+
+import argparse
+import time
+
+from colorama import Fore
+from common import best_of
+from abstract_syntax_tree import ast_actions
+from grammar import Expr, expression_parser, grammar
+from table_parser_ll1 import CompiledLexer, Grammar, LL1ParserTable, LL1Table, NonTerminal, Tokenizer
+
+SNIPPETS = [
+    "a",
+    "x || y && z",
+    "!(a + b) * c",
+    "x + y * z - w / v",
+    "x * (y + z) - (w / v) || a && b",
+    "!(a + b) * (c - d) || e && f * g / h + i - j",
+]
+
+
+def expression_grammar() -> Grammar:
+    """Gramática com as produções alcançáveis de Expr, começando em Expr."""
+    reachable, pending = {Expr}, [Expr]
+    while pending:
+        lhs = pending.pop()
+        for production in grammar.productions:
+            if production.lhs == lhs:
+                for symbol in production.rhs:
+                    if isinstance(symbol, NonTerminal) and symbol not in reachable:
+                        reachable.add(symbol)
+                        pending.append(symbol)
+    return Grammar(
+        start_symbol=Expr,
+        terminals=grammar.terminals,
+        non_terminals=[nt for nt in grammar.non_terminals if nt in reachable],
+        productions=[p for p in grammar.productions if p.lhs in reachable],
+    )
+
+
+def build_dedicated(repeat: int) -> tuple[LL1ParserTable, float]:
+    """Parser da gramática dedicada e o melhor tempo de construção (gramática nova a cada rodada)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser = LL1ParserTable.from_grammar(expression_grammar())
+        CompiledLexer.of(parser.table.grammar)  # os trechos são tokenizados pela gramática dedicada
+        best = min(best, time.perf_counter() - start)
+    return parser, best
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    ll1 = LL1ParserTable(table, grammar.start_symbol)
+    pratt = LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser)
+    actions = LL1ParserTable(table, grammar.start_symbol, actions=ast_actions(grammar))
+
+    dedicated, build = build_dedicated(args.repeat)
+    print(
+        f"gramática dedicada: {len(dedicated.table.grammar.productions)} produções, "
+        f"construção {build * 1000:.2f} ms (melhor de {args.repeat})"
+    )
+
+    columns = ["start=Expr", "precedência", "ações", "recognize", "programa", "dedicada"]
+    print(Fore.YELLOW + f"Latência por chamada (µs, melhor de {args.repeat})" + Fore.RESET)
+    print(f"{'trecho':<46} {'tokens':>6}" + "".join(f" {name:>11}" for name in columns))
+    total = [0.0] * len(columns)
+    for text in SNIPPETS:
+        tokens = Tokenizer.tokenize(text, grammar)
+        program = Tokenizer.tokenize(f"inicio avancar {text}; fim", grammar)
+        calls = [
+            lambda: ll1.parse(tokens, start=Expr),
+            lambda: pratt.parse(tokens, start=Expr),
+            lambda: actions.parse(tokens, start=Expr),
+            lambda: ll1.recognize(tokens, start=Expr),
+            lambda: ll1.parse(program),
+            lambda: dedicated.parse(tokens),
+        ]
+        assert all(call()[0] for call in calls)
+        timings = [best_of(call, 2_000, args.repeat) for call in calls]
+        total = [sum(pair) for pair in zip(total, timings)]
+        print(f"{text:<46} {len(tokens):>6}" + "".join(f" {seconds * 1e6:>11.1f}" for seconds in timings))
+
+    mean = total[0] / len(SNIPPETS)
+    print(
+        f"\nconstruir a gramática dedicada custa {build / mean:,.0f} chamadas médias com start=Expr "
+        f"({mean * 1e6:.1f} µs)"
+    )
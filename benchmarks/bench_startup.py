@@ -0,0 +1,89 @@
+"""
+Benchmark: tempo de inicialização (importar `grammar` e montar o parser LL(1)).
+
+Cada medição roda em um processo novo, como uma chamada curta de linha de comando:
+- sem cache: FIRST, FOLLOW e tabela LL(1) recalculados (o padrão, sem `TURTLE_SCRIPT_CACHE`);
+- cache frio: primeira execução com um diretório vazio (calcula e grava);
+- cache quente: o instantâneo é carregado do disco.
+
+Em seguida compara, no mesmo processo, a construção de gramáticas sintéticas
+maiores (ver `bench_grammar_analysis.py`) com e sem o cache quente.
+
+Uso: python benchmarks/bench_startup.py [--runs 10] [--commands 100 1000 3000]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_grammar_analysis import synthetic_grammar
+from colorama import Fore
+from common import ROOT, best_of
+from table_parser_ll1 import Grammar, LL1Table
+
+STARTUP = """
+import time
+start = time.perf_counter()
+from grammar import grammar
+from table_parser_ll1 import LL1Table, LL1ParserTable
+parser = LL1ParserTable(LL1Table(grammar), grammar.start_symbol)
+print(time.perf_counter() - start)
+"""
+
+
+def run(cache_dir: str) -> tuple[float, float]:
+    """Executa a inicialização em um processo novo; retorna (inicialização, processo) em s."""
+    env = dict(os.environ, TURTLE_SCRIPT_CACHE=cache_dir)
+    # Bytecode em cache, como em uma instalação comum
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP],
+        cwd=os.path.join(ROOT, "src", "turtle_script"),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--runs", type=int, default=10)
+    arg_parser.add_argument("--commands", type=int, nargs="+", default=[100, 1000, 3000])
+    args = arg_parser.parse_args()
+
+    run("")  # aquece o bytecode e o cache de arquivos do sistema
+    with tempfile.TemporaryDirectory() as warm_dir:
+        run(warm_dir)
+        results = {"sem cache": [], "cache frio": [], "cache quente": []}
+        for _ in range(args.runs):
+            results["sem cache"].append(run(""))
+            with tempfile.TemporaryDirectory() as cold_dir:
+                results["cache frio"].append(run(cold_dir))
+            results["cache quente"].append(run(warm_dir))
+
+    print(Fore.YELLOW + f"Inicialização do parser (mediana de {args.runs} processos)" + Fore.RESET)
+    print(f"{'modo':<14} {'import + tabela (ms)':>21} {'processo (ms)':>14}")
+    for name, times in results.items():
+        startup = statistics.median(t for t, _ in times)
+        process = statistics.median(p for _, p in times)
+        print(f"{name:<14} {startup * 1000:>21.1f} {process * 1000:>14.1f}")
+
+    print(Fore.YELLOW + "\nGramáticas sintéticas: Grammar + LL1Table (melhor de 5)" + Fore.RESET)
+    print(f"{'comandos':>9} {'produções':>10} {'sem cache (ms)':>15} {'cache quente (ms)':>18}")
+    for commands in args.commands:
+        kwargs = synthetic_grammar(commands)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            Grammar(**kwargs, cache_dir=cache_dir).follow_sets  # grava o instantâneo
+            uncached = best_of(lambda: LL1Table(Grammar(**kwargs)))
+            cached = best_of(lambda: LL1Table(Grammar(**kwargs, cache_dir=cache_dir)))
+        print(
+            f"{commands:>9} {len(kwargs['productions']):>10} "
+            f"{uncached * 1000:>15.1f} {cached * 1000:>18.1f}"
+        )
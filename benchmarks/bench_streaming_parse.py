@@ -0,0 +1,77 @@
+"""
+Benchmark (tracemalloc): pico de memória dos tokens com e sem fluxo.
+
+Compara três formas de produzir os tokens:
+- lista de `Token` materializada (`list(Tokenizer.iter_tokens(...))`);
+- `TokenArray` de `Tokenizer.tokenize`;
+- fluxo de `Tokenizer.iter_tokens`, consumido um token por vez.
+
+A primeira tabela mede apenas os tokens (entrada de --size-mb). A segunda
+mede `LL1ParserTable.parse` completo; como a árvore anytree cresce de forma
+superlinear em tempo, ela roda sobre uma entrada menor (--parse-mb). Nela a
+árvore retém os tokens das folhas em todos os casos: o fluxo elimina apenas
+a lista de tokens.
+
+Uso: python benchmarks/bench_streaming_parse.py [--size-mb 100] [--parse-mb 0.05]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections import deque
+
+from colorama import Fore
+from common import synthetic_script
+from grammar import grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+
+def peak(run) -> int:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    run()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return peak
+
+
+def consume(tokens):
+    """Percorre os tokens mantendo-os vivos apenas enquanto `tokens` existir."""
+    deque(tokens, maxlen=0)
+    return tokens
+
+
+def report(title: str, modes: dict) -> None:
+    print(Fore.YELLOW + title + Fore.RESET)
+    for name, run in modes.items():
+        print(f"{name:<22} {peak(run) / 2**20:>10.1f} MB")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--size-mb", type=float, default=100)
+    arg_parser.add_argument("--parse-mb", type=float, default=0.05)
+    args = arg_parser.parse_args()
+
+    text = synthetic_script(int(args.size_mb * 2**20))
+    report(
+        f"Pico de memória: tokenização de {args.size_mb:g} MB",
+        {
+            "list[Token]": lambda: consume(list(Tokenizer.iter_tokens(text, grammar))),
+            "TokenArray": lambda: consume(Tokenizer.tokenize(text, grammar)),
+            "iter_tokens (fluxo)": lambda: consume(Tokenizer.iter_tokens(text, grammar)),
+        },
+    )
+    del text
+
+    parser = LL1ParserTable(LL1Table(grammar), grammar.start_symbol)
+    text = synthetic_script(int(args.parse_mb * 2**20))
+    report(
+        f"Pico de memória: tokenização + parsing de {args.parse_mb:g} MB",
+        {
+            "list[Token]": lambda: parser.parse(list(Tokenizer.iter_tokens(text, grammar))),
+            "TokenArray": lambda: parser.parse(Tokenizer.tokenize(text, grammar)),
+            "iter_tokens (fluxo)": lambda: parser.parse(Tokenizer.iter_tokens(text, grammar)),
+        },
+    )
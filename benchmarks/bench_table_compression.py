@@ -0,0 +1,95 @@
+"""
+Benchmark: tamanho, carga e consulta da tabela LL(1) densa, comprimida e em dicionário.
+
+- dicionário: (NonTerminal, Terminal) → Production, como `LL1Table.table`;
+- densa: `LL1Table.cells` (uma linha por não terminal, coluna por terminal);
+- comprimida: `CompressedLL1Table` (deslocamento de linhas com vetor `check`).
+
+Medido para `grammar.py` e para uma gramática sintética com ~500 não terminais
+(ver `bench_grammar_analysis.py`).
+
+Uso: python benchmarks/bench_table_compression.py [--commands 160] [--lookups 200000]
+"""
+
+import argparse
+import marshal
+import random
+import sys
+
+from bench_grammar_analysis import synthetic_grammar
+from colorama import Fore
+from common import best_of
+from grammar import grammar as turtle_grammar
+from table_parser_ll1 import CompressedLL1Table, Grammar, LL1Table
+
+
+def dict_size(table: dict) -> int:
+    """Memória do dicionário e das tuplas-chave (símbolos e produções são compartilhados)."""
+    return sys.getsizeof(table) + sum(sys.getsizeof(key) for key in table)
+
+
+def report(name: str, grammar: Grammar, lookups: int):
+    dense = LL1Table(grammar)
+    compressed = dense.compress()
+    table = dense.table
+    non_terminals = len(grammar.symbols) - grammar.n_terminals - 1
+    print(
+        Fore.YELLOW
+        + f"{name}: {non_terminals} não terminais × {grammar.n_terminals} terminais, "
+        + f"{len(table)} células preenchidas"
+        + Fore.RESET
+    )
+
+    # Serialização: triplas de ids (como o cache em disco) versus os vetores comprimidos
+    triples = marshal.dumps([(lhs, t, p) for (lhs, t), p in LL1Table._build_table(grammar).items()])
+    packed = compressed.to_bytes()
+    print(f"{'representação':<14} {'memória (KB)':>13} {'serializada (KB)':>17} {'carga (ms)':>11}")
+    load_triples = best_of(
+        lambda: {(lhs, t): p for lhs, t, p in marshal.loads(triples)}, number=20
+    )
+    load_packed = best_of(lambda: CompressedLL1Table.from_bytes(grammar, packed), number=20)
+    rows = [
+        ("dicionário", dict_size(table), len(triples), load_triples),
+        ("densa", dense.nbytes, dense.nbytes, None),
+        ("comprimida", compressed.nbytes, len(packed), load_packed),
+    ]
+    for label, memory, serialized, load in rows:
+        load_text = f"{load * 1000:>11.3f}" if load is not None else f"{'-':>11}"
+        print(f"{label:<14} {memory / 1024:>13.1f} {serialized / 1024:>17.1f} {load_text}")
+
+    # Consultas aleatórias entre células preenchidas e vazias
+    rng = random.Random(2025)
+    pairs = [
+        (rng.randrange(grammar.n_terminals, len(grammar.symbols) - 1), rng.randrange(grammar.n_terminals))
+        for _ in range(lookups)
+    ]
+    symbol_pairs = [(grammar.symbols[lhs], grammar.symbols[t]) for lhs, t in pairs]
+    assert all(dense.lookup(*pair) == compressed.lookup(*pair) for pair in pairs)
+
+    offsets, values, check = compressed.lookup_arrays()
+
+    def inline_compressed():
+        for lhs, t in pairs:
+            index = offsets[lhs] + t
+            values[index] if check[index] == lhs else -1
+
+    timings = [
+        ("dicionário", best_of(lambda: [table.get(pair) for pair in symbol_pairs])),
+        ("densa", best_of(lambda: [dense.lookup(lhs, t) for lhs, t in pairs])),
+        ("comprimida", best_of(lambda: [compressed.lookup(lhs, t) for lhs, t in pairs])),
+        ("comprimida*", best_of(inline_compressed)),
+    ]
+    print(f"{'consulta':<14} {'milhões/s':>10}")
+    for label, seconds in timings:
+        print(f"{label:<14} {lookups / seconds / 1e6:>10.2f}")
+    print("* indexação direta dos vetores, como no driver do parser\n")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--commands", type=int, default=160)
+    arg_parser.add_argument("--lookups", type=int, default=200_000)
+    args = arg_parser.parse_args()
+
+    report("grammar.py", turtle_grammar, args.lookups)
+    report(f"sintética ({args.commands} comandos)", Grammar(**synthetic_grammar(args.commands)), args.lookups)
@@ -0,0 +1,88 @@
+"""
+Benchmark: construção da tabela LL(1) (`LL1Table._build_table`) em gramáticas sintéticas.
+
+- anterior: `first_rhs` recalculado para cada produção, reproduzido aqui;
+- atual (frio): inclui o cálculo de `Grammar.suffix_first` (FIRST por produção e por
+  sufixo, frozensets guardados na gramática);
+- atual (quente): os conjuntos já calculados, como para um segundo consumidor
+  (`LL1Table.update`, relatório de conflitos, recuperação de erros).
+FIRST e FOLLOW são calculados antes, fora da medição.
+
+Uso: python benchmarks/bench_table_construction.py [--max-commands 3200]
+"""
+
+import argparse
+import gc
+import time
+
+from bench_grammar_analysis import synthetic_grammar
+from colorama import Fore
+from common import best_of
+from table_parser_ll1 import Grammar, LL1Table
+
+
+def previous_build_table(grammar: Grammar) -> dict:
+    """`LL1Table._build_table` antes dos conjuntos FIRST por produção."""
+    table = dict()
+    ids = grammar.symbol_ids
+
+    def insert(lhs, terminal, index):
+        key = (ids[lhs], ids[terminal])
+        if key in table:
+            raise ValueError(f"Erro: célula '({lhs}, {terminal})' já preenchida")
+        table[key] = index
+
+    for index, prod in enumerate(grammar.productions):
+        lhs, rhs = prod.lhs, prod.rhs
+        first_of_rhs = grammar.first_rhs(rhs)
+        for terminal in first_of_rhs:
+            if terminal != Grammar.EPSILON:
+                insert(lhs, terminal, index)
+        if Grammar.EPSILON in first_of_rhs:
+            for terminal in grammar.follow_sets[lhs]:
+                insert(lhs, terminal, index)
+    return table
+
+
+def analyzed(arguments: dict) -> Grammar:
+    grammar = Grammar(**arguments)
+    grammar.follow_sets
+    return grammar
+
+
+def cold_build(arguments: dict, repeat: int = 5) -> float:
+    """Melhor tempo de `_build_table` em gramáticas novas (conjuntos por produção a calcular)."""
+    best = float("inf")
+    for _ in range(repeat):
+        grammar = analyzed(arguments)
+        start = time.perf_counter()
+        LL1Table._build_table(grammar)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--max-commands", type=int, default=3200)
+    args = arg_parser.parse_args()
+    # Sem coletas do gc no meio das medições (as gramáticas grandes criam muitos objetos)
+    gc.disable()
+
+    print(Fore.YELLOW + "Construção da tabela LL(1) (ms, melhor de 5)" + Fore.RESET)
+    print(
+        f"{'comandos':>9} {'produções':>10} {'anterior':>10} {'frio':>10} {'quente':>10} "
+        f"{'ganho frio':>11} {'ganho quente':>13}"
+    )
+    commands = 100
+    while commands <= args.max_commands:
+        arguments = synthetic_grammar(commands)
+        grammar = analyzed(arguments)
+        assert previous_build_table(grammar) == LL1Table._build_table(grammar)
+        previous = best_of(lambda: previous_build_table(grammar))
+        cold = cold_build(arguments)
+        warm = best_of(lambda: LL1Table._build_table(grammar))
+        print(
+            f"{commands:>9} {len(grammar.productions):>10} {previous * 1000:>10.2f} "
+            f"{cold * 1000:>10.2f} {warm * 1000:>10.2f} {previous / cold:>10.2f}x {previous / warm:>12.2f}x"
+        )
+        commands *= 2
@@ -0,0 +1,69 @@
+"""
+Benchmark (tracemalloc): memória retida pelos tokens de um script com ~1M tokens.
+
+Compara a lista de `Token` original (instâncias comuns, com `__dict__` e um lexema
+recortado por ocorrência) com o `TokenArray` atual, que guarda terminal e
+deslocamentos em arrays e cria `Token`s com `__slots__` apenas quando acessados.
+
+Uso: python benchmarks/bench_token_memory.py [--tokens 1000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from colorama import Fore
+from common import synthetic_script
+from grammar import grammar
+from table_parser_ll1 import Tokenizer
+
+
+class DictToken:
+    """Cópia do `Token` original."""
+
+    def __init__(self, terminal, lexeme):
+        self.terminal = terminal
+        self.lexeme = lexeme
+
+
+def retained(build) -> tuple[int, object]:
+    """Memória (bytes) ainda alocada pelo resultado de `build()`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Cerca de 7,1 caracteres por token no corpo sintético
+    text = synthetic_script(int(args.tokens * 7.1))
+    tokens = Tokenizer.tokenize(text, grammar)
+    spans = [(token.terminal, token.start, token.end) for token in tokens]
+    source_text = tokens.source.text
+    n_tokens = len(tokens)
+    del tokens
+
+    dict_bytes, dict_tokens = retained(
+        lambda: [DictToken(terminal, source_text[start:end]) for terminal, start, end in spans]
+    )
+    del dict_tokens
+    # O TokenArray retém também o texto-fonte compartilhado
+    array_bytes, token_array = retained(lambda: Tokenizer.tokenize(text, grammar))
+    del token_array
+
+    print(Fore.YELLOW + f"Memória retida por {n_tokens} tokens" + Fore.RESET)
+    rows = [
+        ("list[Token] original (__dict__ + lexema)", dict_bytes),
+        ("TokenArray (inclui o texto-fonte)", array_bytes),
+    ]
+    for label, size in rows:
+        print(f"{label:<42} {size / 2**20:>8.1f} MB  {size / n_tokens:>6.1f} B/token")
+    print(Fore.GREEN + f"Redução do TokenArray: {1 - array_bytes / dict_bytes:.0%}" + Fore.RESET)
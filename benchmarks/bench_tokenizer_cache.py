@@ -0,0 +1,54 @@
+"""
+Benchmark: custo por chamada de `Tokenizer.tokenize` no corpus `inputs/entrada*.txt`.
+
+Compara a implementação original (que recompila o regex mestre e reconstrói o
+dicionário de terminais a cada chamada) com a atual, que reaproveita o
+`CompiledLexer` guardado na gramática.
+
+Uso: python benchmarks/bench_tokenizer_cache.py
+"""
+
+import re
+
+from colorama import Fore
+from common import best_of, load_corpus
+from grammar import grammar
+from table_parser_ll1 import Terminal, Token, Tokenizer
+
+
+def tokenize_original(text: str, grammar) -> list[Token]:
+    """Cópia da tokenização original, que recompila tudo a cada chamada."""
+    tokens = []
+    text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
+    token_regex = "|".join(
+        f"(?P<{t.name}>{t.regex})" for t in grammar.terminals if isinstance(t, Terminal)
+    )
+    match_token = re.compile(token_regex).match
+    position = 0
+    terminals = {t.name: t for t in grammar.terminals if isinstance(t, Terminal)}
+    while position < len(text):
+        ws_match = re.match(r"\s+", text[position:])
+        if ws_match:
+            position += len(ws_match.group(0))
+            continue
+        match = match_token(text, position)
+        position = match.end()
+        tokens.append(Token(terminals.get(match.lastgroup), match.group(match.lastgroup)))
+    return tokens
+
+
+if __name__ == "__main__":
+    corpus = load_corpus()
+    Tokenizer.tokenize(corpus[0][1], grammar)  # aquece o léxico compilado
+
+    print(Fore.YELLOW + "Tokenizer.tokenize: custo por chamada (µs)" + Fore.RESET)
+    print(f"{'arquivo':<16} {'tokens':>7} {'original':>10} {'cacheado':>10} {'ganho':>7}")
+    for name, text in corpus:
+        assert tokenize_original(text, grammar) == Tokenizer.tokenize(text, grammar)
+        before = best_of(lambda: tokenize_original(text, grammar), number=200)
+        after = best_of(lambda: Tokenizer.tokenize(text, grammar), number=200)
+        n_tokens = len(Tokenizer.tokenize(text, grammar))
+        print(
+            f"{name:<16} {n_tokens:>7} {before * 1e6:>10.1f} {after * 1e6:>10.1f} "
+            f"{Fore.GREEN}{before / after:>6.1f}x{Fore.RESET}"
+        )
@@ -0,0 +1,72 @@
+"""
+Benchmark: escalabilidade de `Tokenizer.tokenize` com o tamanho da entrada.
+
+A versão original pulava espaços com `re.match(r"\s+", text[position:])`, copiando
+o restante do texto a cada token (O(n²)). A atual casa no próprio texto com
+`pattern.match(text, pos)`; o tempo por KB deve permanecer constante de 1 KB a 50 MB.
+
+Uso: python benchmarks/bench_tokenizer_scaling.py [--max-mb 50]
+"""
+
+import argparse
+import re
+import time
+
+from colorama import Fore
+from common import synthetic_script
+from grammar import grammar
+from table_parser_ll1 import Token, Tokenizer
+
+# A versão com fatiamento é quadrática: acima disso ela levaria minutos
+QUADRATIC_LIMIT = 256 * 1024
+
+
+def tokenize_sliced(text: str, grammar) -> list[Token]:
+    """Laço de varredura original, que fatia `text[position:]` antes de cada token."""
+    tokens = []
+    text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
+    match_token = re.compile(
+        "|".join(f"(?P<{t.name}>{t.regex})" for t in grammar.terminals)
+    ).match
+    terminals = {t.name: t for t in grammar.terminals}
+    position = 0
+    while position < len(text):
+        ws_match = re.match(r"\s+", text[position:])
+        if ws_match:
+            position += len(ws_match.group(0))
+            continue
+        match = match_token(text, position)
+        position = match.end()
+        tokens.append(Token(terminals[match.lastgroup], match.group()))
+    return tokens
+
+
+def measure(fn, text: str) -> float:
+    start = time.perf_counter()
+    fn(text, grammar)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-mb", type=float, default=50)
+    args = parser.parse_args()
+
+    sizes = [1024 * 2**i for i in range(0, 30, 2)]
+    sizes = [size for size in sizes if size <= args.max_mb * 1024 * 1024]
+    if sizes[-1] < args.max_mb * 1024 * 1024:
+        sizes.append(int(args.max_mb * 1024 * 1024))
+
+    print(Fore.YELLOW + "Tokenizer.tokenize: tempo por KB de entrada" + Fore.RESET)
+    print(f"{'tamanho':>10} {'fatiado (µs/KB)':>16} {'atual (µs/KB)':>14}")
+    for size in sizes:
+        text = synthetic_script(size)
+        kb = len(text) / 1024
+        sliced = (
+            f"{measure(tokenize_sliced, text) / kb * 1e6:>16.1f}"
+            if size <= QUADRATIC_LIMIT
+            else f"{'-':>16}"
+        )
+        current = measure(Tokenizer.tokenize, text) / kb * 1e6
+        label = f"{kb / 1024:.1f} MB" if kb >= 1024 else f"{kb:.0f} KB"
+        print(f"{label:>10} {sliced} {Fore.GREEN}{current:>14.1f}{Fore.RESET}")
@@ -0,0 +1,105 @@
+"""
+Benchmark: `TreeNode` (com `__slots__`) versus `anytree.Node` na construção das
+árvores de derivação e das ASTs.
+
+O mesmo driver LL(1) roda duas vezes: com `TreeNode` e com `anytree.Node` no lugar
+dele (como antes). Para scripts sintéticos grandes, mede nós construídos por
+segundo na árvore de derivação e na AST (ações de `ast_actions`; `get_ast_root` é
+recursivo e não chega a esses tamanhos) e a memória por nó da árvore de derivação
+(tracemalloc, incluindo a lista de filhos). Com o anytree, ligar um nó ao pai
+percorre os ancestrais, então o custo cresce com a profundidade da árvore (a lista
+de comandos é recursiva à direita).
+
+Uso: python benchmarks/bench_tree_nodes.py [--sizes 5000 20000 50000]
+"""
+
+import argparse
+import contextlib
+import gc
+import tracemalloc
+
+from anytree import Node
+from colorama import Fore
+from common import best_of, synthetic_script
+import abstract_syntax_tree
+from abstract_syntax_tree import ast_actions
+from grammar import grammar
+import table_parser_ll1
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+
+def anytree_node(name, parent=None, children=None) -> Node:
+    return Node(name, parent=parent, children=children or ())
+
+
+@contextlib.contextmanager
+def anytree_nodes():
+    """Troca `TreeNode` por `anytree.Node` no driver e na construção da AST."""
+    originals = table_parser_ll1.TreeNode, abstract_syntax_tree.TreeNode
+    table_parser_ll1.TreeNode = abstract_syntax_tree.TreeNode = anytree_node
+    try:
+        yield
+    finally:
+        table_parser_ll1.TreeNode, abstract_syntax_tree.TreeNode = originals
+
+
+def allocated(fn) -> int:
+    """Memória (bytes) ainda alocada pelo resultado de `fn`."""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def count_nodes(root) -> int:
+    """Nós da árvore, sem recursão (a árvore de derivação é profunda)."""
+    count, pending = 0, [root]
+    while pending:
+        node = pending.pop()
+        count += 1
+        pending.extend(node.children)
+    return count
+
+
+def measure(tokens) -> tuple[int, int, float, float, float]:
+    """(nós da derivação, nós da AST, segundos de parse, segundos da AST, bytes por nó)."""
+    parse = lambda: parser.parse(tokens)[1]
+    build_ast = lambda: direct.parse(tokens)[1]
+    nodes = count_nodes(parse())
+    return (
+        nodes,
+        count_nodes(build_ast()),
+        best_of(parse, repeat=3),
+        best_of(build_ast, repeat=3),
+        allocated(parse) / nodes,
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 50_000])
+    args = arg_parser.parse_args()
+
+    table = LL1Table(grammar)
+    parser = LL1ParserTable(table, grammar.start_symbol)
+    direct = LL1ParserTable(table, grammar.start_symbol, actions=ast_actions(grammar))
+    print(Fore.YELLOW + "Nós por segundo e bytes por nó, anytree → TreeNode (melhor de 3)" + Fore.RESET)
+    print(
+        f"{'caracteres':>10} {'tokens':>7} {'nós':>8} {'nós/s (derivação)':>26} "
+        f"{'nós AST':>8} {'nós/s (AST)':>26} {'bytes/nó':>14}"
+    )
+    for size in args.sizes:
+        tokens = Tokenizer.tokenize(synthetic_script(size), grammar)
+        nodes, ast_nodes, parse, ast, memory = measure(tokens)
+        with anytree_nodes():
+            old_nodes, old_ast_nodes, old_parse, old_ast, old_memory = measure(tokens)
+        assert (old_nodes, old_ast_nodes) == (nodes, ast_nodes)
+        print(
+            f"{size:>10} {len(tokens):>7} {nodes:>8} "
+            f"{nodes / old_parse:>12,.0f} → {nodes / parse:<11,.0f} {ast_nodes:>8} "
+            f"{ast_nodes / old_ast:>12,.0f} → {ast_nodes / ast:<11,.0f} "
+            f"{old_memory:>5.0f} → {memory:<6.0f}"
+        )
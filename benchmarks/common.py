@@ -0,0 +1,50 @@
+"""Utilitários compartilhados pelos benchmarks do compilador TurtleScript."""
+
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+INPUTS_DIR = os.path.join(ROOT, "inputs")
+
+# Os módulos do compilador usam imports "planos" (ex: `from grammar import grammar`)
+sys.path.insert(0, os.path.join(ROOT, "src", "turtle_script"))
+
+
+def load_corpus() -> list[tuple[str, str]]:
+    """Retorna os pares (nome do arquivo, conteúdo) de `inputs/entrada*.txt`."""
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(INPUTS_DIR, "entrada*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            corpus.append((os.path.basename(path), f.read()))
+    return corpus
+
+
+def best_of(fn, number: int = 1, repeat: int = 5) -> float:
+    """Executa `fn` `number` vezes por rodada e retorna o melhor tempo médio por chamada (s)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+SCRIPT_BODY = """\
+    // Desenha e aumenta o lado
+    avancar lado;
+    girar_direita 90;
+    lado = lado + 5;
+    se lado > 100 entao
+        definir_cor "cyan";
+    fim_se;
+"""
+
+
+def synthetic_script(size: int, body: str = SCRIPT_BODY) -> str:
+    """Gera um programa TurtleScript válido com aproximadamente `size` caracteres."""
+    header, footer = "inicio\n    var inteiro : lado;\n", "fim\n"
+    repeat = max(1, (size - len(header) - len(footer)) // len(body))
+    return header + body * repeat + footer
@@ -1,11 +1,12 @@
 from colorama import Fore
-from anytree import RenderTree, Node
+from anytree import RenderTree
+from collections.abc import Callable
 from itertools import chain
 from grammar import *
-from table_parser_ll1 import LL1Table, LL1ParserTable, Token, Tokenizer
+from table_parser_ll1 import LL1Table, LL1ParserTable, Production, Token, Tokenizer, TreeNode
 
 
-def is_empty(node: Node) -> bool:
+def is_empty(node: TreeNode) -> bool:
     """Verifica se um nó é vazio (não possui filhos ou é epsilon)."""
     return len(node.children) == 0 or node.children[0] == Grammar.EPSILON
 
@@ -23,12 +24,18 @@ def flatten(items):
     return [item for item in items if item is not None]
 
 
-def get_ast_root(derivation_tree_root: Node) -> Node:
-    """Obtém a árvore sintática abstrata (AST) a partir da raiz da árvore de derivação."""
+def get_ast_root(derivation_tree_root: TreeNode, inlined: Grammar = None) -> TreeNode:
+    """
+    Obtém a árvore sintática abstrata (AST) a partir da raiz da árvore de derivação.
+    :param inlined: gramática de `Grammar.inline_units` usada no parse; a árvore é
+        expandida de volta para a gramática original antes da conversão
+    """
+    if inlined is not None:
+        derivation_tree_root = inlined.expand(derivation_tree_root)
     return f_program(derivation_tree_root)
 
 
-def f_program(root: Node) -> Node:
+def f_program(root: TreeNode) -> TreeNode:
     """Processa o programa, que é o nó raiz da árvore de derivação."""
     _, decs, cmds, _ = root.children
     decs, cmds = f_declarations(decs), f_commands(cmds)
@@ -37,10 +44,10 @@ def f_program(root: Node) -> Node:
         children.append(decs)
     if cmds:
         children.append(cmds)
-    return Node(name=root.name, children=flatten(children))
+    return TreeNode(name=root.name, children=flatten(children))
 
 
-def f_declarations(root: Node) -> list:
+def f_declarations(root: TreeNode) -> list:
     """Processa as declarações de variáveis no programa."""
     if is_empty(root):
         return None
@@ -51,32 +58,32 @@ def f_declarations(root: Node) -> list:
     return [var_dec] + [dec]
 
 
-def f_variable_declaration(root: Node) -> Node:
+def f_variable_declaration(root: TreeNode) -> TreeNode:
     """Processa a declaração de uma variável."""
     _, type_node, assign_variable, _ = root.children
     type_node = f_type(type_node)
     op_att, children_att = f_assign_variable(assign_variable)
-    return Node(op_att.name, children=[type_node] + children_att)
+    return TreeNode(op_att.name, children=[type_node] + children_att)
 
 
-def f_type(root: Node) -> Node:
+def f_type(root: TreeNode) -> TreeNode:
     """Processa o tipo de uma variável."""
     kw = root.children[0]
-    return Node(kw.name)
+    return TreeNode(kw.name)
 
 
-def f_assign_variable(root: Node) -> Node:
+def f_assign_variable(root: TreeNode) -> TreeNode:
     """Processa a atribuição de variáveis."""
     op_var_def, ids, ids_assignment = root.children
     ids, ids_assignment = f_identifiers(ids), f_identifiers_assignment(ids_assignment)
     children = [ids]
     if len(ids_assignment) != 0:
-        children.append(Node(name=op_atribuicao))
+        children.append(TreeNode(name=op_atribuicao))
     children.append(ids_assignment)
     return op_var_def, flatten(children)
 
 
-def f_identifiers(root: Node) -> list:
+def f_identifiers(root: TreeNode) -> list:
     """Retorna lista de identificadores."""
     id, idR = root.children
     idR = f_identifiersR(idR)
@@ -85,7 +92,7 @@ def f_identifiers(root: Node) -> list:
     return [id] + idR
 
 
-def f_identifiersR(root: Node) -> list:
+def f_identifiersR(root: TreeNode) -> list:
     """Retorna lista de identificadores adicionais."""
     if is_empty(root):
         return []
@@ -96,7 +103,7 @@ def f_identifiersR(root: Node) -> list:
     return [id] + idR
 
 
-def f_identifiers_assignment(root: Node) -> list:
+def f_identifiers_assignment(root: TreeNode) -> list:
     """Processa a atribuição de identificadores."""
     if is_empty(root):
         return []
@@ -107,7 +114,7 @@ def f_identifiers_assignment(root: Node) -> list:
     return [expr] + iaR
 
 
-def f_identifiers_assignmentR(root: Node) -> Node:
+def f_identifiers_assignmentR(root: TreeNode) -> TreeNode:
     """Processa a atribuição de identificadores adicionais."""
     if is_empty(root):
         return []
@@ -118,7 +125,7 @@ def f_identifiers_assignmentR(root: Node) -> Node:
     return [expr] + iaR
 
 
-def f_commands(root: Node) -> list:
+def f_commands(root: TreeNode) -> list:
     """Processa os comandos do programa."""
     if is_empty(root):
         return []
@@ -129,7 +136,7 @@ def f_commands(root: Node) -> list:
     return [cmd] + cmds
 
 
-def f_command(root: Node) -> Node:
+def f_command(root: TreeNode) -> TreeNode:
     """Processa um comando, despachando para a função apropriada conforme o tipo."""
     child = root.children[0]
     dispatch_map = {
@@ -146,69 +153,72 @@ def f_command(root: Node) -> Node:
     return child
 
 
-def f_assign_value(root: Node) -> Node:
+def f_assign_value(root: TreeNode) -> TreeNode:
     """Processa o comando de atribuição de valor."""
     id, op, expr, _ = root.children
     expr = f_expr(expr)
-    return Node(op.name, children=[id, expr])
+    return TreeNode(op.name, children=[id, expr])
 
 
-def f_conditional(root: Node) -> Node:
+def f_conditional(root: TreeNode) -> TreeNode:
     """Processa o comando condicional (SE)."""
     if_, expr, _, cmds, else_, _, _ = root.children
     expr, cmds, else_ = f_expr(expr), f_commands(cmds), f_else(else_)
     if else_:
-        return Node(if_.name, children=flatten([expr, cmds, else_]))
-    return Node(if_.name, children=flatten([expr, cmds]))
+        return TreeNode(if_.name, children=flatten([expr, cmds, else_]))
+    return TreeNode(if_.name, children=flatten([expr, cmds]))
 
 
-def f_else(root: Node) -> Node:
+def f_else(root: TreeNode) -> TreeNode:
     """Processa o comando ELSE (SENÃO) do comando condicional (SE)."""
     if is_empty(root):
         return None
     else_, cmds = root.children
     cmds = f_commands(cmds)
-    return Node(else_.name, children=flatten(cmds))
+    return TreeNode(else_.name, children=flatten(cmds))
 
 
-def f_loop(root: Node) -> Node:
+def f_loop(root: TreeNode) -> TreeNode:
     """Processa um comando de loop (REPETIR ou ENQUANTO)."""
     child = root.children[0]
     _op, expr, _, cmds, _, _ = child.children
-    return Node(_op.name, children=flatten([f_expr(expr), f_commands(cmds)]))
+    return TreeNode(_op.name, children=flatten([f_expr(expr), f_commands(cmds)]))
 
 
-def f_generic_command(root: Node) -> Node:
+def f_generic_command(root: TreeNode) -> TreeNode:
     """Processa um comando qualquer que seja de:
     movimento, controle de caneta ou controle de tela.
     """
     if len(root.children) == 2:
         cmd, _ = root.children
-        return Node(cmd.name)
+        return TreeNode(cmd.name)
     if len(root.children) == 3:
         cmd, expr, _ = root.children
-        return Node(cmd.name, children=[f_expr(expr)])
+        return TreeNode(cmd.name, children=[f_expr(expr)])
     cmd, expr1, expr2, _ = root.children
-    return Node(cmd.name, children=[f_expr(expr1), f_expr(expr2)])
+    return TreeNode(cmd.name, children=[f_expr(expr1), f_expr(expr2)])
 
 
-def f_expr(root: Node) -> Node:
+def f_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão, despachando para a função apropriada."""
     or_expr = root.children[0]
+    if isinstance(or_expr.name, Token):
+        # AST já construída pelo `ExpressionParser`
+        return or_expr
     return f_or_expr(or_expr)
 
 
-def f_or_expr(root: Node) -> Node:
+def f_or_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão lógica OR."""
     and_expr, or_expr_tail = root.children
     and_expr, or_expr_tail = f_and_expr(and_expr), f_or_expr_tail(or_expr_tail)
     if or_expr_tail is None:
         return and_expr
     op, right = or_expr_tail
-    return Node(op.name, children=[and_expr, right])
+    return TreeNode(op.name, children=[and_expr, right])
 
 
-def f_or_expr_tail(root: Node) -> tuple[Node, Node] | None:
+def f_or_expr_tail(root: TreeNode) -> tuple[TreeNode, TreeNode] | None:
     """Processa a parte final de uma expressão lógica OR."""
     if is_empty(root):
         return None
@@ -217,20 +227,20 @@ def f_or_expr_tail(root: Node) -> tuple[Node, Node] | None:
     if or_expr_tail is None:
         return op1, and_expr
     op2, right = or_expr_tail
-    return op1, Node(op2.name, children=[and_expr, right])
+    return op1, TreeNode(op2.name, children=[and_expr, right])
 
 
-def f_and_expr(root: Node) -> Node:
+def f_and_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão lógica AND."""
     not_expr, and_expr_tail = root.children
     not_expr, and_expr_tail = f_not_expr(not_expr), f_and_expr_tail(and_expr_tail)
     if and_expr_tail is None:
         return not_expr
     op, right = and_expr_tail
-    return Node(op.name, children=[not_expr, right])
+    return TreeNode(op.name, children=[not_expr, right])
 
 
-def f_and_expr_tail(root: Node) -> tuple[Node, Node] | None:
+def f_and_expr_tail(root: TreeNode) -> tuple[TreeNode, TreeNode] | None:
     """Processa a parte final de uma expressão lógica AND."""
     if is_empty(root):
         return None
@@ -239,28 +249,28 @@ def f_and_expr_tail(root: Node) -> tuple[Node, Node] | None:
     if and_expr_tail is None:
         return op, not_expr
     op2, right = and_expr_tail
-    return op, Node(op2.name, children=[not_expr, right])
+    return op, TreeNode(op2.name, children=[not_expr, right])
 
 
-def f_not_expr(root: Node) -> Node:
+def f_not_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão lógica NOT."""
     if len(root.children) == 1:
         return f_add_expr(root.children[0])
     op, not_expr = root.children
-    return Node(op.name, children=[f_not_expr(not_expr)])
+    return TreeNode(op.name, children=[f_not_expr(not_expr)])
 
 
-def f_add_expr(root: Node) -> Node:
+def f_add_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão de adição."""
     mul_expr, add_expr_tail = root.children
     mul_expr, add_expr_tail = f_mul_expr(mul_expr), f_add_expr_tail(add_expr_tail)
     if add_expr_tail is None:
         return mul_expr
     op, right = add_expr_tail
-    return Node(op.name, children=[mul_expr, right])
+    return TreeNode(op.name, children=[mul_expr, right])
 
 
-def f_add_expr_tail(root: Node) -> tuple[Node, Node] | None:
+def f_add_expr_tail(root: TreeNode) -> tuple[TreeNode, TreeNode] | None:
     """Processa a parte final de uma expressão de adição."""
     if is_empty(root):
         return None
@@ -269,20 +279,20 @@ def f_add_expr_tail(root: Node) -> tuple[Node, Node] | None:
     if add_expr_tail is None:
         return op, mul_expr
     op2, right = add_expr_tail
-    return op, Node(op2.name, children=[mul_expr, right])
+    return op, TreeNode(op2.name, children=[mul_expr, right])
 
 
-def f_mul_expr(root: Node) -> Node:
+def f_mul_expr(root: TreeNode) -> TreeNode:
     """Processa uma expressão de multiplicação."""
     primary, mul_expr_tail = root.children
     primary, mul_expr_tail = f_primary(primary), f_mul_expr_tail(mul_expr_tail)
     if mul_expr_tail is None:
         return primary
     op, right = mul_expr_tail
-    return Node(op.name, children=[primary, right])
+    return TreeNode(op.name, children=[primary, right])
 
 
-def f_mul_expr_tail(root: Node) -> tuple[Node, Node] | None:
+def f_mul_expr_tail(root: TreeNode) -> tuple[TreeNode, TreeNode] | None:
     """Processa a parte final de uma expressão de multiplicação."""
     if is_empty(root):
         return None
@@ -291,18 +301,196 @@ def f_mul_expr_tail(root: Node) -> tuple[Node, Node] | None:
     if mul_expr_tail is None:
         return op, primary
     op2, right = mul_expr_tail
-    return op, Node(op2.name, children=[primary, right])
+    return op, TreeNode(op2.name, children=[primary, right])
 
 
-def f_primary(root: Node) -> Node:
+def f_primary(root: TreeNode) -> TreeNode:
     """Processa um elemento primário de uma expressão."""
     if len(root.children) == 1:
-        return Node(name=root.children[0].name)
+        return TreeNode(name=root.children[0].name)
     _, expr, _ = root.children
     return f_expr(expr)
 
 
+# --- AÇÕES SEMÂNTICAS ---
+# Constroem a mesma AST que `get_ast_root` durante o parsing, sem a árvore de
+# derivação: cada ação recebe os valores do lado direito da produção (o `Token` de
+# cada terminal, o valor já reduzido de cada não terminal) e, nas produções ε,
+# nenhum argumento. As caudas das expressões retornam (operador, operando direito).
+
+
+def reduce_program(_, decs: list | None, cmds: list, __) -> TreeNode:
+    """Programa: nó raiz com as declarações e os comandos."""
+    children = []
+    if decs:
+        children.append(decs)
+    if cmds:
+        children.append(cmds)
+    return TreeNode(name=Program, children=flatten(children))
+
+
+def reduce_declarations(var_dec: TreeNode = None, decs: list | None = None) -> list | None:
+    """Declarações de variáveis (None se não houver nenhuma)."""
+    if var_dec is None:
+        return None
+    return [var_dec] + decs if decs else [var_dec]
+
+
+def reduce_variable_declaration(_, type_node: TreeNode, assign_variable: tuple, __) -> TreeNode:
+    """Declaração de uma variável."""
+    op_att, children_att = assign_variable
+    return TreeNode(op_att, children=[type_node] + children_att)
+
+
+def reduce_assign_variable(op_var_def: Token, ids: list, ids_assignment: list) -> tuple[Token, list]:
+    """Atribuição de variáveis: o operador ':' e os identificadores e valores."""
+    children = [ids]
+    if len(ids_assignment) != 0:
+        children.append(TreeNode(name=op_atribuicao))
+    children.append(ids_assignment)
+    return op_var_def, flatten(children)
+
+
+def reduce_identifiers(*values) -> list:
+    """Identificadores (Identifiers e IdentifiersR): folhas dos tokens `identificador`."""
+    if not values:
+        return []
+    *_, id, idR = values
+    return [TreeNode(id)] + idR
+
+
+def reduce_identifiers_assignment(*values) -> list:
+    """Valores atribuídos (IdentifiersAssignment e IdentifiersAssignmentR)."""
+    if not values:
+        return []
+    _, expr, iaR = values
+    return [expr] + iaR
+
+
+def reduce_type(kw: Token) -> TreeNode:
+    """Tipo de uma variável."""
+    return TreeNode(kw)
+
+
+def reduce_commands(cmd: TreeNode = None, cmds: list = None) -> list:
+    """Comandos do programa."""
+    if cmd is None:
+        return []
+    return [cmd] + cmds
+
+
+def reduce_single(value):
+    """Produções unitárias (Command, Loop, Expr...): repassa o valor do filho."""
+    return value
+
+
+def reduce_assign_value(id: Token, op: Token, expr: TreeNode, _) -> TreeNode:
+    """Comando de atribuição de valor."""
+    return TreeNode(op, children=[TreeNode(id), expr])
+
+
+def reduce_conditional(if_: Token, expr: TreeNode, _, cmds: list, else_: TreeNode | None, __, ___) -> TreeNode:
+    """Comando condicional (SE)."""
+    if else_:
+        return TreeNode(if_, children=flatten([expr, cmds, else_]))
+    return TreeNode(if_, children=flatten([expr, cmds]))
+
+
+def reduce_else(else_: Token = None, cmds: list = None) -> TreeNode | None:
+    """Bloco SENÃO do comando condicional (None se não houver)."""
+    if else_ is None:
+        return None
+    return TreeNode(else_, children=flatten(cmds))
+
+
+def reduce_loop(op: Token, expr: TreeNode, _, cmds: list, __, ___) -> TreeNode:
+    """Comandos de loop (REPETIR e ENQUANTO)."""
+    return TreeNode(op, children=flatten([expr, cmds]))
+
+
+def reduce_generic_command(cmd: Token, *values) -> TreeNode:
+    """Comandos de movimento, controle de caneta e controle de tela."""
+    return TreeNode(cmd, children=list(values[:-1]))
+
+
+def reduce_binary(left: TreeNode, tail: tuple[Token, TreeNode] | None) -> TreeNode:
+    """Nível de uma expressão binária (OrExpr, AndExpr, AddExpr, MulExpr)."""
+    if tail is None:
+        return left
+    op, right = tail
+    return TreeNode(op, children=[left, right])
+
+
+def reduce_binary_tail(*values) -> tuple[Token, TreeNode] | None:
+    """Cauda de um nível binário: (operador, operando direito), à direita."""
+    if not values:
+        return None
+    op, operand, tail = values
+    return op, reduce_binary(operand, tail)
+
+
+def reduce_not_expr(*values) -> TreeNode:
+    """Negação lógica (NOT) ou o valor de AddExpr."""
+    if len(values) == 1:
+        return values[0]
+    op, not_expr = values
+    return TreeNode(op, children=[not_expr])
+
+
+def reduce_primary(*values) -> TreeNode:
+    """Elemento primário: folha do token ou a expressão entre parênteses."""
+    if len(values) == 1:
+        return TreeNode(values[0])
+    return values[1]
+
+
+AST_ACTIONS = {
+    Program: reduce_program,
+    Declarations: reduce_declarations,
+    VariableDeclaration: reduce_variable_declaration,
+    AssignVariable: reduce_assign_variable,
+    Identifiers: reduce_identifiers,
+    IdentifiersR: reduce_identifiers,
+    IdentifiersAssignment: reduce_identifiers_assignment,
+    IdentifiersAssignmentR: reduce_identifiers_assignment,
+    Type: reduce_type,
+    Commands: reduce_commands,
+    Command: reduce_single,
+    AssignValue: reduce_assign_value,
+    Conditional: reduce_conditional,
+    Else: reduce_else,
+    Loop: reduce_single,
+    Repeat: reduce_loop,
+    While: reduce_loop,
+    Movement: reduce_generic_command,
+    PenControl: reduce_generic_command,
+    ScreenControl: reduce_generic_command,
+    Expr: reduce_single,
+    OrExpr: reduce_binary,
+    OrExprTail: reduce_binary_tail,
+    AndExpr: reduce_binary,
+    AndExprTail: reduce_binary_tail,
+    NotExpr: reduce_not_expr,
+    AddExpr: reduce_binary,
+    AddExprTail: reduce_binary_tail,
+    MulExpr: reduce_binary,
+    MulExprTail: reduce_binary_tail,
+    Primary: reduce_primary,
+}
+
+
+def ast_actions(grammar: Grammar) -> dict[Production, Callable]:
+    """
+    Ações semânticas que constroem a AST durante o parsing, para `LL1ParserTable`
+    e `LALR1Parser` (parâmetro `actions`), indexadas pelas produções de `grammar`.
+    """
+    return {production: AST_ACTIONS[production.lhs] for production in grammar.productions}
+
+
 if __name__ == "__main__":
+    # A gramática é construída sob demanda e não vem com o `import *`
+    from grammar import grammar
+
     script_samples = []
     # INPUT 1
     script_samples.append(
@@ -388,7 +576,7 @@ if __name__ == "__main__":
             print(Fore.GREEN + "Análise sintática bem-sucedida!" + Fore.RESET)
         print("AST:")
         ast_root = get_ast_root(derivation_tree_root)
-        for pre, fill, node in RenderTree(ast_root):
+        for pre, fill, node in RenderTree(ast_root.to_anytree()):
             print(
                 f"{pre}"
                 + {True: Fore.BLUE, False: Fore.BLACK}[isinstance(node.name, Token)]
@@ -1,5 +1,4 @@
-from anytree import Node
-from table_parser_ll1 import Token
+from table_parser_ll1 import Token, TreeNode
 
 
 class Generator:
@@ -82,7 +81,7 @@ class Generator:
         """Registra uma nova operação unária."""
         self.unary_operations[token_name] = operator
 
-    def generate(self, ast: Node, title='Turtle Script') -> str:
+    def generate(self, ast: TreeNode, title='Turtle Script') -> str:
         """Gera código Python a partir da AST."""
         self.python_code = []
         self.variables = {}
@@ -105,7 +104,7 @@ class Generator:
 
         return "\n".join(self.python_code)
     
-    def _process_set_speed(self, node: Node):
+    def _process_set_speed(self, node: TreeNode):
         """Processa comando definir_velocidade."""
         if len(node.children) > 0:
             speed = self._process_node(node.children[0])
@@ -113,7 +112,7 @@ class Generator:
         else:
             self._add_line("t.speed(1)")  # velocidade padrão
 
-    def _process_draw_circle(self, node: Node):
+    def _process_draw_circle(self, node: TreeNode):
         """Processa comando desenhar_circulo."""
         if len(node.children) > 0:
             radius = self._process_node(node.children[0])
@@ -129,13 +128,13 @@ class Generator:
             indent = "    " * self.indentation_level
             self.python_code.append(indent + line)
 
-    def _get_node_name(self, node: Node) -> str:
+    def _get_node_name(self, node: TreeNode) -> str:
         """Obtém o nome correto de um nó (lexeme se for Token, name caso contrário)."""
         if isinstance(node.name, Token):
             return node.name.lexeme
         return str(node.name)
 
-    def _process_node(self, node: Node):
+    def _process_node(self, node: TreeNode):
         """Processa um nó da AST recursivamente."""
         if isinstance(node.name, Token):
             # Verifica se é um token de comando que precisa ser processado especialmente
@@ -195,14 +194,14 @@ class Generator:
         else:
             return lexeme
 
-    def _process_program(self, node: Node):
+    def _process_program(self, node: TreeNode):
         """Processa o nó do programa principal."""
         for child in node.children:
             result = self._process_node(child)
             # Se o resultado não é None e não é uma string vazia, pode ser que precise ser processado
             # como um comando no nível do programa
 
-    def _process_declaration(self, node: Node):
+    def _process_declaration(self, node: TreeNode):
         """Processa uma declaração de variável (nó ':')."""
         # Estrutura: : -> tipo -> variáveis...
         if len(node.children) >= 2:
@@ -247,14 +246,14 @@ class Generator:
                         self._add_line(f"{variables[j]} = {value}")
                         j += 1
 
-    def _process_assignment(self, node: Node):
+    def _process_assignment(self, node: TreeNode):
         """Processa uma atribuição de variável (nó '=')."""
         if len(node.children) >= 2:
             var_name = self._process_node(node.children[0])
             expr_value = self._process_node(node.children[1])
             self._add_line(f"{var_name} = {expr_value}")
 
-    def _process_conditional(self, node: Node):
+    def _process_conditional(self, node: TreeNode):
         """Processa um comando condicional ('se')."""
         if len(node.children) >= 2:
             condition = self._process_node(node.children[0])
@@ -274,7 +273,7 @@ class Generator:
 
             self.indentation_level -= 1
 
-    def _process_else(self, node: Node):
+    def _process_else(self, node: TreeNode):
         """Processa o bloco senão."""
         self._add_line("else:")
         self.indentation_level += 1
@@ -284,7 +283,7 @@ class Generator:
 
         self.indentation_level -= 1
 
-    def _process_repeat(self, node: Node):
+    def _process_repeat(self, node: TreeNode):
         """Processa um loop repita."""
         if len(node.children) >= 1:
             times = self._process_node(node.children[0])
@@ -297,7 +296,7 @@ class Generator:
 
             self.indentation_level -= 1
 
-    def _process_while(self, node: Node):
+    def _process_while(self, node: TreeNode):
         """Processa um loop enquanto."""
         if len(node.children) >= 1:
             condition = self._process_node(node.children[0])
@@ -310,7 +309,7 @@ class Generator:
 
             self.indentation_level -= 1
 
-    def _process_forward(self, node: Node):
+    def _process_forward(self, node: TreeNode):
         """Processa comando avancar."""
         if len(node.children) > 0:
             distance = self._process_node(node.children[0])
@@ -318,7 +317,7 @@ class Generator:
         else:
             self._add_line("t.forward(10)")  # valor padrão
 
-    def _process_backward(self, node: Node):
+    def _process_backward(self, node: TreeNode):
         """Processa comando recuar."""
         if len(node.children) > 0:
             distance = self._process_node(node.children[0])
@@ -326,7 +325,7 @@ class Generator:
         else:
             self._add_line("t.backward(10)")
 
-    def _process_turn_right(self, node: Node):
+    def _process_turn_right(self, node: TreeNode):
         """Processa comando girar_direita."""
         if len(node.children) > 0:
             angle = self._process_node(node.children[0])
@@ -334,7 +333,7 @@ class Generator:
         else:
             self._add_line("t.right(90)")
 
-    def _process_turn_left(self, node: Node):
+    def _process_turn_left(self, node: TreeNode):
         """Processa comando girar_esquerda."""
         if len(node.children) > 0:
             angle = self._process_node(node.children[0])
@@ -342,44 +341,44 @@ class Generator:
         else:
             self._add_line("t.left(90)")
 
-    def _process_goto(self, node: Node):
+    def _process_goto(self, node: TreeNode):
         """Processa comando ir_para."""
         if len(node.children) >= 2:
             x = self._process_node(node.children[0])
             y = self._process_node(node.children[1])
             self._add_line(f"t.goto({x}, {y})")
 
-    def _process_pen_up(self, node: Node):
+    def _process_pen_up(self, node: TreeNode):
         """Processa comando levantar_caneta."""
         self._add_line("t.penup()")
 
-    def _process_pen_down(self, node: Node):
+    def _process_pen_down(self, node: TreeNode):
         """Processa comando abaixar_caneta."""
         self._add_line("t.pendown()")
 
-    def _process_set_color(self, node: Node):
+    def _process_set_color(self, node: TreeNode):
         """Processa comando definir_cor."""
         if len(node.children) > 0:
             color = self._process_node(node.children[0])
             self._add_line(f"t.color({color})")
 
-    def _process_set_width(self, node: Node):
+    def _process_set_width(self, node: TreeNode):
         """Processa comando definir_espessura."""
         if len(node.children) > 0:
             width = self._process_node(node.children[0])
             self._add_line(f"t.width({width})")
 
-    def _process_clear(self, node: Node):
+    def _process_clear(self, node: TreeNode):
         """Processa comando limpar_tela."""
         self._add_line("t.clear()")
 
-    def _process_bg_color(self, node: Node):
+    def _process_bg_color(self, node: TreeNode):
         """Processa comando cor_de_fundo."""
         if len(node.children) > 0:
             color = self._process_node(node.children[0])
             self._add_line(f"screen.bgcolor({color})")
 
-    def _process_binary_operation(self, node: Node, operator: str):
+    def _process_binary_operation(self, node: TreeNode, operator: str):
         """Processa operações binárias."""
         if len(node.children) >= 2:
             left = self._process_node(node.children[0])
@@ -387,7 +386,7 @@ class Generator:
             return f"({left} {operator} {right})"
         return ""
 
-    def _process_logical_operation(self, node: Node, operator: str):
+    def _process_logical_operation(self, node: TreeNode, operator: str):
         """Processa operações lógicas."""
         if len(node.children) >= 2:
             left = self._process_node(node.children[0])
@@ -395,14 +394,14 @@ class Generator:
             return f"({left} {operator} {right})"
         return ""
 
-    def _process_unary_operation(self, node: Node, operator: str):
+    def _process_unary_operation(self, node: TreeNode, operator: str):
         """Processa operações unárias."""
         if len(node.children) >= 1:
             operand = self._process_node(node.children[0])
             return f"{operator} {operand}"
         return ""
 
-    def _process_generic_node(self, node: Node):
+    def _process_generic_node(self, node: TreeNode):
         """Processamento genérico para nós não específicos."""
         if not node.children:
             return str(node.name) if hasattr(node, "name") else ""
@@ -1,4 +1,4 @@
-from table_parser_ll1 import Terminal, NonTerminal, Grammar
+from table_parser_ll1 import Terminal, NonTerminal, Grammar, GrammarCache, ExpressionParser
 
 # --- TERMINAIS DA GRAMATICA ---
 
@@ -293,10 +293,73 @@ productions = [
     Primary >> [logico],
 ]
 
+# Terminais de sincronização da recuperação de erros (`LL1ParserTable.parse` com
+# `errors`): os finais de comando e de bloco
+synchronizing = [ponto_virgula, kw_fim_se, kw_fim_repita, kw_fim_enquanto, kw_fim_bloco]
 
-grammar = Grammar(
-    start_symbol=Program,
-    terminals=terminals,
-    non_terminals=non_terminals,
-    productions=productions,
-)
+
+def _build_grammar() -> Grammar:
+    return Grammar(
+        start_symbol=Program,
+        terminals=terminals,
+        non_terminals=non_terminals,
+        productions=productions,
+        # FIRST, FOLLOW e tabela LL(1) só são reaproveitados entre execuções se
+        # $TURTLE_SCRIPT_CACHE aponta um diretório: nesta gramática o ganho fica no
+        # ruído da inicialização (ver benchmarks/bench_startup.py)
+        cache_dir=GrammarCache.default_directory(),
+    )
+
+
+def _build_expression_parser() -> ExpressionParser:
+    # Precedências das expressões (de Expr a Primary), para o parser de precedência
+    return ExpressionParser(
+        _grammar(),
+        Expr,
+        infix={
+            op_ou: 1,
+            op_e: 2,
+            **dict.fromkeys(
+                [
+                    op_mais,
+                    op_menos,
+                    op_igualdade,
+                    op_diferente,
+                    op_menor_ou_igual,
+                    op_maior_ou_igual,
+                    op_menor_que,
+                    op_maior_que,
+                ],
+                4,
+            ),
+            **dict.fromkeys([op_multiplicacao, op_div, op_modulo], 5),
+        },
+        prefix={op_nao: 3},
+        atoms=[inteiro, identificador, real, texto, logico],
+        groups={abre_parenteses: fecha_parenteses},
+    )
+
+
+_LAZY = {"grammar": _build_grammar, "expression_parser": _build_expression_parser}
+
+
+def _lazy(name: str):
+    """Constrói o objeto `name` de `_LAZY` no primeiro acesso e o guarda no módulo."""
+    if name not in globals():
+        globals()[name] = _LAZY[name]()
+    return globals()[name]
+
+
+def _grammar() -> Grammar:
+    """A gramática da linguagem, construída uma única vez."""
+    return _lazy("grammar")
+
+
+def __getattr__(name: str):
+    """
+    `grammar` e `expression_parser` são construídos no primeiro acesso (e guardados no
+    módulo): quem importa apenas os símbolos não paga pela construção da gramática.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy(name)
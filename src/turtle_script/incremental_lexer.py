@@ -0,0 +1,91 @@
+"""
+Retokenização incremental de fontes editadas.
+
+Dada a `TokenArray` de uma fonte e uma edição (deslocamento, tamanho removido,
+texto inserido), `retokenize` varre novamente apenas a região afetada: a
+varredura recomeça no token anterior ao primeiro token que toca a edição (que
+cobre o lookahead dos terminais, como `\\b` e `\\d+\\.\\d+`) e para assim que o
+fluxo de tokens se ressincroniza com o antigo. O restante é copiado da
+tokenização anterior, com os deslocamentos ajustados.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import NamedTuple
+
+from table_parser_ll1 import CompiledLexer, Grammar, Source, TokenArray, Tokenizer
+
+
+class TokenChange(NamedTuple):
+    """Os tokens antigos [start, old_end) foram substituídos pelos novos [start, new_end)."""
+
+    start: int
+    old_end: int
+    new_end: int
+
+
+def _extend(target: array, values: array, delta: int = 0):
+    """Acrescenta `values` a `target`, somando `delta` a cada valor."""
+    if delta:
+        values = map(delta.__add__, values)
+    elif values.typecode != target.typecode:
+        values = values.tolist()
+    target.extend(values)
+
+
+def retokenize(
+    tokens: TokenArray, grammar: Grammar, offset: int, deleted: int, inserted: str
+) -> tuple[TokenArray, TokenChange]:
+    """
+    Aplica uma edição à fonte de `tokens` e retokeniza apenas o trecho afetado.
+    Retorna a nova `TokenArray` (sobre a fonte editada) e o intervalo de tokens alterado.
+    :param offset: posição da edição na fonte atual
+    :param deleted: quantidade de caracteres (ou bytes, em fontes bytes) removidos em `offset`
+    :param inserted: texto inserido em `offset`
+    """
+    source = tokens.source
+    text = source.text
+    lexer = CompiledLexer.of(grammar)
+    if not isinstance(text, str):
+        lexer = lexer.encoded()
+        inserted = inserted.encode(source.encoding)
+    if not 0 <= offset <= offset + deleted <= len(text):
+        raise ValueError(f"Edição fora dos limites da fonte: ({offset}, {deleted})")
+
+    new_source = Source(text[:offset] + inserted + text[offset + deleted :], source.encoding)
+    delta = len(inserted) - deleted
+    edit_end = offset + len(inserted)  # fim da edição na nova fonte
+    kinds, starts, ends = tokens.kinds, tokens.starts, tokens.ends
+
+    # Recomeça no token anterior ao primeiro que termina em `offset` ou depois
+    first = bisect_left(ends, offset) - 1
+    if first < 0:
+        first, position = 0, 0
+    else:
+        position = starts[first]
+
+    result = TokenArray(new_source, tokens.terminals, tokens.lexemes, tokens.identifiers)
+    _extend(result.kinds, kinds[:first])
+    _extend(result.starts, starts[:first])
+    _extend(result.ends, ends[:first])
+
+    # Um token que começa depois do fim da edição depende apenas do texto a partir de
+    # `start - 1` (fronteira `\b`), que não mudou: se o token antigo correspondente
+    # também começava ali, o restante do fluxo é idêntico ao anterior.
+    old, count = first, len(tokens)
+    append = result.append
+    for rule, start, end in Tokenizer._scan_regex(new_source, lexer, position):
+        if start > edit_end:
+            old_start = start - delta
+            old = bisect_left(starts, old_start, old)
+            if old < count and starts[old] == old_start:
+                break
+        append(rule, start, end)
+    else:
+        old = count
+    new_end = len(result)
+
+    _extend(result.kinds, kinds[old:])
+    _extend(result.starts, starts[old:], delta)
+    _extend(result.ends, ends[old:], delta)
+    return result, TokenChange(first, old, new_end)
@@ -0,0 +1,531 @@
+"""
+Motor léxico baseado em AFD (autômato finito determinístico).
+
+Compila as expressões regulares dos terminais em um único AFD minimizado,
+com regra do casamento mais longo (maximal munch) e desempate pela ordem das
+regras. A varredura é um laço de transições sobre tabelas em `array`.
+
+O regex mestre do `Tokenizer` fica com a primeira regra que casa, não com a mais
+longa: as duas coincidem só quando nenhuma regra casa um prefixo próprio de um
+lexema que só regras posteriores reconhecem (ex: `a`, `ab` e `b` em "ab": o regex
+dá `a b`, o casamento mais longo daria `ab`). O AFD recusa esses conjuntos de
+regras na construção (ver `DFALexer._first_match_conflict`). Alternativas dentro
+de uma mesma regra também seguem o casamento mais longo (`a|ab` casa "ab").
+
+Suporta o subconjunto de expressões regulares usado pelas gramáticas do projeto:
+literais, escapes (`\\d`, `\\w`, `\\s`, `\\n`, ...), classes `[...]`, `.`, grupos,
+alternância, quantificadores `*`, `+`, `?`, `{m,n}` e `\\b` no início ou no fim do padrão.
+"""
+
+import re
+from array import array
+
+# --- ALFABETO ---
+# Símbolos 0..127 são os caracteres ASCII; os demais agrupam os caracteres não ASCII
+# pelas categorias que as expressões regulares conseguem distinguir.
+NA_DIGIT, NA_WORD, NA_SPACE, NA_OTHER = 128, 129, 130, 131
+ALPHABET_SIZE = 132
+ALL = frozenset(range(ALPHABET_SIZE))
+
+
+def _ascii_matching(pattern: str) -> frozenset:
+    """Símbolos ASCII aceitos por uma classe do módulo `re` (mesma semântica Unicode)."""
+    return frozenset(code for code in range(128) if re.match(pattern, chr(code)))
+
+
+DIGIT = _ascii_matching(r"\d") | {NA_DIGIT}
+WORD = _ascii_matching(r"\w") | {NA_DIGIT, NA_WORD}
+SPACE = _ascii_matching(r"\s") | {NA_SPACE}
+ESCAPES = {
+    "d": DIGIT,
+    "D": ALL - DIGIT,
+    "w": WORD,
+    "W": ALL - WORD,
+    "s": SPACE,
+    "S": ALL - SPACE,
+    "n": frozenset({ord("\n")}),
+    "t": frozenset({ord("\t")}),
+    "r": frozenset({ord("\r")}),
+}
+
+
+def symbol_of(char: str) -> int:
+    """Retorna o símbolo do alfabeto de um caractere."""
+    code = ord(char)
+    if code < 128:
+        return code
+    if char.isdecimal():
+        return NA_DIGIT
+    if char.isalnum():
+        return NA_WORD
+    if char.isspace():
+        return NA_SPACE
+    return NA_OTHER
+
+
+class LexError(Exception):
+    """Nenhuma regra reconhece a entrada a partir de `position`."""
+
+    def __init__(self, position: int):
+        super().__init__(f"Nenhuma regra reconhece a entrada na posição {position}")
+        self.position = position
+
+
+# --- EXPRESSÕES REGULARES ---
+# Nós da árvore: ("set", símbolos), ("cat", nós), ("alt", nós), ("star", nó),
+# ("opt", nó), ("boundary",) e ("empty",).
+EMPTY = ("empty",)
+BOUNDARY = ("boundary",)
+
+
+class RegexParser:
+    """Analisador descendente recursivo do subconjunto de expressões regulares suportado."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.pos = 0
+
+    def parse(self) -> tuple:
+        node = self._alternation()
+        if self.pos != len(self.pattern):
+            self._unsupported()
+        return node
+
+    def _unsupported(self):
+        raise ValueError(
+            f"Expressão regular não suportada pelo motor AFD: '{self.pattern}' (posição {self.pos})"
+        )
+
+    def _peek(self) -> str | None:
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def _next(self) -> str:
+        if self.pos >= len(self.pattern):
+            self._unsupported()
+        char = self.pattern[self.pos]
+        self.pos += 1
+        return char
+
+    def _alternation(self) -> tuple:
+        options = [self._concatenation()]
+        while self._peek() == "|":
+            self.pos += 1
+            options.append(self._concatenation())
+        return options[0] if len(options) == 1 else ("alt", tuple(options))
+
+    def _concatenation(self) -> tuple:
+        items = []
+        while self._peek() not in (None, "|", ")"):
+            items.append(self._repetition())
+        if not items:
+            return EMPTY
+        return items[0] if len(items) == 1 else ("cat", tuple(items))
+
+    def _repetition(self) -> tuple:
+        node = self._atom()
+        while self._peek() in ("*", "+", "?", "{"):
+            quantifier = self._next()
+            if quantifier == "{":
+                low, high = self._bounds()
+                node = self._repeat(node, low, high)
+            elif quantifier == "*":
+                node = ("star", node)
+            elif quantifier == "+":
+                node = ("cat", (node, ("star", node)))
+            else:
+                node = ("opt", node)
+            if self._peek() in ("?", "+"):  # quantificadores preguiçosos/possessivos
+                self._unsupported()
+        return node
+
+    def _bounds(self) -> tuple[int, int | None]:
+        end = self.pattern.find("}", self.pos)
+        match = re.fullmatch(r"(\d+)(,(\d*))?", self.pattern[self.pos : end])
+        if end < 0 or match is None:
+            self._unsupported()
+        self.pos = end + 1
+        low = int(match.group(1))
+        if match.group(2) is None:
+            return low, low
+        return low, int(match.group(3)) if match.group(3) else None
+
+    @staticmethod
+    def _repeat(node: tuple, low: int, high: int | None) -> tuple:
+        items = [node] * low
+        if high is None:
+            items.append(("star", node))
+        else:
+            items.extend([("opt", node)] * (high - low))
+        return ("cat", tuple(items)) if items else EMPTY
+
+    def _atom(self) -> tuple:
+        char = self._next()
+        if char == "(":
+            if self.pattern.startswith("?:", self.pos):
+                self.pos += 2
+            elif self.pattern.startswith("?P<", self.pos):
+                self.pos = self.pattern.index(">", self.pos) + 1
+            elif self._peek() == "?":
+                self._unsupported()
+            node = self._alternation()
+            if self._next() != ")":
+                self._unsupported()
+            return node
+        if char == "[":
+            return ("set", self._char_class())
+        if char == ".":
+            return ("set", ALL - {ord("\n")})
+        if char == "\\":
+            escaped = self._next()
+            if escaped == "b":
+                return BOUNDARY
+            return ("set", self._escape(escaped))
+        if char in "^$*+?{}|)":
+            self._unsupported()
+        return ("set", self._literal(char))
+
+    def _escape(self, escaped: str) -> frozenset:
+        if escaped in ESCAPES:
+            return ESCAPES[escaped]
+        if escaped.isalnum():
+            self._unsupported()
+        return self._literal(escaped)
+
+    def _literal(self, char: str) -> frozenset:
+        if ord(char) >= 128:
+            self._unsupported()
+        return frozenset({ord(char)})
+
+    def _char_class(self) -> frozenset:
+        negated = self._peek() == "^"
+        if negated:
+            self.pos += 1
+        symbols = set()
+        first = True
+        while True:
+            char = self._next()
+            if char == "]" and not first:
+                break
+            first = False
+            if char == "\\":
+                members = self._escape(self._next())
+            else:
+                members = self._literal(char)
+            if self._peek() == "-" and self.pattern[self.pos + 1 : self.pos + 2] not in ("]", ""):
+                self.pos += 1
+                high = self._next()
+                if high == "\\":
+                    high = self._next()
+                if len(members) != 1:
+                    self._unsupported()
+                (low,), (high,) = members, self._literal(high)
+                members = frozenset(range(low, high + 1))
+            symbols.update(members)
+        return ALL - symbols if negated else frozenset(symbols)
+
+
+def parse_rule(pattern: str) -> tuple[tuple, bool, bool]:
+    """
+    Analisa o padrão de uma regra.
+    Retorna (árvore, exige \\b no início, exige \\b no fim).
+    """
+    node = RegexParser(pattern).parse()
+    items = list(node[1]) if node[0] == "cat" else [node]
+    lead = bool(items) and items[0] is BOUNDARY
+    trail = len(items) > lead and items[-1] is BOUNDARY
+    items = items[lead : len(items) - trail]
+
+    def check(node):
+        if node is BOUNDARY:
+            raise ValueError(
+                f"'\\b' só é suportado no início ou no fim do padrão: '{pattern}'"
+            )
+        if node[0] in ("cat", "alt"):
+            for child in node[1]:
+                check(child)
+        elif node[0] in ("star", "opt"):
+            check(node[1])
+
+    for item in items:
+        check(item)
+    if not items:
+        return EMPTY, lead, trail
+    return (items[0] if len(items) == 1 else ("cat", tuple(items))), lead, trail
+
+
+# --- AUTÔMATOS ---
+class NFA:
+    """AFN de Thompson: transições vazias e transições por conjuntos de símbolos."""
+
+    def __init__(self):
+        self.epsilon: list[list[int]] = []
+        self.edges: list[list[tuple[frozenset, int]]] = []
+        self.accepts: dict[int, tuple[int, bool, bool]] = {}
+
+    def new_state(self) -> int:
+        self.epsilon.append([])
+        self.edges.append([])
+        return len(self.epsilon) - 1
+
+    def build(self, node: tuple) -> tuple[int, int]:
+        """Constrói o fragmento de um nó e retorna seus estados (início, fim)."""
+        kind = node[0]
+        start, end = self.new_state(), self.new_state()
+        if kind == "set":
+            self.edges[start].append((node[1], end))
+        elif kind == "empty":
+            self.epsilon[start].append(end)
+        elif kind == "cat":
+            current = start
+            for child in node[1]:
+                child_start, child_end = self.build(child)
+                self.epsilon[current].append(child_start)
+                current = child_end
+            self.epsilon[current].append(end)
+        elif kind == "alt":
+            for child in node[1]:
+                child_start, child_end = self.build(child)
+                self.epsilon[start].append(child_start)
+                self.epsilon[child_end].append(end)
+        elif kind in ("star", "opt"):
+            child_start, child_end = self.build(node[1])
+            self.epsilon[start] += [child_start, end]
+            self.epsilon[child_end].append(end)
+            if kind == "star":
+                self.epsilon[child_end].append(child_start)
+        return start, end
+
+    def closure(self, states) -> frozenset:
+        result, pending = set(states), list(states)
+        while pending:
+            for target in self.epsilon[pending.pop()]:
+                if target not in result:
+                    result.add(target)
+                    pending.append(target)
+        return frozenset(result)
+
+
+class DFALexer:
+    """
+    Analisador léxico dirigido por tabela.
+
+    As regras de `skip` (espaços, comentários) têm prioridade sobre as de `rules`
+    e são descartadas; entre as demais vence o casamento mais longo e, em caso de
+    empate, a regra que aparece primeiro. `scan` gera (regra, início, fim) para cada
+    token reconhecido, onde `regra` é o índice em `rules`.
+
+    Regras em que o casamento mais longo difere da primeira regra que casa (o
+    regex mestre) levantam ValueError: o AFD só aceita conjuntos de regras em que
+    os dois motores produzem os mesmos tokens.
+    """
+
+    SKIP = -1
+
+    def __init__(self, rules: list[str], skip: list[str] = (r"\s+",)):
+        nfa = NFA()
+        start = nfa.new_state()
+        # A prioridade é a posição na lista: regras de descarte vêm antes
+        for priority, pattern in enumerate([*skip, *rules]):
+            node, lead, trail = parse_rule(pattern)
+            rule_start, rule_end = nfa.build(node)
+            nfa.epsilon[start].append(rule_start)
+            rule = priority - len(skip) if priority >= len(skip) else self.SKIP
+            nfa.accepts[rule_end] = (priority, rule, lead, trail)
+        self.rules = list(rules)
+        self._build(nfa, nfa.closure([start]))
+        conflict = self._first_match_conflict()
+        if conflict is not None:
+            shorter, longer = (skip[0] if rule == self.SKIP else rules[rule] for rule in conflict)
+            raise ValueError(
+                f"O casamento mais longo difere da primeira regra que casa: '{shorter}' reconhece "
+                f"um prefixo de lexemas de '{longer}', que vem depois; ordene a regra mais longa antes"
+            )
+
+    def _build(self, nfa: NFA, start: frozenset):
+        # --- Construção de subconjuntos ---
+        dead = frozenset()
+        index = {dead: 0, start: 1}
+        sets, moves = [dead, start], [None, None]
+        pending = [start]
+        while pending:
+            current = pending.pop()
+            targets = [set() for _ in range(ALPHABET_SIZE)]
+            for state in current:
+                for symbols, target in nfa.edges[state]:
+                    for symbol in symbols:
+                        targets[symbol].add(target)
+            row = []
+            for symbol_targets in targets:
+                closed = nfa.closure(symbol_targets) if symbol_targets else dead
+                if closed not in index:
+                    index[closed] = len(sets)
+                    sets.append(closed)
+                    moves.append(None)
+                    pending.append(closed)
+                row.append(index[closed])
+            moves[index[current]] = row
+        moves[0] = [0] * ALPHABET_SIZE
+        signatures = [self._accept_signature(nfa, states) for states in sets]
+
+        # --- Minimização (refinamento de partições de Moore) ---
+        block = self._partition(signatures, moves)
+        n_states = max(block) + 1
+        representative = {}
+        for state, state_block in enumerate(block):
+            representative.setdefault(state_block, state)
+
+        # --- Compressão do alfabeto em classes de símbolos equivalentes ---
+        columns = {}
+        self.symbol_class = bytearray(ALPHABET_SIZE)
+        for symbol in range(ALPHABET_SIZE):
+            column = tuple(
+                block[moves[representative[b]][symbol]] for b in range(n_states)
+            ) + (symbol in WORD,)
+            self.symbol_class[symbol] = columns.setdefault(column, len(columns))
+        self.n_classes = len(columns)
+        self.n_states = n_states
+        self.word = [False] * self.n_classes
+        for symbol in WORD:
+            self.word[self.symbol_class[symbol]] = True
+
+        # --- Tabelas ---
+        # transitions[estado * n_classes + classe] → próximo estado (0 = morto)
+        self.start = block[1]
+        self.transitions = array("i", bytes(4 * n_states * self.n_classes))
+        self.accepts: list = [None] * n_states
+        for b in range(n_states):
+            state = representative[b]
+            for symbol in range(ALPHABET_SIZE):
+                cls = self.symbol_class[symbol]
+                self.transitions[b * self.n_classes + cls] = block[moves[state][symbol]]
+            signature = signatures[state]
+            if signature:
+                rule, lead, trail = signature[0]
+                # Aceitação incondicional é guardada como inteiro; com \b, como tupla
+                self.accepts[b] = rule if not (lead or trail) else signature
+        # Tabela de tradução ASCII → classe, para `bytes.translate`
+        self._ascii_table = bytes(self.symbol_class[min(code, NA_OTHER)] for code in range(256))
+        self._unicode_table = _ClassTable(self.symbol_class)
+
+    @staticmethod
+    def _accept_signature(nfa: NFA, states: frozenset) -> tuple:
+        """Candidatas à aceitação, por prioridade, até a primeira incondicional."""
+        candidates = sorted(nfa.accepts[state] for state in states if state in nfa.accepts)
+        signature = []
+        for _, rule, lead, trail in candidates:
+            signature.append((rule, lead, trail))
+            if not (lead or trail):
+                break
+        return tuple(signature)
+
+    @staticmethod
+    def _partition(signatures: list, moves: list) -> list[int]:
+        """Agrupa estados equivalentes; o estado morto permanece no bloco 0."""
+        keys = {}
+        block = [keys.setdefault(signature, len(keys)) for signature in signatures]
+        while True:
+            keys = {}
+            refined = [
+                keys.setdefault((block[state], tuple(block[t] for t in moves[state])), len(keys))
+                for state in range(len(moves))
+            ]
+            if len(keys) == max(block) + 1:
+                return refined
+            block = refined
+
+    def _accepted(self, state: int, last_word: bool, next_word: bool):
+        """Regra aceita no estado, dado se o último caractere lido e o seguinte são de palavra."""
+        accept = self.accepts[state]
+        if accept is None or accept.__class__ is not tuple:
+            return accept
+        # A fronteira inicial depende do texto antes do token: supõe-se satisfeita
+        for rule, _, trail in accept:
+            if not trail or last_word != next_word:
+                return rule
+        return None
+
+    def _first_match_conflict(self) -> tuple[int, int] | None:
+        """
+        Procura um lexema em que o casamento mais longo e a primeira regra que casa
+        divergem: uma regra `i` aceita um prefixo, nenhuma regra anterior a `i` aceita os
+        prefixos seguintes e o casamento mais longo termina numa regra posterior a `i`.
+        Percorre os nós (estado, último caractere é de palavra, menor regra aceita até
+        aqui) e retorna (i, regra mais longa) do primeiro conflito, ou None.
+        """
+        transitions, n_classes, word = self.transitions, self.n_classes, self.word
+        start = (self.start, False, None)
+        seen, pending = {start}, [start]
+        while pending:
+            state, last_word, least = pending.pop()
+            row = state * n_classes
+            # Fim do lexema: fim do texto ou um caractere sem transição
+            endings = {False} | {word[c] for c in range(n_classes) if not transitions[row + c]}
+            for next_word in endings:
+                rule = self._accepted(state, last_word, next_word)
+                if rule is not None and least is not None and rule > least:
+                    return least, rule
+            for c in range(n_classes):
+                target = transitions[row + c]
+                if not target:
+                    continue
+                rule = self._accepted(state, last_word, word[c])
+                if rule is not None and (least is None or rule < least):
+                    node = (target, word[c], rule)
+                else:
+                    node = (target, word[c], least)
+                if node not in seen:
+                    seen.add(node)
+                    pending.append(node)
+        return None
+
+    def classify(self, text: str) -> bytes:
+        """Traduz o texto para a sequência de classes de símbolos (um byte por caractere)."""
+        if text.isascii():
+            return text.encode("ascii").translate(self._ascii_table)
+        return text.translate(self._unicode_table).encode("latin-1")
+
+    def scan(self, text: str):
+        """Gera (regra, início, fim) para cada token, sob demanda."""
+        data = self.classify(text)
+        transitions, n_classes, accepts = self.transitions, self.n_classes, self.accepts
+        word, start, skip = self.word, self.start, self.SKIP
+        position, length = 0, len(data)
+        while position < length:
+            state, i = start, position
+            rule, end = None, position
+            while i < length:
+                state = transitions[state * n_classes + data[i]]
+                if not state:
+                    break
+                i += 1
+                accept = accepts[state]
+                if accept is None:
+                    continue
+                if accept.__class__ is not tuple:
+                    rule, end = accept, i
+                    continue
+                # Candidatas com \b: verifica as fronteiras de palavra em torno do lexema
+                lead_ok = word[data[position]] != (position > 0 and word[data[position - 1]])
+                trail_ok = word[data[i - 1]] != (i < length and word[data[i]])
+                for candidate, lead, trail in accept:
+                    if (lead and not lead_ok) or (trail and not trail_ok):
+                        continue
+                    rule, end = candidate, i
+                    break
+            if rule is None:
+                raise LexError(position)
+            if rule != skip:
+                yield rule, position, end
+            position = end
+
+
+class _ClassTable(dict):
+    """Mapeamento código → classe para `str.translate`, preenchido sob demanda."""
+
+    def __init__(self, symbol_class: bytearray):
+        super().__init__()
+        self.symbol_class = symbol_class
+
+    def __missing__(self, code: int) -> str:
+        value = self[code] = chr(self.symbol_class[symbol_of(chr(code))])
+        return value
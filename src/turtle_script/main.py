@@ -73,7 +73,7 @@ if __name__ == "__main__":
 
     print("-" * 30)
     print(Fore.YELLOW + "Árvore de Derivação:")
-    for pre, fill, node in RenderTree(derivation_tree):
+    for pre, fill, node in RenderTree(derivation_tree.to_anytree()):
         cor = Fore.BLACK if isinstance(node.name, NonTerminal) else Fore.RED
         print(f"{pre}{cor}{node.name}")
     print("-" * 30)
@@ -0,0 +1,21 @@
+"""
+Motores de parsing dirigidos por tabela (ver `TableParser`), escolhidos pelo nome.
+"""
+
+# Importável como pacote (`turtle_script.parsers`) ou com src/turtle_script no sys.path
+try:
+    from .table_parser_lalr1 import LALR1Parser
+    from .table_parser_ll1 import Grammar, LL1ParserTable, TableParser
+except ImportError:
+    from table_parser_lalr1 import LALR1Parser
+    from table_parser_ll1 import Grammar, LL1ParserTable, TableParser
+
+# Motores disponíveis para `create_parser`
+ENGINES: dict[str, type[TableParser]] = {"ll1": LL1ParserTable, "lalr1": LALR1Parser}
+
+
+def create_parser(grammar: Grammar, engine: str = "ll1", **options) -> TableParser:
+    """Constrói o parser do motor `engine` ("ll1" ou "lalr1") para a gramática."""
+    if engine not in ENGINES:
+        raise ValueError(f"Motor de parsing desconhecido: '{engine}' (opções: {', '.join(ENGINES)})")
+    return ENGINES[engine].from_grammar(grammar, **options)
@@ -1,8 +1,7 @@
 from colorama import Fore
 from anytree import RenderTree
-from anytree import Node
 from grammar import *
-from table_parser_ll1 import LL1Table, LL1ParserTable, Token, Tokenizer
+from table_parser_ll1 import LL1Table, LL1ParserTable, Token, Tokenizer, TreeNode
 from abstract_syntax_tree import get_ast_root
 
 
@@ -13,7 +12,7 @@ class SemanticProcessor:
         self.grammar = grammar
         self.symbol_table = symbol_table
 
-    def process(self, ast: Node) -> bool:
+    def process(self, ast: TreeNode) -> bool:
         """Processa a ast fornecida, realizando a análise semântica."""
 
         errors = []
@@ -27,7 +26,7 @@ class SemanticProcessor:
 
         return errors
     
-    def _validate_declaration(self, ast: Node, symbol_table: dict) -> list:
+    def _validate_declaration(self, ast: TreeNode, symbol_table: dict) -> list:
         """
         Verificação de Declaração de Variáveis
         
@@ -45,7 +44,7 @@ class SemanticProcessor:
             index_of_op_att = self.index_of(right, op_atribuicao)
             if index_of_op_att < 0: # não tem atribuição
                 if not all( # todos sao identificadores sem atribuicao inicial
-                    isinstance(var, Node)
+                    isinstance(var, TreeNode)
                     and isinstance(var.name, Token)
                     and var.name.terminal == identificador
                     for var in right):
@@ -65,7 +64,7 @@ class SemanticProcessor:
                     continue
                 idens, values = right[:index_of_op_att], right[index_of_op_att + 1:]
                 for iden, val in zip(idens, values):
-                    if not isinstance(iden, Node) or not isinstance(iden.name, Token) or iden.name.terminal != identificador:
+                    if not isinstance(iden, TreeNode) or not isinstance(iden.name, Token) or iden.name.terminal != identificador:
                         errors.append(f"Identificador inválido na declaração.")
                         continue
                     if iden.name.lexeme in symbol_table:
@@ -85,7 +84,7 @@ class SemanticProcessor:
                 errors.append(f"Variável '{node.name.lexeme}' não declarada antes do uso.")
         return errors
 
-    def _validate_types(self, ast: Node) -> list:
+    def _validate_types(self, ast: TreeNode) -> list:
         """
         Verificação de Tipos (Tipagem Estática)
         
@@ -163,7 +162,7 @@ class SemanticProcessor:
                 continue
         return errors
 
-    def _validate_expression(self, node: Node) -> str:
+    def _validate_expression(self, node: TreeNode) -> str:
         if node.is_leaf and self.is_identifier(node):
             # se for identificador, tem que retornar o tipo do identificador na tabela de símbolos
             return self.symbol_table.get(node.name.lexeme, {}).get("tipo", None)
@@ -213,33 +212,33 @@ class SemanticProcessor:
         return None
 
     @staticmethod
-    def index_of(children, terminal: Token | Node) -> int:
+    def index_of(children, terminal: Token | TreeNode) -> int:
         """Retorna o índice do primeiro nó com o terminal especificado."""
         for i, child in enumerate(children):
             if isinstance(child.name, Token) and child.name.terminal == terminal:
                 return i
-            elif isinstance(child, Node) and child.name == terminal:
+            elif isinstance(child, TreeNode) and child.name == terminal:
                 return i
         return -1
 
     @staticmethod
-    def is_atribution(node: Node) -> bool:
+    def is_atribution(node: TreeNode) -> bool:
         """Verifica se o nó é uma atribuição."""
         return isinstance(node.name, Token) and node.name.terminal == op_atribuicao
 
     @staticmethod
-    def is_declaration(node: Node) -> bool:
+    def is_declaration(node: TreeNode) -> bool:
         """Verifica se o nó é uma declaração de variável."""
         # return node.name == dois_pontos.repr
         return isinstance(node.name, Token) and node.name.terminal == dois_pontos
 
     @staticmethod
-    def is_identifier(node: Node) -> bool:
+    def is_identifier(node: TreeNode) -> bool:
         """Verifica se o nó é um identificador."""
         return isinstance(node.name, Token) and node.name.terminal == identificador
 
     @staticmethod
-    def is_arithmetic_operation(node: Node) -> bool:
+    def is_arithmetic_operation(node: TreeNode) -> bool:
         """Verifica se o nó é uma operação aritmética."""
         return isinstance(node.name, Token) and node.name.terminal in {
             op_mais,
@@ -250,7 +249,7 @@ class SemanticProcessor:
         }
 
     @staticmethod
-    def is_comparison_operation(node: Node) -> bool:
+    def is_comparison_operation(node: TreeNode) -> bool:
         """Verifica se o nó é uma operação de comparação."""
         return isinstance(node.name, Token) and node.name.terminal in {
             op_igualdade,
@@ -262,7 +261,7 @@ class SemanticProcessor:
         }
 
     @staticmethod
-    def is_logical_operation(node: Node) -> bool:
+    def is_logical_operation(node: TreeNode) -> bool:
         """Verifica se o nó é uma operação lógica."""
         return isinstance(node.name, Token) and node.name.terminal in {
             op_e,
@@ -271,7 +270,7 @@ class SemanticProcessor:
         }
 
     @staticmethod
-    def is_primitive(node: Node) -> bool:
+    def is_primitive(node: TreeNode) -> bool:
         """Verifica se o nó é um terminal primitivo (inteiro, real, texto, logico)."""
         return isinstance(node.name, Token) and node.name.terminal in {
             inteiro,
@@ -281,6 +280,9 @@ class SemanticProcessor:
         }
 
 if __name__ == "__main__":
+    # A gramática é construída sob demanda e não vem com o `import *`
+    from grammar import grammar
+
     script_input = """
     inicio
         var inteiro: a, b;
@@ -318,7 +320,7 @@ if __name__ == "__main__":
 
     print("AST:")
     ast_root = get_ast_root(derivation_tree_root)
-    for pre, fill, node in RenderTree(ast_root):
+    for pre, fill, node in RenderTree(ast_root.to_anytree()):
         print(
             f"{pre}"
             + {True: Fore.BLUE, False: Fore.BLACK}[node.is_leaf]
@@ -0,0 +1,263 @@
+"""
+Parser LALR(1) sobre as mesmas `Grammar` e `Production` de `table_parser_ll1`.
+
+`LALR1Table` constrói a coleção canônica de itens LR(0) e calcula os lookaheads
+por propagação (algoritmo do livro do Dragão, seção 4.7.5): cada item do núcleo
+é fechado com um lookahead fictício, que separa os lookaheads gerados
+espontaneamente dos propagados entre estados. As ações e os desvios ficam em
+vetores densos indexados por (estado, id do símbolo), como na `LL1Table`.
+
+`LALR1Parser` é o driver shift-reduce. A cada redução chama a ação da produção,
+se houver, o que permite montar a AST de baixo para cima, inclusive com
+gramáticas recursivas à esquerda (sem não terminais de cauda); sem ação, constrói
+o mesmo nó de árvore de derivação que o `LL1ParserTable`.
+"""
+
+from array import array
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+# Importável como pacote (`turtle_script.table_parser_lalr1`) ou com src/turtle_script no sys.path
+try:
+    from .table_parser_ll1 import Grammar, Production, TableParser, Token, TreeNode
+except ImportError:
+    from table_parser_ll1 import Grammar, Production, TableParser, Token, TreeNode
+
+# Lookahead fictício usado para descobrir a propagação
+_PROPAGATE = -1
+
+
+class LALR1Table:
+    """
+    Tabela LALR(1) de uma gramática.
+    - `action[estado * n_columns + t]`: 0 é erro, s + 1 desloca para o estado s e
+      -(p + 1) reduz pela produção p; reduzir pela produção aumentada (S' → S,
+      índice `accept`) aceita a entrada;
+    - `goto[estado * n_goto + (A - n_terminals)]`: estado após reduzir para A.
+    """
+
+    def __init__(self, grammar: Grammar):
+        self.grammar = grammar
+        n_terminals = grammar.n_terminals
+        epsilon = len(grammar.symbols) - 1
+        # Lados direitos sem ε explícito; a produção aumentada S' → S fica no fim
+        self.lhs = [lhs for lhs, _ in grammar.production_ids]
+        self.rhs = [tuple(s for s in rhs if s != epsilon) for _, rhs in grammar.production_ids]
+        self.accept = len(self.rhs)
+        self.lhs.append(epsilon + 1)
+        self.rhs.append((grammar.symbol_ids[grammar.start_symbol],))
+
+        self.n_columns = n_terminals + 1  # inclui a coluna de terminais desconhecidos
+        self.n_goto = epsilon - n_terminals
+        kernels, gotos = self._lr0_states()
+        lookaheads = self._lookaheads(kernels, gotos)
+        self.n_states = len(kernels)
+        self.action = array("i", bytes(4 * self.n_states * self.n_columns))
+        self.goto = array("i", [-1]) * (self.n_states * self.n_goto)
+        self._fill(kernels, gotos, lookaheads)
+
+    def _productions_by_lhs(self) -> dict[int, list[int]]:
+        by_lhs = defaultdict(list)
+        for index, lhs in enumerate(self.lhs):
+            by_lhs[lhs].append(index)
+        return by_lhs
+
+    def _lr0_states(self) -> tuple[list[tuple], list[dict[int, int]]]:
+        """Núcleos dos estados LR(0) (tuplas de itens (produção, ponto)) e seus desvios."""
+        rhs, n_terminals = self.rhs, self.grammar.n_terminals
+        by_lhs = self._by_lhs = self._productions_by_lhs()
+        kernels = [((self.accept, 0),)]
+        index = {kernels[0]: 0}
+        gotos = []
+        for kernel in kernels:  # cresce durante a iteração
+            items, expanded = list(kernel), set()
+            for production, dot in items:
+                if dot < len(rhs[production]):
+                    symbol = rhs[production][dot]
+                    if symbol >= n_terminals and symbol not in expanded:
+                        expanded.add(symbol)
+                        items.extend((other, 0) for other in by_lhs[symbol])
+            moves = defaultdict(list)
+            for production, dot in items:
+                if dot < len(rhs[production]):
+                    moves[rhs[production][dot]].append((production, dot + 1))
+            transitions = {}
+            for symbol, targets in moves.items():
+                target = tuple(sorted(set(targets)))
+                if target not in index:
+                    index[target] = len(kernels)
+                    kernels.append(target)
+                transitions[symbol] = index[target]
+            gotos.append(transitions)
+        return kernels, gotos
+
+    def _closure(self, items: dict[tuple[int, int], set]) -> dict[tuple[int, int], set]:
+        """Fecho LR(1) de `items` (item → lookaheads), alterando e retornando o dicionário."""
+        grammar, rhs, by_lhs = self.grammar, self.rhs, self._by_lhs
+        n_terminals, first = grammar.n_terminals, self._first
+        pending = list(items)
+        while pending:
+            production, dot = pending.pop()
+            right = rhs[production]
+            if dot >= len(right) or right[dot] < n_terminals:
+                continue
+            # FIRST do restante do lado direito, mais os lookaheads se ele for anulável
+            lookaheads, nullable = first(production, dot + 1)
+            if nullable:
+                lookaheads = lookaheads | items[production, dot]
+            for other in by_lhs[right[dot]]:
+                current = items.setdefault((other, 0), set())
+                if not lookaheads <= current:
+                    current |= lookaheads
+                    pending.append((other, 0))
+        return items
+
+    def _first(self, production: int, start: int) -> tuple[frozenset, bool]:
+        """FIRST (ids) de `rhs[production][start:]` e se a sequência é anulável."""
+        key = (production, start)
+        cached = self._first_cache.get(key)
+        if cached is None:
+            grammar = self.grammar
+            if production == self.accept:  # S' → S: o único sufixo pedido é o vazio
+                cached = (frozenset(), True)
+            else:
+                # Sufixo equivalente no lado direito original (com ε explícito)
+                original = grammar.productions[production].rhs
+                positions = [i for i, symbol in enumerate(original) if symbol != Grammar.EPSILON]
+                position = positions[start] if start < len(positions) else len(original)
+                first = grammar.suffix_first(production)[position]
+                ids = grammar.symbol_ids
+                cached = (
+                    frozenset(ids[t] for t in first if t != Grammar.EPSILON),
+                    Grammar.EPSILON in first,
+                )
+            self._first_cache[key] = cached
+        return cached
+
+    def _lookaheads(self, kernels: list[tuple], gotos: list[dict]) -> list[dict]:
+        """Lookaheads de cada item de núcleo, por geração espontânea e propagação."""
+        grammar, rhs = self.grammar, self.rhs
+        self._first_cache = {}
+        eof = grammar.n_terminals - 1
+        lookaheads = [{item: set() for item in kernel} for kernel in kernels]
+        lookaheads[0][self.accept, 0].add(eof)
+        propagation = defaultdict(list)
+        for state, kernel in enumerate(kernels):
+            for item in kernel:
+                closure = self._closure({item: {_PROPAGATE}})
+                for (production, dot), symbols in closure.items():
+                    if dot == len(rhs[production]):
+                        continue
+                    target_state = gotos[state][rhs[production][dot]]
+                    target = lookaheads[target_state][production, dot + 1]
+                    for symbol in symbols:
+                        if symbol == _PROPAGATE:
+                            propagation[state, item].append((target_state, (production, dot + 1)))
+                        else:
+                            target.add(symbol)
+
+        changed = True
+        while changed:
+            changed = False
+            for (state, item), targets in propagation.items():
+                source = lookaheads[state][item]
+                for target_state, target_item in targets:
+                    target = lookaheads[target_state][target_item]
+                    if not source <= target:
+                        target |= source
+                        changed = True
+        return lookaheads
+
+    def _fill(self, kernels: list[tuple], gotos: list[dict], lookaheads: list[dict]):
+        """Preenche `action` e `goto`; conflitos lançam ValueError."""
+        grammar, rhs, action = self.grammar, self.rhs, self.action
+        n_terminals, n_columns, symbols = grammar.n_terminals, self.n_columns, grammar.symbols
+
+        def describe(entry: int) -> str:
+            if entry > 0:
+                return f"deslocar para o estado {entry - 1}"
+            production = -entry - 1
+            return "aceitar" if production == self.accept else f"reduzir '{grammar.productions[production]}'"
+
+        for state, kernel in enumerate(kernels):
+            row = state * n_columns
+            for symbol, target in gotos[state].items():
+                if symbol < n_terminals:
+                    action[row + symbol] = target + 1
+                else:
+                    self.goto[state * self.n_goto + symbol - n_terminals] = target
+            closure = self._closure({item: set(lookaheads[state][item]) for item in kernel})
+            for (production, dot), terminals in closure.items():
+                if dot < len(rhs[production]):
+                    continue
+                for terminal in terminals:
+                    current = action[row + terminal]
+                    if current and current != -(production + 1):
+                        raise ValueError(
+                            f"Erro: conflito LALR(1) no estado {state} com '{symbols[terminal]}': "
+                            f"{describe(current)} ou {describe(-(production + 1))}."
+                        )
+                    action[row + terminal] = -(production + 1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.action.itemsize * len(self.action) + self.goto.itemsize * len(self.goto)
+
+
+class LALR1Parser(TableParser):
+    def __init__(self, table: LALR1Table, actions: dict[Production, Callable] = None):
+        """
+        :param actions: ação de cada produção, chamada na redução com os valores dos
+            símbolos do lado direito (o `Token` de cada terminal; o valor retornado pela
+            redução de cada não terminal; nada para ε). Produções sem ação constroem o nó
+            da árvore de derivação, com os valores que não são `TreeNode` como folhas
+        """
+        self.table = table
+        self.start_symbol = table.grammar.start_symbol
+        self.actions = self._production_actions(table.grammar, actions or {})
+
+    @classmethod
+    def from_grammar(cls, grammar: Grammar, **options) -> "LALR1Parser":
+        return cls(LALR1Table(grammar), **options)
+
+    def parse(self, tokens: Iterable[Token]) -> tuple[bool, object]:
+        """
+        Realiza o parsing LALR(1), com um único token de lookahead.
+        :param tokens: Tokens da entrada; o fim da sequência equivale ao símbolo "$"
+        :return: Tupla (bool, valor do símbolo inicial: a raiz da árvore de derivação,
+            ou o resultado da ação da sua produção). Em erro, a raiz tem como filhos os
+            valores já reduzidos
+        """
+        table = self.table
+        grammar = table.grammar
+        action, goto, lhs, rhs = table.action, table.goto, table.lhs, table.rhs
+        n_columns, n_goto, n_terminals = table.n_columns, table.n_goto, grammar.n_terminals
+        actions, accept = self.actions, table.accept
+
+        states, values = [0], []
+        tokens = self._token_ids(tokens)
+        end_of_input = (n_terminals - 1, Token(Grammar.EOF, "$"))
+        kind, current_token = next(tokens, end_of_input)
+
+        while True:
+            entry = action[states[-1] * n_columns + kind]
+            if entry > 0:
+                states.append(entry - 1)
+                values.append(current_token)
+                kind, current_token = next(tokens, end_of_input)
+                continue
+            if entry == 0:
+                children = [value if isinstance(value, TreeNode) else TreeNode(value) for value in values]
+                return False, TreeNode(self.start_symbol, children=children)
+
+            production = -entry - 1
+            if production == accept:
+                return True, values[0]
+            length = len(rhs[production])
+            if length:
+                children = values[-length:]
+                del values[-length:], states[-length:]
+            else:
+                children = []
+            values.append(actions[production](*children))
+            states.append(goto[states[-1] * n_goto + lhs[production] - n_terminals])
@@ -1,11 +1,29 @@
+import copy
+import hashlib
+import marshal
+import mmap
+import os
 import re
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
 from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import partial
+from typing import NamedTuple
 
 # import pandas as pd
 from collections import defaultdict
 from colorama import Fore, Style, init
 from anytree import Node, RenderTree
 
+# Importável como pacote (`turtle_script.table_parser_ll1`) ou com src/turtle_script no sys.path
+try:
+    from .lexer_dfa import DFALexer, LexError
+except ImportError:
+    from lexer_dfa import DFALexer, LexError
+
 
 init(autoreset=True)
 
@@ -14,6 +32,8 @@ class Symbol:
     def __init__(self, name: str, repr: str = None):
         self.name = name
         self.repr = repr if repr is not None else name
+        # Hash calculado uma vez: símbolos são chaves de quase todos os dicionários
+        self._hash = hash((name, type(self)))
 
     def __repr__(self):
         return f"{self.repr}"
@@ -22,7 +42,7 @@ class Symbol:
         return isinstance(other, type(self)) and self.name == other.name
 
     def __hash__(self):
-        return hash((self.name, type(self)))
+        return self._hash
 
 
 class NonTerminal(Symbol):
@@ -69,6 +89,68 @@ class Production:
         return hash((self.lhs, tuple(self.rhs)))
 
 
+class TreeNode:
+    """
+    Nó das árvores de derivação e das ASTs, com `__slots__`: nome (símbolo ou `Token`),
+    lista de filhos e pai. Ligar um nó ao pai é um `append`, sem as validações e a
+    verificação de ciclos do `anytree.Node` (que percorre os ancestrais a cada nó).
+    Os iteradores do anytree (`RenderTree`, `PreOrderIter`) só leem `name` e
+    `children` e aceitam o nó diretamente; `to_anytree` converte a árvore quando a
+    API completa do anytree é necessária.
+    """
+
+    __slots__ = ("name", "children", "parent")
+
+    def __init__(self, name, parent: "TreeNode" = None, children: Iterable["TreeNode"] = None):
+        self.name = name
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self)
+        if children:
+            self.children = list(children)
+            for child in self.children:
+                child.parent = self
+        else:
+            self.children = []
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    @property
+    def descendants(self) -> tuple["TreeNode", ...]:
+        """Descendentes em pré-ordem, sem o próprio nó (como no anytree)."""
+        result, pending = [], self.children[::-1]
+        while pending:
+            node = pending.pop()
+            result.append(node)
+            pending.extend(reversed(node.children))
+        return tuple(result)
+
+    @property
+    def depth(self) -> int:
+        depth, node = 0, self.parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    def to_anytree(self) -> Node:
+        """Cópia da árvore em `anytree.Node`, montada de baixo para cima e sem recursão."""
+        converted, pending = {}, [(self, False)]
+        while pending:
+            node, ready = pending.pop()
+            if ready:
+                children = [converted.pop(id(child)) for child in node.children]
+                converted[id(node)] = Node(node.name, children=children)
+            else:
+                pending.append((node, True))
+                pending.extend((child, False) for child in node.children)
+        return converted[id(self)]
+
+    def __repr__(self):
+        return f"TreeNode({self.name!r})"
+
+
 class Grammar:
     EPSILON = Symbol("ε")
     EOF = Terminal("EOF", "$")
@@ -79,96 +161,249 @@ class Grammar:
         terminals: list[Terminal] = [EOF],
         non_terminals: list[NonTerminal] = [],
         productions: list[Production] = [],
+        cache_dir: str = None,
     ):
+        """
+        :param cache_dir: diretório do cache em disco da análise (FIRST, FOLLOW e tabela
+            LL(1)); com None a análise é sempre recalculada. Ver `GrammarCache`.
+        """
         self.start_symbol = start_symbol
         self.terminals = terminals
         self.non_terminals = non_terminals
         self.productions = productions
+        # Léxico compilado sob demanda (ver CompiledLexer.of)
+        self._compiled_lexer = None
+        # Tabela LL(1) carregada do cache (ver LL1Table)
+        self._ll1_table = None
+        # Índices das produções por lado esquerdo e por ocorrência, criados sob demanda
+        # pela primeira chamada de `add_productions`
+        self._by_lhs = self._occurrences = None
+        # Registro para desfazer o último `add_productions` (ver `_revert_addition`)
+        self._last_addition = None
+        # Moldes das derivações originais, em gramáticas criadas por `inline_units`
+        self.origins = None
+
+        # FIRST e FOLLOW (e a tabela LL(1) do cache) são calculados no primeiro acesso
+        self._cache_dir = cache_dir
+        self._first_sets = self._follow_sets = None
+        # FIRST por produção e por sufixo, calculados sob demanda (ver `production_first`)
+        self._production_first = self._production_nullable = self._suffix_first = None
+        self._frozen = {}
 
         self._validate_productions()
-        self.first_sets = self.compute_first_sets()
-        self.follow_sets = self.compute_follow_sets()
+        self._number_symbols()
+
+    @property
+    def first_sets(self) -> dict:
+        """Conjuntos FIRST de cada não terminal, calculados ou carregados no primeiro acesso."""
+        if self._first_sets is None:
+            self._analyze()
+        return self._first_sets
+
+    @property
+    def follow_sets(self) -> dict:
+        """Conjuntos FOLLOW de cada não terminal, calculados ou carregados no primeiro acesso."""
+        if self._follow_sets is None:
+            self._analyze()
+        return self._follow_sets
+
+    def _analyze(self):
+        """Carrega a análise do cache em disco ou a calcula (e grava); sem efeito se já feita."""
+        if self._first_sets is not None:
+            return
+        cache = GrammarCache(self._cache_dir) if self._cache_dir else None
+        snapshot = cache.load(self) if cache else None
+        if snapshot is not None:
+            self._first_sets, self._follow_sets, self._ll1_table = snapshot
+        else:
+            self._first_sets = self.compute_first_sets()
+            self._follow_sets = self.compute_follow_sets()
+            if cache:
+                cache.store(self)
 
-    def _validate_productions(self):
-        """Valida as produções da gramática."""
+    def _validate_productions(self, productions: list[Production] = None):
+        """Valida as produções da gramática (ou apenas `productions`)."""
         erros = []
-        for prod in self.productions:
+        terminals, non_terminals = set(self.terminals), set(self.non_terminals)
+        for prod in self.productions if productions is None else productions:
             if not isinstance(prod, Production):
                 erros.append(f"Expected Production but got '{type(prod).__name__}'")
-            if prod.lhs not in self.non_terminals:
+                continue
+            if prod.lhs not in non_terminals:
                 erros.append(f"LHS '{prod.lhs}' is not in non_terminals list")
             for sym in prod.rhs:
-                if isinstance(sym, Terminal) and sym not in self.terminals:
+                if isinstance(sym, Terminal) and sym not in terminals:
                     erros.append(f"Terminal '{sym}' is not in terminals list")
-                elif isinstance(sym, NonTerminal) and sym not in self.non_terminals:
+                elif isinstance(sym, NonTerminal) and sym not in non_terminals:
                     erros.append(f"NonTerminal '{sym}' is not in non_terminals list")
+                elif not isinstance(sym, (Terminal, NonTerminal)) and sym != Grammar.EPSILON:
+                    erros.append(f"Symbol '{sym}' is neither Terminal nor NonTerminal")
         if erros:
             raise ValueError("Errors in productions:\n" + "\n".join(erros))
 
+    def _number_symbols(self):
+        """
+        Atribui ids inteiros densos aos símbolos da gramática:
+        terminais em [0, n_terminals) na ordem de `terminals`, com EOF por último (os
+        demais seguem a ordem das regras do léxico, então `TokenArray.kinds` já são ids);
+        não terminais a seguir e ε com o último id. As produções, como tuplas de ids,
+        ficam em `production_ids`.
+        """
+        terminals = [
+            terminal
+            for terminal in dict.fromkeys(self.terminals)
+            if isinstance(terminal, Terminal) and terminal != Grammar.EOF
+        ]
+        terminals.append(Grammar.EOF)
+        self.n_terminals = len(terminals)
+        self.symbols: list[Symbol] = terminals + list(dict.fromkeys(self.non_terminals))
+        self.symbols.append(Grammar.EPSILON)
+        self.symbol_ids: dict[Symbol, int] = {s: i for i, s in enumerate(self.symbols)}
+        self._production_ids = None
+
+    @property
+    def production_ids(self) -> list[tuple[int, tuple[int, ...]]]:
+        """As produções como tuplas (lhs, rhs) de ids, calculadas sob demanda."""
+        if self._production_ids is None:
+            ids = self.symbol_ids
+            self._production_ids = [
+                (ids[prod.lhs], tuple(ids[symbol] for symbol in prod.rhs))
+                for prod in self.productions
+            ]
+        return self._production_ids
+
     def __repr__(self):
         productions_str = "\n".join(map(str, self.productions))
         return f"Grammar:\nStart Symbol: {self.start_symbol}\nProductions:\n{productions_str}"
 
-    def compute_first_sets(self):
-        """Calcula os conjuntos FIRST para cada não terminal da gramática."""
-        first = defaultdict(set)
+    def compute_nullable(self) -> set:
+        """
+        Calcula os não terminais anuláveis (que derivam ε) com uma lista de trabalho:
+        cada produção conta os símbolos do lado direito ainda não anuláveis e só é
+        revisitada quando um deles se torna anulável.
+        """
+        nullable = set()
+        pending = []
+        remaining = {}  # índice da produção → símbolos ainda não anuláveis
+        occurrences = defaultdict(list)  # símbolo → produções em que aparece
+        for index, prod in enumerate(self.productions):
+            rhs = prod.rhs
+            if len(rhs) == 1 and rhs[0] == Grammar.EPSILON:
+                rhs = []
+            if any(isinstance(symbol, Terminal) for symbol in rhs):
+                continue
+            remaining[index] = len(rhs)
+            for symbol in rhs:
+                occurrences[symbol].append(index)
+            if not rhs:
+                pending.append(prod.lhs)
+        while pending:
+            symbol = pending.pop()
+            if symbol in nullable:
+                continue
+            nullable.add(symbol)
+            for index in occurrences[symbol]:
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    pending.append(self.productions[index].lhs)
+        return nullable
 
-        def first_of(symbol):
-            """Calcula o conjunto FIRST para um símbolo."""
-            if isinstance(symbol, Terminal):
-                return {symbol}
-            return first[symbol]
+    @staticmethod
+    def _digraph(edges: dict, base: dict) -> dict:
+        """
+        Resolve F(x) = base(x) ∪ F(y) para toda aresta x → y, com o algoritmo "digraph"
+        de DeRemer e Pennello: uma busca em profundidade (iterativa, sem limite de
+        recursão) que faz uma união por aresta; os membros de cada componente fortemente
+        conexo recebem o mesmo conjunto.
+        """
+        done = float("inf")
+        depth, result, stack = {}, {}, []
 
-        changed = True
-        while changed:
-            changed = False
-            for prod in self.productions:
-                lhs, rhs = prod.lhs, prod.rhs
-                original_size = len(first[lhs])
+        def push(node):
+            stack.append(node)
+            depth[node] = len(stack)
+            result[node] = set(base.get(node, ()))
+            return node, len(stack), iter(edges.get(node, ()))
 
-                if len(rhs) == 1 and rhs[0] == Grammar.EPSILON:
-                    first[lhs].add(Grammar.EPSILON)
+        for root in base:
+            if root in depth:
+                continue
+            work = [push(root)]
+            while work:
+                node, entry, successors = work[-1]
+                for successor in successors:
+                    if successor not in depth:
+                        work.append(push(successor))
+                        break
+                    depth[node] = min(depth[node], depth[successor])
+                    result[node] |= result[successor]
                 else:
-                    nullable = True
-                    for symbol in rhs:
-                        symbol_first = first_of(symbol)
-                        first[lhs].update(symbol_first - {Grammar.EPSILON})
-                        if Grammar.EPSILON not in symbol_first:
-                            nullable = False
-                            break
-                    if nullable:
-                        first[lhs].add(Grammar.EPSILON)
-
-                if len(first[lhs]) > original_size:
-                    changed = True
+                    work.pop()
+                    if depth[node] == entry:
+                        # `node` é a raiz de um componente: todos recebem o seu conjunto
+                        while True:
+                            member = stack.pop()
+                            depth[member] = done
+                            if member is node:
+                                break
+                            result[member] = set(result[node])
+                    if work:
+                        parent = work[-1][0]
+                        depth[parent] = min(depth[parent], depth[node])
+                        result[parent] |= result[node]
+        return result
+
+    def compute_first_sets(self):
+        """
+        Calcula os conjuntos FIRST para cada não terminal da gramática.
+        Cada produção A → αXβ com α anulável contribui o terminal X para FIRST(A) ou, se X
+        for não terminal, a relação FIRST(A) ⊇ FIRST(X); o sistema é resolvido por `_digraph`.
+        """
+        nullable = self.compute_nullable()
+        base, edges = {}, defaultdict(list)
+        for prod in self.productions:
+            lhs, rhs = prod.lhs, prod.rhs
+            first_lhs = base.setdefault(lhs, set())
+            if len(rhs) == 1 and rhs[0] == Grammar.EPSILON:
+                continue
+            for symbol in rhs:
+                if isinstance(symbol, Terminal):
+                    first_lhs.add(symbol)
+                    break
+                base.setdefault(symbol, set())
+                edges[lhs].append(symbol)
+                if symbol not in nullable:
+                    break
+        first = defaultdict(set, self._digraph(edges, base))
+        for symbol in nullable:
+            first[symbol].add(Grammar.EPSILON)
         return first
 
     def compute_follow_sets(self):
-        """Calcula os conjuntos FOLLOW para cada não terminal da gramática."""
-        follow = defaultdict(set)
-        follow[self.start_symbol].add(Grammar.EOF)
-        changed = True
-        while changed:
-            changed = False
-            for prod in self.productions[::-1]:
-                lhs, rhs = prod.lhs, prod.rhs
-                trailer = follow[lhs].copy()
-                for i in reversed(range(len(rhs))):
-                    symbol = rhs[i]
-                    if isinstance(symbol, NonTerminal):
-                        original_size = len(follow[symbol])
-                        follow[symbol].update(trailer)
-                        if Grammar.EPSILON in self.first_sets[symbol]:
-                            trailer = trailer.union(
-                                self.first_sets[symbol] - {Grammar.EPSILON}
-                            )
-                        else:
-                            trailer = self.first_sets[symbol] - {Grammar.EPSILON}
-                        if len(follow[symbol]) > original_size:
-                            changed = True
-                    elif isinstance(symbol, Terminal):
-                        trailer = {symbol}
-        return follow
+        """
+        Calcula os conjuntos FOLLOW para cada não terminal da gramática.
+        Cada produção A → αBβ contribui FIRST(β) - {ε} para FOLLOW(B) e, se β for
+        anulável, a relação FOLLOW(B) ⊇ FOLLOW(A); o sistema é resolvido por `_digraph`.
+        """
+        first = self.first_sets
+        base, edges = {self.start_symbol: {Grammar.EOF}}, defaultdict(list)
+        for prod in self.productions:
+            lhs = prod.lhs
+            base.setdefault(lhs, set())
+            trailer, reaches_end = set(), True
+            for symbol in reversed(prod.rhs):
+                if isinstance(symbol, NonTerminal):
+                    base.setdefault(symbol, set()).update(trailer)
+                    if reaches_end:
+                        edges[symbol].append(lhs)
+                    symbol_first = first[symbol] - {Grammar.EPSILON}
+                    if Grammar.EPSILON in first[symbol]:
+                        trailer = trailer | symbol_first
+                    else:
+                        trailer, reaches_end = symbol_first, False
+                elif isinstance(symbol, Terminal):
+                    trailer, reaches_end = {symbol}, False
+        return defaultdict(set, self._digraph(edges, base))
 
     def first_rhs(self, symbols: list[Symbol]) -> set:
         """Calcula o conjunto FIRST para uma sequência de símbolos (lado direito de uma produção)."""
@@ -185,11 +420,615 @@ class Grammar:
             result.add(Grammar.EPSILON)
         return result
 
+    @property
+    def production_first(self) -> list[frozenset]:
+        """
+        FIRST(rhs) de cada produção, por índice (o mesmo que `first_rhs`, com ε se o lado
+        direito é anulável), como frozensets imutáveis compartilhados entre os consumidores
+        (tabela LL(1), relatório de conflitos, recuperação de erros). Calculado no primeiro
+        acesso e mantido por `add_productions`.
+        """
+        if self._production_first is None:
+            self._production_first, self._production_nullable = [], []
+            self._suffix_first = []
+            self._update_production_first(range(len(self.productions)))
+        return self._production_first
+
+    @property
+    def production_nullable(self) -> list[bool]:
+        """Se o lado direito de cada produção, por índice, é anulável."""
+        if self._production_nullable is None:
+            self.production_first
+        return self._production_nullable
+
+    def suffix_first(self, index: int) -> tuple[frozenset, ...]:
+        """
+        FIRST de cada sufixo do lado direito da produção `index`: o elemento i é
+        FIRST(rhs[i:]), com ε se o sufixo é anulável, e o último é {ε}. Calculado no
+        primeiro pedido de cada produção (sufixos após um não terminal anulável podem
+        ser grandes) e guardado.
+        """
+        self.production_first
+        suffixes = self._suffix_first[index]
+        if suffixes is None:
+            epsilon = Grammar.EPSILON
+            current, result = self._frozen_first(epsilon), [self._frozen_first(epsilon)]
+            for symbol in reversed(self.productions[index].rhs):
+                if symbol == epsilon:
+                    result.append(current)
+                    continue
+                symbol_first = self._frozen_first(symbol)
+                if epsilon not in symbol_first:
+                    current = symbol_first
+                elif epsilon in current:
+                    current = symbol_first | current
+                else:
+                    current = symbol_first - {epsilon} | current
+                result.append(current)
+            result.reverse()
+            suffixes = self._suffix_first[index] = tuple(result)
+        return suffixes
+
+    def _frozen_first(self, symbol: Symbol) -> frozenset:
+        """FIRST de um símbolo como frozenset, um único objeto por símbolo."""
+        frozen = self._frozen
+        if symbol not in frozen:
+            if isinstance(symbol, NonTerminal):
+                frozen[symbol] = frozenset(self.first_sets[symbol])
+            else:  # terminal ou ε
+                frozen[symbol] = frozenset([symbol])
+        return frozen[symbol]
+
+    def _update_production_first(self, indices: Iterable[int]):
+        """(Re)calcula FIRST(rhs) das produções `indices`; descarta os seus sufixos."""
+        epsilon = Grammar.EPSILON
+        production_first, nullable, suffixes = (
+            self._production_first,
+            self._production_nullable,
+            self._suffix_first,
+        )
+        first_sets, frozen = self.first_sets, self._frozen
+        for index in indices:
+            rhs = self.productions[index].rhs
+            head = rhs[0] if rhs else None
+            # O caso comum, um terminal ou não terminal não anulável no início, compartilha
+            # o frozenset do símbolo
+            if isinstance(head, Terminal) or (
+                isinstance(head, NonTerminal) and epsilon not in first_sets[head]
+            ):
+                first, is_nullable = frozen.get(head) or self._frozen_first(head), False
+            else:
+                first = frozenset(self.first_rhs(rhs))
+                is_nullable = epsilon in first
+            if index < len(production_first):
+                production_first[index], nullable[index], suffixes[index] = first, is_nullable, None
+            else:
+                production_first.append(first)
+                nullable.append(is_nullable)
+                suffixes.append(None)
+
+    def _index_productions(self, indices: Iterable[int]):
+        """Acrescenta as produções `indices` aos índices por lado esquerdo e por ocorrência."""
+        for index in indices:
+            prod = self.productions[index]
+            self._by_lhs[prod.lhs].append(index)
+            for symbol in dict.fromkeys(prod.rhs):
+                if isinstance(symbol, NonTerminal):
+                    self._occurrences[symbol].append(index)
+
+    def add_productions(
+        self,
+        productions: list[Production],
+        terminals: list[Terminal] = (),
+        non_terminals: list[NonTerminal] = (),
+    ) -> set[NonTerminal]:
+        """
+        Acrescenta produções (e os terminais e não terminais novos que elas usam) à
+        gramática, atualizando FIRST e FOLLOW de forma incremental: como os conjuntos
+        só crescem, basta propagar o que as produções novas acrescentam, reavaliando
+        apenas as produções que dependem de um conjunto alterado.
+        Os ids dos símbolos são renumerados: um terminal novo entra antes do primeiro
+        terminal que reconhece uma das suas grafias (uma palavra-chave antes do
+        identificador, "<=" antes de "<"), como exige a ordem das regras do léxico;
+        os demais entram no fim, antes de EOF. Se `LL1Table.update` encontrar um
+        conflito, a gramática volta ao estado anterior a esta chamada.
+        :return: não terminais cujas linhas da tabela LL(1) podem ter mudado (ver `LL1Table.update`)
+        """
+        # A atualização parte da análise da gramática antes das produções novas
+        self._analyze()
+        known_terminals, known_non_terminals = set(self.terminals), set(self.non_terminals)
+        new_terminals = [t for t in dict.fromkeys(terminals) if t not in known_terminals]
+        new_non_terminals = [n for n in dict.fromkeys(non_terminals) if n not in known_non_terminals]
+        old = self.terminals, self.non_terminals, self.productions
+        self.terminals = list(self.terminals)
+        for terminal in new_terminals:
+            self.terminals.insert(self.insertion_point(terminal, self.terminals), terminal)
+        self.non_terminals = self.non_terminals + new_non_terminals
+        try:
+            self._validate_productions(productions)
+        except ValueError:
+            self.terminals, self.non_terminals, _ = old
+            raise
+
+        start = len(self.productions)
+        undo = self._last_addition = {
+            "lists": old,
+            "symbols": set(new_terminals) | set(new_non_terminals),
+            "indexed": self._by_lhs is not None,
+            "first": defaultdict(set),
+            "follow": defaultdict(set),
+            "production_first": {},
+        }
+        self.productions = self.productions + list(productions)
+        self._number_symbols()
+        if new_terminals:
+            self._compiled_lexer = None
+        self._ll1_table = None
+        if self._by_lhs is None:
+            self._by_lhs, self._occurrences = defaultdict(list), defaultdict(list)
+            self._index_productions(range(start))
+        added = range(start, len(self.productions))
+        self._index_productions(added)
+        productions, first, follow = self.productions, self.first_sets, self.follow_sets
+
+        # FIRST (com ε para os anuláveis): FIRST(A) ⊇ FIRST(α) para cada A → α, reavaliando
+        # as produções em que aparece um não terminal cujo FIRST cresceu
+        changed_first = set()
+        pending, queued = deque(added), set(added)
+        while pending:
+            index = pending.popleft()
+            queued.discard(index)
+            prod = productions[index]
+            grown = self.first_rhs(prod.rhs) - first[prod.lhs]
+            if grown:
+                first[prod.lhs] |= grown
+                undo["first"][prod.lhs] |= grown
+                changed_first.add(prod.lhs)
+                for dependent in self._occurrences[prod.lhs]:
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        pending.append(dependent)
+
+        # FOLLOW em duas etapas: (1) reavalia os trechos seguintes a cada não terminal
+        # nas produções novas e nas que contêm um não terminal com FIRST alterado;
+        # (2) repassa apenas o que cada FOLLOW(A) ganhou aos não terminais que terminam
+        # produções de A (FOLLOW(B) ⊇ FOLLOW(A)).
+        changed_follow, growth = set(), {}
+
+        def grow(symbol, terminals):
+            grown = terminals - follow[symbol]
+            if grown:
+                follow[symbol] |= grown
+                undo["follow"][symbol] |= grown
+                changed_follow.add(symbol)
+                growth.setdefault(symbol, set()).update(grown)
+
+        seeds = dict.fromkeys(added)
+        for symbol in changed_first:
+            seeds.update(dict.fromkeys(self._occurrences[symbol]))
+        for index in seeds:
+            prod = productions[index]
+            trailer, reaches_end = set(), True
+            for symbol in reversed(prod.rhs):
+                if isinstance(symbol, NonTerminal):
+                    grow(symbol, trailer | follow[prod.lhs] if reaches_end else trailer)
+                    symbol_first = first[symbol] - {Grammar.EPSILON}
+                    if Grammar.EPSILON in first[symbol]:
+                        trailer = trailer | symbol_first
+                    else:
+                        trailer, reaches_end = symbol_first, False
+                elif isinstance(symbol, Terminal):
+                    trailer, reaches_end = {symbol}, False
+        while growth:
+            lhs, grown = growth.popitem()
+            for index in self._by_lhs[lhs]:
+                for symbol in reversed(productions[index].rhs):
+                    if not isinstance(symbol, NonTerminal):
+                        break
+                    grow(symbol, grown)
+                    if Grammar.EPSILON not in first[symbol]:
+                        break
+
+        # FIRST por produção: as novas e as que usam um não terminal com FIRST alterado
+        if self._production_first is not None:
+            stale = set(added)
+            for symbol in changed_first:
+                self._frozen.pop(symbol, None)
+                stale.update(self._occurrences[symbol])
+            undo["production_first"] = {
+                index: (self._production_first[index], self._production_nullable[index], self._suffix_first[index])
+                for index in stale
+                if index < start
+            }
+            self._update_production_first(sorted(stale))
+
+        # Linhas afetadas: produções novas, FOLLOW alterado ou FIRST alterado no prefixo
+        # anulável de um lado direito (o trecho que `first_rhs` percorre)
+        affected = {productions[index].lhs for index in added} | changed_follow
+        for symbol in changed_first:
+            for index in self._occurrences[symbol]:
+                for prefix in productions[index].rhs:
+                    if prefix == symbol:
+                        affected.add(productions[index].lhs)
+                    if isinstance(prefix, Terminal) or Grammar.EPSILON not in first[prefix]:
+                        break
+        undo["changed_first"] = changed_first
+        return affected
+
+    @staticmethod
+    def insertion_point(terminal: Terminal, terminals: list[Terminal]) -> int:
+        """
+        Posição de um terminal novo em `terminals`: antes do primeiro terminal que casa
+        com o início de uma das suas grafias (as palavras de uma palavra-chave ou o
+        lexema fixo). Sem grafia conhecida, ou se nenhum casar, fica no fim (antes de EOF).
+        É a posição usada por `add_productions`; serve para montar a mesma lista de
+        terminais ao construir a gramática de uma vez.
+        """
+        match = CompiledLexer.KEYWORD.fullmatch(terminal.regex)
+        if match is not None:
+            single, alternatives = match.groups()
+            words = [single] if single else alternatives.split("|")
+        else:
+            lexeme = CompiledLexer._fixed_lexeme(terminal.regex)
+            words = [lexeme] if lexeme else []
+        for index, other in enumerate(terminals):
+            if other == Grammar.EOF:
+                return index
+            if any(re.match(other.regex, word) for word in words):
+                return index
+        return len(terminals)
+
+    def _revert_addition(self):
+        """
+        Desfaz o último `add_productions` (chamado por `LL1Table.update` em conflito):
+        listas de símbolos e produções, ids, FIRST, FOLLOW, FIRST por produção e índices.
+        Como os conjuntos só crescem, basta retirar deles o que a adição acrescentou.
+        """
+        undo, self._last_addition = self._last_addition, None
+        if undo is None:
+            return
+        start = len(undo["lists"][2])
+        added = self.productions[start:]
+        self.terminals, self.non_terminals, self.productions = undo["lists"]
+        for sets, key in [(self._first_sets, "first"), (self._follow_sets, "follow")]:
+            for symbol, grown in undo[key].items():
+                sets[symbol] -= grown
+            for symbol in undo["symbols"]:
+                sets.pop(symbol, None)
+        if self._production_first is not None:
+            for index, (first, nullable, suffixes) in undo["production_first"].items():
+                self._production_first[index] = first
+                self._production_nullable[index] = nullable
+                self._suffix_first[index] = suffixes
+            del self._production_first[start:], self._production_nullable[start:], self._suffix_first[start:]
+        for symbol in undo.get("changed_first", set()) | undo["symbols"]:
+            self._frozen.pop(symbol, None)
+        if not undo["indexed"]:
+            self._by_lhs = self._occurrences = None
+        else:
+            for prod in added:
+                lists = [self._by_lhs[prod.lhs]]
+                lists += [self._occurrences[symbol] for symbol in prod.rhs if isinstance(symbol, NonTerminal)]
+                for index_list in lists:
+                    while index_list and index_list[-1] >= start:
+                        index_list.pop()
+            for symbol in undo["symbols"]:
+                self._by_lhs.pop(symbol, None)
+                self._occurrences.pop(symbol, None)
+        self._number_symbols()
+        self._compiled_lexer = None
+        self._ll1_table = None
+
+    @staticmethod
+    def _replace_leaf(derivation: tuple, position: int, replacement) -> tuple[tuple, int]:
+        """
+        Substitui a `position`-ésima folha (símbolo mantido no lado direito) do molde
+        `derivation` por `replacement`; retorna o novo molde e -1, ou o molde intacto e
+        quantas folhas ainda faltam percorrer.
+        """
+        production, slots = derivation
+        slots = list(slots)
+        for i, slot in enumerate(slots):
+            if slot is None:
+                if position == 0:
+                    slots[i] = replacement
+                    return (production, tuple(slots)), -1
+                position -= 1
+            elif slot is not Grammar.EPSILON:
+                slots[i], position = Grammar._replace_leaf(slot, position, replacement)
+                if position < 0:
+                    return (production, tuple(slots)), -1
+        return derivation, position
+
+    @staticmethod
+    def _inline(rhs: list, origin: tuple, position: int, inlined: tuple) -> tuple[list, tuple]:
+        """Embute a produção (lhs, rhs, molde) `inlined` na posição `position` de `rhs`."""
+        _, inlined_rhs, inlined_origin = inlined
+        if inlined_rhs == [Grammar.EPSILON]:
+            # ε some do lado direito; o molde ainda recria a folha ε
+            inlined_rhs = []
+            inlined_origin = Grammar._replace_leaf(inlined_origin, 0, Grammar.EPSILON)[0]
+        new_rhs = rhs[:position] + inlined_rhs + rhs[position + 1 :]
+        return new_rhs, Grammar._replace_leaf(origin, position, inlined_origin)[0]
+
+    def inline_units(self) -> "Grammar":
+        """
+        Retorna uma gramática equivalente, mais rasa:
+        - produções unitárias A → B são trocadas pelas produções de B;
+        - não terminais com uma única produção, usados uma única vez, são embutidos no
+          lado direito de quem os usa.
+        As duas transformações preservam a propriedade LL(1); o parser dá menos passos e
+        a árvore de derivação tem menos nós. Em `origins`, cada produção nova guarda o
+        molde da derivação original, uma tupla (produção, filhos) em que cada filho é
+        None (símbolo mantido), ε (folha ε removida) ou outro molde (não terminal
+        embutido); `expand` o usa para reconstruir a árvore da gramática original.
+        """
+        work = [(prod.lhs, list(prod.rhs), (prod, (None,) * len(prod.rhs))) for prod in self.productions]
+        inlined = set()
+        changed = True
+        while changed:
+            changed = False
+            by_lhs, uses = defaultdict(list), defaultdict(list)
+            for index, (lhs, rhs, _) in enumerate(work):
+                by_lhs[lhs].append(index)
+                for symbol in rhs:
+                    if isinstance(symbol, NonTerminal):
+                        uses[symbol].append(index)
+            # Não terminais embutidos que deixaram de ser usados saem da gramática
+            unused = {lhs for lhs in inlined if not uses[lhs] and lhs != self.start_symbol}
+            if unused:
+                work = [item for item in work if item[0] not in unused]
+                inlined -= unused
+                changed = True
+                continue
+
+            for index, (lhs, rhs, origin) in enumerate(work):
+                if len(rhs) == 1 and isinstance(rhs[0], NonTerminal) and rhs[0] != lhs:
+                    target = rhs[0]
+                    work[index : index + 1] = [
+                        (lhs, *self._inline(rhs, origin, 0, work[other])) for other in by_lhs[target]
+                    ]
+                    inlined.add(target)
+                    changed = True
+                    break
+            if changed:
+                continue
+
+            for symbol, indices in by_lhs.items():
+                users = uses[symbol]
+                if symbol == self.start_symbol or len(indices) != 1 or len(users) != 1:
+                    continue
+                user = users[0]
+                if user == indices[0]:  # recursivo
+                    continue
+                lhs, rhs, origin = work[user]
+                work[user] = (lhs, *self._inline(rhs, origin, rhs.index(symbol), work[indices[0]]))
+                inlined.add(symbol)
+                changed = True
+                break
+
+        used = {lhs for lhs, _, _ in work}
+        used.update(symbol for _, rhs, _ in work for symbol in rhs if isinstance(symbol, NonTerminal))
+        result = Grammar(
+            start_symbol=self.start_symbol,
+            terminals=self.terminals,
+            non_terminals=[symbol for symbol in self.non_terminals if symbol in used],
+            productions=[Production(lhs, rhs) for lhs, rhs, _ in work],
+        )
+        result.origins = [origin for _, _, origin in work]
+        return result
+
+    @staticmethod
+    def _rebuild(derivation: tuple, leaves: Iterator[TreeNode]) -> list[TreeNode]:
+        """Filhos da produção do molde, recriando os nós embutidos e reaproveitando `leaves`."""
+        production, slots = derivation
+        children = []
+        for symbol, slot in zip(production.rhs, slots):
+            if slot is None:
+                children.append(next(leaves))
+            elif slot is Grammar.EPSILON:
+                children.append(TreeNode(Grammar.EPSILON))
+            else:
+                children.append(TreeNode(symbol, children=Grammar._rebuild(slot, leaves)))
+        return children
+
+    def expand(self, root: TreeNode) -> TreeNode:
+        """
+        Reconstrói, em `root` (uma árvore de derivação desta gramática), a árvore da
+        gramática original de `inline_units`: os nós dos não terminais embutidos são
+        recriados e os demais nós, reaproveitados. Sem `origins`, não altera a árvore.
+        """
+        if self.origins is None:
+            return root
+        templates = {
+            (prod.lhs, tuple(prod.rhs)): origin
+            for prod, origin in zip(self.productions, self.origins)
+            if any(slot is not None for slot in origin[1])
+        }
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            children = node.children
+            pending.extend(child for child in children if isinstance(child.name, NonTerminal))
+            rhs = tuple(
+                child.name.terminal if isinstance(child.name, Token) else child.name
+                for child in children
+            )
+            template = templates.get((node.name, rhs))
+            if template is not None:
+                node.children = self._rebuild(template, iter(children))
+                for child in node.children:
+                    child.parent = node
+        return root
+
+
+class GrammarCache:
+    """
+    Cache em disco da análise de uma gramática: conjuntos FIRST e FOLLOW e tabela LL(1).
+    Cada instantâneo é um arquivo `marshal` (embutido no interpretador, sem custo de
+    importação) nomeado pelo hash do conteúdo da gramática (símbolo inicial,
+    terminais, não terminais e produções, em ordem) e da versão do Python. Símbolos e
+    produções são gravados pelos seus ids (ver `Grammar._number_symbols`), de modo
+    que a carga devolve os próprios objetos da gramática. Falhas de leitura ou escrita apenas desativam o cache.
+    """
+
+    # Incrementar quando o formato ou o cálculo da análise mudar
+    VERSION = 2
+    ENV = "TURTLE_SCRIPT_CACHE"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @staticmethod
+    def default_directory() -> str | None:
+        """Diretório de `$TURTLE_SCRIPT_CACHE`, ou None (cache desligado) se ausente ou vazio."""
+        return os.environ.get(GrammarCache.ENV) or None
+
+    @staticmethod
+    def key(grammar: Grammar) -> str:
+        """Hash do conteúdo da gramática."""
+
+        def describe(symbol):
+            return (type(symbol).__name__, symbol.name, getattr(symbol, "regex", None))
+
+        content = (
+            GrammarCache.VERSION,
+            sys.version_info[:2],  # o formato do `marshal` depende da versão
+            describe(grammar.start_symbol),
+            [describe(terminal) for terminal in grammar.terminals],
+            [describe(non_terminal) for non_terminal in grammar.non_terminals],
+            [(describe(p.lhs), [describe(s) for s in p.rhs]) for p in grammar.productions],
+        )
+        return hashlib.sha256(repr(content).encode("utf-8")).hexdigest()
+
+    def path(self, grammar: Grammar) -> str:
+        return os.path.join(self.directory, f"grammar-{self.key(grammar)}.marshal")
+
+    def load(self, grammar: Grammar) -> tuple[dict, dict, dict | None] | None:
+        """Retorna (FIRST, FOLLOW, tabela LL(1) ou None) do cache, ou None se ausente."""
+        try:
+            with open(self.path(grammar), "rb") as f:
+                snapshot = marshal.loads(f.read())
+            symbols = grammar.symbols
+
+            def sets(entries):
+                return defaultdict(
+                    set, {symbols[key]: {symbols[i] for i in values} for key, values in entries}
+                )
+
+            first, follow = sets(snapshot["first"]), sets(snapshot["follow"])
+            table = snapshot["table"]
+            if table is not None:
+                table = {(lhs, terminal): prod for lhs, terminal, prod in table}
+            return first, follow, table
+        except (OSError, EOFError, ValueError, KeyError, IndexError, TypeError):
+            return None
+
+    def store(self, grammar: Grammar):
+        """Grava a análise da gramática (a tabela LL(1) é construída aqui)."""
+        try:
+            table = LL1Table._build_table(grammar)
+        except ValueError:  # gramática não LL(1): só FIRST e FOLLOW vão para o cache
+            table = None
+        grammar._ll1_table = table
+        ids = grammar.symbol_ids
+
+        def sets(mapping):
+            return [(ids[key], [ids[s] for s in values]) for key, values in mapping.items()]
+
+        snapshot = {
+            "first": sets(grammar.first_sets),
+            "follow": sets(grammar.follow_sets),
+            "table": None
+            if table is None
+            else [(lhs, terminal, prod) for (lhs, terminal), prod in table.items()],
+        }
+        path = self.path(grammar)
+        # Escrita atômica: outro processo nunca lê um instantâneo pela metade
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, "wb") as f:
+                marshal.dump(snapshot, f)
+            os.replace(temporary, path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+
+class Source:
+    """
+    Texto-fonte de uma tokenização, compartilhado pelos seus tokens.
+    O texto pode ser um `str` ou bytes (ex: o `mmap` de um arquivo); neste caso os
+    deslocamentos são em bytes e os lexemas só são decodificados quando solicitados.
+    O índice de inícios de linha só é construído na primeira consulta de posição.
+    """
+
+    __slots__ = ("text", "encoding", "_line_starts")
+
+    def __init__(self, text, encoding: str = "utf-8"):
+        self.text = text
+        self.encoding = encoding
+        self._line_starts = None
+
+    def slice(self, start: int, end: int) -> str:
+        """Trecho [start, end) da fonte, decodificado se a fonte for bytes."""
+        text = self.text[start:end]
+        if isinstance(text, str):
+            return text
+        return text.decode(self.encoding, "replace")
+
+    def line_starts(self) -> list[int]:
+        """Deslocamentos em que cada linha começa."""
+        if self._line_starts is None:
+            newline = "\n" if isinstance(self.text, str) else b"\n"
+            self._line_starts = [0] + [match.end() for match in re.finditer(newline, self.text)]
+        return self._line_starts
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        """Converte um deslocamento em (linha, coluna), ambas a partir de 1."""
+        line_starts = self.line_starts()
+        line = bisect_right(line_starts, offset) - 1
+        if isinstance(self.text, str):
+            return line + 1, offset - line_starts[line] + 1
+        # Em bytes, a coluna conta caracteres decodificados, não bytes
+        return line + 1, len(self.slice(line_starts[line], offset)) + 1
+
 
 class Token:
-    def __init__(self, terminal: Terminal, lexeme: str):
+    """
+    Token com `__slots__`: terminal, deslocamentos [start, end) na fonte e o lexema,
+    que só é recortado do texto-fonte quando solicitado.
+    """
+
+    __slots__ = ("terminal", "start", "end", "source", "_lexeme")
+
+    def __init__(
+        self,
+        terminal: Terminal,
+        lexeme: str = None,
+        start: int = -1,
+        end: int = -1,
+        source: Source = None,
+    ):
         self.terminal = terminal
-        self.lexeme = lexeme
+        self._lexeme = lexeme
+        self.start, self.end = start, end
+        self.source = source
+
+    @property
+    def lexeme(self) -> str:
+        lexeme = self._lexeme
+        if lexeme is None:
+            lexeme = self._lexeme = self.source.slice(self.start, self.end)
+        return lexeme
+
+    @property
+    def location(self) -> tuple[int, int] | None:
+        """(linha, coluna) do início do token, ou None se não houver fonte."""
+        if self.source is None:
+            return None
+        return self.source.line_col(self.start)
 
     def __repr__(self):
         return f"Token({self.terminal.name}, '{self.lexeme}')"
@@ -206,151 +1045,1264 @@ class Token:
         return hash((self.terminal, self.lexeme))
 
 
+class TokenArray(Sequence):
+    """
+    Sequência compacta de tokens de uma fonte.
+    Guarda apenas o índice do terminal e os deslocamentos [start, end) de cada token
+    em arrays; os objetos `Token` são criados somente quando acessados. Terminais de
+    grafia única compartilham um mesmo lexema e os lexemas de identificadores são
+    internados (`sys.intern`), de modo que ocorrências iguais usam o mesmo objeto.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        terminals: list[Terminal],
+        lexemes: list[str | None] = None,
+        identifiers: frozenset[int] = frozenset(),
+    ):
+        self.source = source
+        self.terminals = terminals  # índice → Terminal
+        self.lexemes = lexemes if lexemes is not None else [None] * len(terminals)
+        self.identifiers = identifiers  # índices dos terminais com lexemas internados
+        offset = "I" if len(source.text) < 2**32 else "Q"
+        self.kinds = array("H")
+        self.starts = array(offset)
+        self.ends = array(offset)
+
+    def append(self, kind: int, start: int, end: int):
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def token(self, kind: int, start: int, end: int) -> Token:
+        """Cria o `Token` de uma ocorrência, com o lexema compartilhado quando possível."""
+        lexeme = self.lexemes[kind]
+        if lexeme is None and kind in self.identifiers:
+            lexeme = sys.intern(self.source.slice(start, end))
+        return Token(self.terminals[kind], lexeme, start, end, self.source)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.token(self.kinds[index], self.starts[index], self.ends[index])
+
+    def __iter__(self):
+        token = self.token
+        for kind, start, end in zip(self.kinds, self.starts, self.ends):
+            yield token(kind, start, end)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TokenArray({list(self)})"
+
+
+def _is_word(char: str) -> bool:
+    """Equivale à classe `\\w` do módulo `re` para um caractere."""
+    return char.isalnum() or char == "_"
+
+
+# Bytes da classe `\\w` em padrões bytes (ASCII): `text[i]` de bytes/mmap é um int
+_WORD_BYTES = frozenset(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz")
+
+
+class CompiledLexer:
+    """
+    Analisador léxico compilado de uma gramática.
+    Guarda o regex mestre já compilado, o vetor grupo→terminal e o padrão dos
+    trechos descartados (espaços em branco e comentários), para que a tokenização
+    não precise reconstruí-los a cada chamada.
+    """
+
+    # Trechos descartados entre tokens: espaços em branco e comentários de linha.
+    # São pulados pela própria varredura, sem uma cópia da fonte sem comentários.
+    SKIP_RULES = (r"\s+", r"//[^\n]*")
+    SKIP = "(?:" + "|".join(SKIP_RULES) + ")"
+    # Terminais de palavra-chave: `\bpalavra\b` ou `\b(palavra|outra)\b`
+    KEYWORD = re.compile(r"\\b(?:(\w+)|\(((?:\w+\|)*\w+)\))\\b")
+    # Terminais de grafia única: literal (pontuação escapada), opcionalmente `\b(...)\b`
+    LITERAL = re.compile(r"(?:\\b)?\(?((?:[^\\.^$*+?{}\[\]|()]|\\\W)+)\)?(?:\\b)?")
+
+    def __init__(self, grammar: Grammar, keyword_table: bool = True):
+        # O índice de cada regra é o id do terminal na gramática. EOF (o último) não é
+        # produzido pela varredura: o parser o assume ao fim dos tokens
+        terminals = grammar.symbols[: grammar.n_terminals - 1]
+        self.rules = terminals
+        # Palavras-chave classificadas por tabela saem do regex mestre
+        table = self._keyword_table(terminals)
+        keywords = table if keyword_table else {}
+        classified = {keyword for keyword, _ in keywords.values()}
+        scanned = [terminal for terminal in terminals if terminal not in classified]
+        master = "|".join(f"(?P<{terminal.name}>{terminal.regex})" for terminal in scanned)
+        # Regex mestre precedido pelos trechos a descartar: uma única chamada de
+        # `match(text, pos)` pula espaços e comentários e reconhece o token. O
+        # `(?=(...*))\1` os consome de forma atômica, sem devolvê-los a terminais como `\n`.
+        self.pattern = re.compile(rf"(?=({self.SKIP}*))\1(?:{master})")
+        # Índice do grupo nomeado (match.lastindex) → índice do terminal em `rules`
+        rule_ids = {terminal: rule for rule, terminal in enumerate(terminals)}
+        self.group_rules: list[int] = [-1] * (self.pattern.groups + 1)
+        for terminal in scanned:
+            self.group_rules[self.pattern.groupindex[terminal.name]] = rule_ids[terminal]
+        # Índice do grupo → {lexema: palavra-chave}, para os terminais do tipo identificador
+        self.keywords: list[dict[str, int] | None] = [None] * (self.pattern.groups + 1)
+        for word, (keyword, identifier) in keywords.items():
+            index = self.pattern.groupindex[identifier.name]
+            if self.keywords[index] is None:
+                self.keywords[index] = {}
+            self.keywords[index][word] = rule_ids[keyword]
+        # Lexemas compartilhados pelos tokens: um por terminal de grafia única
+        self.lexemes = [self._fixed_lexeme(terminal.regex) for terminal in terminals]
+        self.identifiers = frozenset(rule_ids[identifier] for _, identifier in table.values())
+        self.skip = re.compile(self.SKIP + "+")
+        self.is_word = _is_word
+        self._dfa = None
+        self._encoded = None
+
+    @staticmethod
+    def _keyword_table(terminals: list[Terminal]) -> dict[str, tuple[Terminal, Terminal]]:
+        """
+        Deriva a tabela de palavras-chave: lexema → (palavra-chave, terminal identificador).
+        Uma palavra só é classificada por tabela quando o resultado é garantidamente o
+        mesmo do regex mestre: o primeiro terminal comum que casa com ela (o
+        identificador) vem depois da palavra-chave e reconhece a palavra inteira.
+        Palavras-chave que não se encaixam continuam no regex mestre.
+        """
+        words = {}
+        for keyword in terminals:
+            match = CompiledLexer.KEYWORD.fullmatch(keyword.regex)
+            if match is not None:
+                single, alternatives = match.groups()
+                for word in [single] if single else alternatives.split("|"):
+                    words.setdefault(word, keyword)
+        keyword_terminals = set(words.values())
+        others = [terminal for terminal in terminals if terminal not in keyword_terminals]
+        position = {terminal: index for index, terminal in enumerate(terminals)}
+
+        table = {}
+        for word, keyword in words.items():
+            identifier = next(
+                (terminal for terminal in others if re.match(terminal.regex, word)), None
+            )
+            if (
+                identifier is not None
+                and position[keyword] < position[identifier]
+                and re.fullmatch(identifier.regex, word)
+            ):
+                table[word] = (keyword, identifier)
+        # Um terminal de palavra-chave só sai do regex mestre se todas as suas palavras saírem
+        incomplete = {keyword for word, keyword in words.items() if word not in table}
+        return {word: entry for word, entry in table.items() if entry[0] not in incomplete}
+
+    @staticmethod
+    def _fixed_lexeme(regex: str) -> str | None:
+        """Lexema (internado) de um terminal cujo regex admite uma única grafia, ou None."""
+        match = CompiledLexer.LITERAL.fullmatch(regex)
+        if match is None:
+            return None
+        lexeme = re.sub(r"\\(.)", r"\1", match.group(1))
+        return sys.intern(lexeme) if re.fullmatch(regex, lexeme) else None
+
+    @staticmethod
+    def of(grammar: Grammar) -> "CompiledLexer":
+        """Retorna o léxico compilado da gramática, construindo-o apenas na primeira chamada."""
+        lexer = grammar._compiled_lexer
+        if lexer is None:
+            lexer = grammar._compiled_lexer = CompiledLexer(grammar)
+        return lexer
+
+    def dfa(self):
+        """Retorna o AFD dos terminais (motor "dfa"), construindo-o na primeira chamada."""
+        if self._dfa is None:
+            self._dfa = DFALexer([terminal.regex for terminal in self.rules], self.SKIP_RULES)
+        return self._dfa
+
+    def encoded(self) -> "CompiledLexer":
+        """
+        Retorna a versão do léxico para fontes em bytes (ex: `mmap`), construída na
+        primeira chamada. Os padrões são compilados em bytes, com `\\d`, `\\w`, `\\s` e
+        `\\b` restritos ao ASCII; os grupos são os mesmos e `group_rules` continua válido.
+        """
+        if self._encoded is None:
+            lexer = copy.copy(self)
+            lexer.pattern = re.compile(self.pattern.pattern.encode("utf-8"))
+            lexer.skip = re.compile(self.skip.pattern.encode("utf-8"))
+            lexer.keywords = [
+                None if table is None else {word.encode(): rule for word, rule in table.items()}
+                for table in self.keywords
+            ]
+            lexer.is_word = _WORD_BYTES.__contains__
+            lexer._dfa = None
+            lexer._encoded = lexer
+            self._encoded = lexer
+        return self._encoded
+
+
 class Tokenizer:
+    ENGINES = ("regex", "dfa")
+
     def __init__(self):
         super().__init__()
 
     @staticmethod
-    def tokenize(text: str, grammar: Grammar) -> list[Token]:
-        """Tokeniza o texto de entrada usando a gramática fornecida."""
-        tokens = []
-        # Ignorar comentários
-        comment_pattern = r"//.*?$"
-        text = re.sub(comment_pattern, "", text, flags=re.MULTILINE)
-
-        # Construir o regex de tokenização
-        token_patterns = [
-            (token.name, token.regex)
-            for token in grammar.terminals
-            if isinstance(token, Terminal)
-        ]
-        token_regex = "|".join(f"(?P<{pair[0]}>{pair[1]})" for pair in token_patterns)
-        match_token = re.compile(token_regex).match
-        # Tokenização:
-        position, line_number = 0, 1
-        terminals = Tokenizer._get_terminals(grammar)
-        while position < len(text):
-            # Pular espaços em branco
-            ws_match = re.match(r"\s+", text[position:])
-            if ws_match:
-                ws = ws_match.group(0)
-                line_number += ws.count("\n")
-                position += len(ws)
-                continue
-            match = match_token(text, position)
-            if match is None:
-                snippet = text[position : position + 10]
-                raise RuntimeError(
-                    f"Erro de tokenização na linha {line_number}, posição {position}, trecho: '{snippet}'"
-                )
-            position = match.end()
-            token_type = match.lastgroup
-            lexeme = match.group(token_type)
-            tokens.append(Token(terminals.get(token_type), lexeme=lexeme))
+    def tokenize(text: str, grammar: Grammar, engine: str = "regex") -> TokenArray:
+        """
+        Tokeniza o texto de entrada usando a gramática fornecida.
+        :param engine: "regex" (regex mestre do módulo `re`) ou "dfa" (AFD dirigido por tabela)
+        """
+        Tokenizer._check_engine(engine)
+        return Tokenizer._tokenize(text, CompiledLexer.of(grammar), engine)
+
+    @staticmethod
+    def tokenize_file(path, grammar: Grammar, encoding: str = "utf-8") -> TokenArray:
+        """
+        Tokeniza um arquivo sem lê-lo para a memória: a varredura ocorre sobre um
+        `mmap` do arquivo em bytes, com o regex mestre compilado em bytes. Os
+        deslocamentos dos tokens são em bytes e os lexemas são decodificados sob demanda.
+        :param encoding: codificação do arquivo (compatível com ASCII, ex: "utf-8")
+        """
+        source = Tokenizer._map_file(path, encoding)
+        lexer = CompiledLexer.of(grammar).encoded()
+        tokens = TokenArray(source, lexer.rules, lexer.lexemes, lexer.identifiers)
+        append = tokens.append
+        for rule, start, end in Tokenizer._scan_regex(source, lexer):
+            append(rule, start, end)
         return tokens
 
     @staticmethod
-    def _get_terminals(grammar: Grammar) -> dict[str, Terminal]:
-        """Retorna um dicionário de terminais da gramática."""
-        return {
-            terminal.name: terminal
-            for terminal in grammar.terminals
-            if isinstance(terminal, Terminal)
-        }
+    def iter_tokens(text_or_file, grammar: Grammar, engine: str = "regex") -> Iterator[Token]:
+        """
+        Gera os tokens sob demanda, sem materializar a lista completa.
+        :param text_or_file: texto-fonte, arquivo aberto em modo texto ou caminho
+            (`os.PathLike`) de um arquivo, varrido via `mmap` como em `tokenize_file`
+        """
+        Tokenizer._check_engine(engine)
+        lexer = CompiledLexer.of(grammar)
+        if isinstance(text_or_file, os.PathLike):
+            if engine != "regex":
+                raise ValueError(f"O motor léxico '{engine}' não aceita arquivos mapeados")
+            source = Tokenizer._map_file(text_or_file)
+            lexer = lexer.encoded()
+        else:
+            text = text_or_file if isinstance(text_or_file, str) else text_or_file.read()
+            source = Source(text)
+        token = TokenArray(source, lexer.rules, lexer.lexemes, lexer.identifiers).token
+        return (
+            token(rule, start, end) for rule, start, end in Tokenizer._scan(source, lexer, engine)
+        )
+
+    @staticmethod
+    def _map_file(path, encoding: str = "utf-8") -> Source:
+        """Mapeia o arquivo em memória (somente leitura) como fonte em bytes."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return Source(b"", encoding)  # arquivos vazios não podem ser mapeados
+            # O mapeamento permanece válido após o fechamento do arquivo
+            return Source(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), encoding)
+
+    @staticmethod
+    def _check_engine(engine: str):
+        if engine not in Tokenizer.ENGINES:
+            raise ValueError(f"Motor léxico desconhecido: '{engine}'")
+
+    @staticmethod
+    def _tokenize(text: str, lexer: CompiledLexer, engine: str = "regex") -> TokenArray:
+        source = Source(text)
+        tokens = TokenArray(source, lexer.rules, lexer.lexemes, lexer.identifiers)
+        append = tokens.append
+        for rule, start, end in Tokenizer._scan(source, lexer, engine):
+            append(rule, start, end)
+        return tokens
+
+    @staticmethod
+    def _scan(source: Source, lexer: CompiledLexer, engine: str) -> Iterator[tuple[int, int, int]]:
+        """Gera (índice do terminal, início, fim) para cada token da fonte."""
+        if engine == "dfa":
+            return Tokenizer._scan_dfa(source, lexer)
+        return Tokenizer._scan_regex(source, lexer)
+
+    @staticmethod
+    def _scan_regex(
+        source: Source, lexer: CompiledLexer, start: int = 0
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        Varredura pelo regex mestre, com palavras-chave classificadas por tabela.
+        :param start: posição inicial da varredura (início de um token ou de um trecho descartado)
+        """
+        text = source.text
+        scan, match_skip = lexer.pattern.match, lexer.skip.match
+        group_rules, keywords, is_word = lexer.group_rules, lexer.keywords, lexer.is_word
+        # Tokenização: cada `scan(text, position)` casa no próprio texto, sem copiá-lo
+        position, length = start, len(text)
+        while position < length:
+            match = scan(text, position)
+            if match is None:
+                # Sobraram apenas espaços e comentários, ou há um trecho inválido
+                skip_match = match_skip(text, position)
+                if skip_match is None:
+                    raise Tokenizer._error(source, position)
+                position = skip_match.end()
+                continue
+            index = match.lastindex
+            start, position = match.start(index), match.end()
+            rule, table = group_rules[index], keywords[index]
+            if table is not None:
+                keyword = table.get(text[start:position])
+                # Mesmas fronteiras `\b` que o regex da palavra-chave exigiria
+                if (
+                    keyword is not None
+                    and not (start and is_word(text[start - 1]))
+                    and not (position < length and is_word(text[position]))
+                ):
+                    rule = keyword
+            yield rule, start, position
+
+    @staticmethod
+    def _scan_dfa(source: Source, lexer: CompiledLexer) -> Iterator[tuple[int, int, int]]:
+        """Varredura pelo AFD: mesmos tokens do motor regex, em um laço de transições."""
+        try:
+            yield from lexer.dfa().scan(source.text)
+        except LexError as error:
+            raise Tokenizer._error(source, error.position) from None
+
+    @staticmethod
+    def _error(source: Source, position: int) -> RuntimeError:
+        """Monta o erro de tokenização; linha e coluna só são calculadas aqui."""
+        line_number, column = source.line_col(position)
+        snippet = source.slice(position, position + 10)
+        return RuntimeError(
+            f"Erro de tokenização na linha {line_number}, coluna {column} (posição {position}), trecho: '{snippet}'"
+        )
 
 
 class LL1Table:
+    """
+    Tabela LL(1) densa sobre os ids dos símbolos (ver `Grammar._number_symbols`).
+    `cells[(A - n_terminals) * n_columns + t]` guarda o índice em `grammar.productions`
+    da produção de A com lookahead t, ou -1. A última coluna representa terminais
+    desconhecidos pela gramática e fica sempre vazia.
+    """
+
     def __init__(self, grammar: Grammar):
         self.grammar = grammar
-        self.table = self._build_table()
+        # Tabela já calculada (cache em disco, ver GrammarCache) ou construída agora
+        grammar._analyze()
+        cached = grammar._ll1_table
+        entries = cached if cached is not None else self._build_table(grammar)
+        self.cells = self._layout()
+        for (lhs, terminal), prod in entries.items():
+            self.cells[self.offsets[lhs] + terminal] = prod
+        # Dicionário de `table`, com as `cells` de que foi montado
+        self._table = None
+
+    def _layout(self) -> array:
+        """Dimensiona a tabela para a numeração atual da gramática; retorna células vazias."""
+        grammar = self.grammar
+        # Terminais de cada coluna, para realinhar as colunas em `update`
+        self._columns = grammar.symbols[: grammar.n_terminals]
+        self.n_columns = grammar.n_terminals + 1
+        self.n_rows = len(grammar.symbols) - grammar.n_terminals - 1
+        # Início da linha de cada símbolo em `cells` (terminais não têm linha)
+        self.offsets = array("i", [0]) * len(grammar.symbols)
+        for row, lhs in enumerate(range(grammar.n_terminals, len(grammar.symbols) - 1)):
+            self.offsets[lhs] = row * self.n_columns
+        typecode = "h" if len(grammar.productions) < 2**15 else "i"
+        return array(typecode, [-1]) * (self.n_rows * self.n_columns)
+
+    def update(self, non_terminals: Iterable[NonTerminal]):
+        """
+        Atualiza a tabela após `Grammar.add_productions`, recalculando apenas as linhas de
+        `non_terminals` (o retorno de `add_productions`). As demais linhas são mantidas,
+        com as colunas realinhadas se houver terminais novos (que podem entrar no meio
+        dos antigos). Conflitos lançam ValueError sem alterar a tabela e desfazem a
+        última adição à gramática.
+        """
+        grammar, non_terminals = self.grammar, set(non_terminals)
+        by_lhs = grammar._by_lhs or {}
+        indices = [index for lhs in non_terminals for index in by_lhs.get(lhs, ())]
+        try:
+            entries = self._build_table(grammar, indices)
+        except ValueError:
+            grammar._revert_addition()
+            raise
+        grammar._last_addition = None
+
+        old_cells, old_columns, old_rows, old_terminals = self.cells, self.n_columns, self.n_rows, self._columns
+        cells = self._layout()
+        if old_cells.typecode != cells.typecode:
+            old_cells = array(cells.typecode, old_cells)
+        if self._columns == old_terminals:
+            cells[: len(old_cells)] = old_cells
+        else:
+            # Cada coluna antiga vai para o novo id do seu terminal; as linhas novas ficam no fim
+            n_columns, ids, end = self.n_columns, grammar.symbol_ids, old_rows * self.n_columns
+            for column, terminal in enumerate(old_terminals):
+                cells[ids[terminal] : end : n_columns] = old_cells[column::old_columns]
+        empty = array(cells.typecode, [-1]) * self.n_columns
+        for lhs in non_terminals:
+            offset = self.offsets[grammar.symbol_ids[lhs]]
+            cells[offset : offset + self.n_columns] = empty
+        for (lhs, terminal), prod in entries.items():
+            cells[self.offsets[lhs] + terminal] = prod
+        self.cells = cells
+
+    def lookup(self, non_terminal: int, terminal: int) -> int:
+        """Índice da produção para os ids (não terminal, terminal), ou -1."""
+        return self.cells[self.offsets[non_terminal] + terminal]
+
+    def lookup_arrays(self) -> tuple[array, array, array | None]:
+        """(offsets, valores, check) para o driver: sem `check`, toda célula pertence à sua linha."""
+        return self.offsets, self.cells, None
+
+    @property
+    def nbytes(self) -> int:
+        return self.cells.itemsize * len(self.cells) + self.offsets.itemsize * len(self.offsets)
+
+    def compress(self) -> "CompressedLL1Table":
+        return CompressedLL1Table.from_table(self)
+
+    @property
+    def table(self) -> dict[tuple[NonTerminal, Terminal], Production]:
+        """
+        A tabela como dicionário (não_terminal, terminal) → produção, montado no primeiro
+        acesso e reaproveitado até `update` trocar `cells`. O dicionário é compartilhado
+        entre os acessos: não o altere. Para consultas avulsas, use `lookup`.
+        """
+        cached = self._table
+        if cached is None or cached[0] is not self.cells:
+            symbols, productions = self.grammar.symbols, self.grammar.productions
+            n_terminals, n_columns = self.grammar.n_terminals, self.n_columns
+            table = {
+                (symbols[n_terminals + index // n_columns], symbols[index % n_columns]): productions[prod]
+                for index, prod in enumerate(self.cells)
+                if prod >= 0
+            }
+            cached = self._table = (self.cells, table)
+        return cached[1]
 
-    def _build_table(self):
+    @staticmethod
+    def _build_table(grammar: Grammar, indices: Iterable[int] = None) -> dict[tuple[int, int], int]:
         """
-        Constrói a tabela LL(1) para a gramática fornecida.
-        Retorna um dicionário onde as chaves são tuplas (não_terminal, terminal)
-        e os valores são as produções correspondentes.
+        Constrói a tabela LL(1) para a gramática fornecida (ou apenas as entradas das
+        produções `indices`, que devem incluir todas as produções dos seus lados esquerdos).
+        Retorna um dicionário onde as chaves são tuplas (id do não_terminal, id do terminal)
+        e os valores são os índices das produções correspondentes.
         Se uma célula já estiver preenchida, lança um erro.
         """
 
         table = dict()
+        ids = grammar.symbol_ids
+        production_first, nullable = grammar.production_first, grammar.production_nullable
+
+        def insert(lhs, terminal, index):
+            key = (ids[lhs], ids[terminal])
+            if key in table:
+                filled_index = table[key]
+                prod, filled = grammar.productions[index], grammar.productions[filled_index]
+                # Origem de cada entrada: FIRST do lado direito ou FOLLOW(lhs) (anulável)
+                kinds = [
+                    "FIRST" if terminal in production_first[i] else "FOLLOW" for i in (filled_index, index)
+                ]
+                error = (
+                    f"Erro: célula '({lhs}, {terminal})' já preenchida com '{filled}' ao tentar "
+                    f"inserir '{prod}' (conflito {kinds[0]}/{kinds[1]})."
+                )
+                raise ValueError(error)
+            table[key] = index
+
+        if indices is None:
+            indices = range(len(grammar.productions))
+        follow, epsilon = grammar.follow_sets, Grammar.EPSILON
+        for index in indices:
+            lhs = grammar.productions[index].lhs
+            for terminal in production_first[index]:
+                if terminal != epsilon:
+                    insert(lhs, terminal, index)
+            if nullable[index]:
+                for terminal in follow[lhs]:
+                    insert(lhs, terminal, index)
+        return table
 
-        def raise_error(lhs, terminal, prod):
-            error = f"Erro: célula '({lhs}, {terminal})' já preenchida com '{table[(lhs, terminal)]}' ao tentar inserir '{prod}'."
-            raise ValueError(error)
 
-        for prod in self.grammar.productions:
-            lhs, rhs = prod.lhs, prod.rhs
-            first_of_rhs = self.grammar.first_rhs(rhs)
-            for terminal in first_of_rhs:
-                if terminal != Grammar.EPSILON:
-                    if (lhs, terminal) in table:
-                        raise_error(lhs, terminal, prod)
-                    table[(lhs, terminal)] = prod
-            if Grammar.EPSILON in first_of_rhs:
-                for terminal in self.grammar.follow_sets[lhs]:
-                    if (lhs, terminal) in table:
-                        raise_error(lhs, terminal, prod)
-                    table[(lhs, terminal)] = prod
-        return table
+class CompressedLL1Table:
+    """
+    Tabela LL(1) comprimida por deslocamento de linhas (row displacement).
+    As linhas da tabela densa são sobrepostas em um único vetor `values`, a linha do
+    não terminal A começando em `offsets[A]`, sem que células preenchidas colidam;
+    `check[i]` guarda o id do não terminal dono da posição i (-1 se livre). A consulta
+    continua O(1): `values[offsets[A] + t]` se `check[offsets[A] + t] == A`, senão -1.
+    """
 
+    def __init__(self, grammar: Grammar, offsets: array, values: array, check: array):
+        self.grammar = grammar
+        self.n_columns = grammar.n_terminals + 1
+        self.offsets, self.values, self.check = offsets, values, check
+
+    @classmethod
+    def from_table(cls, table: LL1Table) -> "CompressedLL1Table":
+        """Comprime a tabela densa: as linhas mais cheias são posicionadas primeiro (first fit)."""
+        grammar, cells, n_columns = table.grammar, table.cells, table.n_columns
+        rows = []
+        for lhs in range(grammar.n_terminals, len(grammar.symbols) - 1):
+            start = table.offsets[lhs]
+            filled = [(t, cells[start + t]) for t in range(n_columns) if cells[start + t] >= 0]
+            if filled:
+                rows.append((lhs, filled))
+        rows.sort(key=lambda row: len(row[1]), reverse=True)
+
+        offsets = array("i", [0]) * len(grammar.symbols)
+        values = array(cells.typecode)
+        check = array("h" if len(grammar.symbols) < 2**15 else "i")
+        first_free = 0  # nenhuma posição antes desta está livre
+        for lhs, filled in rows:
+            offset = max(0, first_free - filled[0][0])
+            while any(
+                offset + t < len(check) and check[offset + t] >= 0 for t, _ in filled
+            ):
+                offset += 1
+            # Garante que toda consulta `offset + t` caia dentro dos vetores
+            missing = offset + n_columns - len(check)
+            if missing > 0:
+                values.extend([-1] * missing)
+                check.extend([-1] * missing)
+            for t, prod in filled:
+                values[offset + t], check[offset + t] = prod, lhs
+            offsets[lhs] = offset
+            while first_free < len(check) and check[first_free] >= 0:
+                first_free += 1
+        if len(check) < n_columns:  # linhas vazias também consultam [0, n_columns)
+            values.extend([-1] * (n_columns - len(check)))
+            check.extend([-1] * (n_columns - len(check)))
+        return cls(grammar, offsets, values, check)
+
+    def lookup(self, non_terminal: int, terminal: int) -> int:
+        """Índice da produção para os ids (não terminal, terminal), ou -1."""
+        index = self.offsets[non_terminal] + terminal
+        return self.values[index] if self.check[index] == non_terminal else -1
+
+    def lookup_arrays(self) -> tuple[array, array, array | None]:
+        return self.offsets, self.values, self.check
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.values, self.check))
+
+    def to_bytes(self) -> bytes:
+        """Serializa os vetores (no formato nativo da máquina) com `marshal`."""
+        return marshal.dumps(
+            tuple((a.typecode, a.tobytes()) for a in (self.offsets, self.values, self.check))
+        )
+
+    @classmethod
+    def from_bytes(cls, grammar: Grammar, data: bytes) -> "CompressedLL1Table":
+        arrays = []
+        for typecode, raw in marshal.loads(data):
+            arrays.append(array(typecode))
+            arrays[-1].frombytes(raw)
+        offsets, values, check = arrays
+        if len(offsets) != len(grammar.symbols) or len(values) != len(check):
+            raise ValueError("Tabela comprimida incompatível com a gramática.")
+        return cls(grammar, offsets, values, check)
+
+
+class ExpressionParser:
+    """
+    Parser de precedência de operadores (estilo Pratt) para uma subgramática de
+    expressões. Quando o topo da pilha do `LL1ParserTable` é `non_terminal`, o driver
+    delega a ele a expressão inteira: os operadores são resolvidos por uma tabela de
+    precedências indexada pelo id do terminal, sem a cascata de não terminais e
+    caudas ε da gramática LL(1), e a AST da expressão é construída diretamente.
+    Operadores binários de mesma precedência associam à direita, como nas produções
+    X → Y XTail; a árvore é a mesma de `abstract_syntax_tree.f_expr`.
+    """
+
+    def __init__(
+        self,
+        grammar: Grammar,
+        non_terminal: NonTerminal,
+        infix: dict[Terminal, int],
+        prefix: dict[Terminal, int],
+        atoms: Iterable[Terminal],
+        groups: dict[Terminal, Terminal],
+    ):
+        """
+        :param infix: precedência (>= 1) de cada operador binário
+        :param prefix: precedência de cada operador prefixo; o operando é uma expressão
+            com operadores de precedência maior ou igual, e o operador só é aceito após
+            operadores binários de precedência menor ou igual à dele
+        :param atoms: terminais que formam um operando sozinhos
+        :param groups: delimitadores de subexpressões, abre → fecha
+        """
+        self.grammar = grammar
+        self.non_terminal = non_terminal
+        self._specification = (dict(infix), dict(prefix), list(atoms), dict(groups))
+        self._number()
+
+    def _number(self):
+        """Vetores por id de terminal, refeitos quando `Grammar.add_productions` renumera os símbolos."""
+        infix, prefix, atoms, groups = self._specification
+        grammar = self.grammar
+        ids = grammar.symbol_ids
+        columns = grammar.n_terminals + 1  # inclui a coluna de terminais desconhecidos
+        self._symbols = grammar.symbols
+        self.infix = array("b", bytes(columns))
+        self.prefix = array("b", bytes(columns))
+        self.atoms = bytearray(columns)
+        self.closing = array("i", [-1]) * columns
+        for terminal, precedence in infix.items():
+            self.infix[ids[terminal]] = precedence
+        for terminal, precedence in prefix.items():
+            self.prefix[ids[terminal]] = precedence
+        for terminal in atoms:
+            self.atoms[ids[terminal]] = 1
+        for opening, closing in groups.items():
+            self.closing[ids[opening]] = ids[closing]
+
+    def parse(
+        self,
+        kind: int,
+        token: Token,
+        tokens: Iterator[tuple[int, Token]],
+        end_of_input: tuple[int, Token],
+        expected: list[int] = None,
+    ) -> tuple[TreeNode | None, int, Token]:
+        """
+        Reconhece uma expressão a partir do token atual (`kind`, `token`), consumindo
+        `tokens` (pares (id, token), como no driver LL(1)).
+        :param expected: em erro de sintaxe, recebe os ids dos terminais aceitos no
+            lugar do token do lookahead
+        :return: (AST da expressão ou None em erro de sintaxe, id e token do lookahead)
+        """
+        if self._symbols is not self.grammar.symbols:
+            self._number()
+        infix, prefix, atoms, closing = self.infix, self.prefix, self.atoms, self.closing
+        current = [kind, token]
+
+        def advance():
+            current[0], current[1] = next(tokens, end_of_input)
+
+        def expression(context: int) -> TreeNode | None:
+            # Operandos e operadores pendentes; reduz enquanto o operador da pilha tem
+            # precedência maior que o próximo (associatividade à direita)
+            operands, operators = [], []
+            operand = primary(context)
+            while operand is not None:
+                operands.append(operand)
+                precedence = infix[current[0]]
+                if precedence < context or precedence == 0:
+                    break
+                while operators and operators[-1][0] > precedence:
+                    reduce(operands, operators)
+                operators.append((precedence, current[1]))
+                advance()
+                operand = primary(precedence)
+            else:
+                return None
+            while operators:
+                reduce(operands, operators)
+            return operands[0]
+
+        def reduce(operands: list, operators: list):
+            right, left = operands.pop(), operands.pop()
+            operands.append(TreeNode(operators.pop()[1], children=[left, right]))
+
+        def primary(context: int) -> TreeNode | None:
+            kind, token = current
+            if atoms[kind]:
+                advance()
+                return TreeNode(token)
+            if closing[kind] >= 0:
+                advance()
+                inner = expression(1)
+                if inner is None:
+                    return None
+                if current[0] != closing[kind]:
+                    if expected is not None:
+                        # A subexpressão terminou: cabe o fechamento ou mais um operador
+                        expected.append(closing[kind])
+                        expected.extend(t for t, precedence in enumerate(infix) if precedence)
+                    return None
+                advance()
+                return inner
+            precedence = prefix[kind]
+            if precedence and context <= precedence:
+                advance()
+                operand = expression(precedence)
+                return TreeNode(token, children=[operand]) if operand is not None else None
+            if expected is not None:
+                expected.extend(
+                    t for t in range(len(atoms)) if atoms[t] or closing[t] >= 0 or (prefix[t] and context <= prefix[t])
+                )
+            return None
 
-class LL1ParserTable:
-    def __init__(self, table: LL1Table, start_symbol: NonTerminal):
-        self.table = table.table
+        return expression(1), current[0], current[1]
+
+
+def _counted(items: Iterator, count: list[int]) -> Iterator:
+    """Repassa `items`, somando em `count[0]` quantos foram consumidos."""
+    for item in items:
+        count[0] += 1
+        yield item
+
+
+class SyntaxDiagnostic(NamedTuple):
+    """Erro de sintaxe: o token na posição `position` (índice na sequência de tokens) não era esperado."""
+
+    position: int
+    token: Token
+    expected: tuple[Terminal, ...]
+
+    def __str__(self):
+        location = self.token.location
+        where = f"linha {location[0]}, coluna {location[1]}" if location else f"token {self.position}"
+        found = "fim da entrada" if self.token.terminal == Grammar.EOF else f"'{self.token.lexeme}'"
+        expected = ", ".join(self._describe(terminal) for terminal in self.expected)
+        return f"Erro de sintaxe ({where}): encontrado {found}, esperado {expected or 'nada'}"
+
+    @staticmethod
+    def _describe(terminal: Terminal) -> str:
+        """Como o terminal aparece na fonte: `repr`, a grafia única (palavras-chave) ou o nome."""
+        if terminal == Grammar.EOF:
+            return "fim da entrada"
+        if terminal.repr == terminal.name:
+            lexeme = CompiledLexer._fixed_lexeme(terminal.regex)
+            if lexeme is not None:
+                return f"'{lexeme}'"
+        return f"'{terminal.repr}'"
+
+
+def _derivation_node(symbol: Symbol, epsilon_leaf: bool, *children) -> TreeNode:
+    """Ação padrão: nó da árvore de derivação, com os valores que não são `TreeNode` como folhas."""
+    children = [child if isinstance(child, TreeNode) else TreeNode(child) for child in children]
+    if epsilon_leaf:
+        children.append(TreeNode(Grammar.EPSILON))
+    return TreeNode(symbol, children=children)
+
+
+class TableParser(ABC):
+    """
+    Interface comum dos parsers dirigidos por tabela (`LL1ParserTable` e, em
+    `table_parser_lalr1`, `LALR1Parser`): `parse(tokens)` retorna (aceito, raiz da
+    árvore de derivação), com a mesma árvore em todos os motores, e `from_grammar`
+    constrói a tabela e o parser de uma `Grammar`. Com ações semânticas por
+    produção, `parse` retorna o valor da ação do símbolo inicial. Os motores são
+    escolhidos pelo nome em `parsers.create_parser`.
+    """
+
+    table: "LL1Table | CompressedLL1Table"
+
+    @classmethod
+    @abstractmethod
+    def from_grammar(cls, grammar: Grammar, **options) -> "TableParser":
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse(self, tokens: Iterable[Token]) -> tuple[bool, TreeNode]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _production_actions(grammar: Grammar, actions: dict[Production, Callable]) -> list[Callable]:
+        """
+        Ação de cada produção, pelo índice; as produções sem ação constroem o nó da
+        árvore de derivação (`_derivation_node`).
+        """
+        unknown = set(actions) - set(grammar.productions)
+        if unknown:
+            raise ValueError(f"Ações para produções fora da gramática: {unknown}")
+        epsilon = len(grammar.symbols) - 1
+        return [
+            actions.get(production) or partial(_derivation_node, production.lhs, rhs == (epsilon,))
+            for production, (_, rhs) in zip(grammar.productions, grammar.production_ids)
+        ]
+
+    def _token_ids(self, tokens: Iterable[Token]) -> Iterator[tuple[int, Token]]:
+        """Pares (id do terminal, token); terminais fora da gramática recebem a coluna vazia."""
+        grammar = self.table.grammar
+        if isinstance(tokens, TokenArray) and tokens.terminals is CompiledLexer.of(grammar).rules:
+            # Tokens do léxico da própria gramática: `kinds` já são os ids
+            return zip(tokens.kinds, tokens)
+        ids, unknown = grammar.symbol_ids, grammar.n_terminals
+        return ((ids.get(token.terminal, unknown), token) for token in tokens)
+
+    def _token_kinds(self, tokens: Iterable[Token]) -> Iterator[int]:
+        """Apenas os ids dos terminais; de um `TokenArray` do léxico da gramática, sem criar tokens."""
+        grammar = self.table.grammar
+        if isinstance(tokens, TokenArray) and tokens.terminals is CompiledLexer.of(grammar).rules:
+            return iter(tokens.kinds)
+        ids, unknown = grammar.symbol_ids, grammar.n_terminals
+        return (ids.get(token.terminal, unknown) for token in tokens)
+
+
+class LL1ParserTable(TableParser):
+    def __init__(
+        self,
+        table: LL1Table | CompressedLL1Table,
+        start_symbol: NonTerminal,
+        expressions: ExpressionParser = None,
+        actions: dict[Production, Callable] = None,
+        synchronizing: Iterable[Terminal] = (),
+    ):
+        """
+        :param expressions: parser de precedência para as expressões; a árvore de
+            derivação passa a ter, sob cada nó `expressions.non_terminal`, a AST da
+            expressão no lugar da sua derivação
+        :param actions: ação semântica de cada produção, como em `LALR1Parser`: chamada
+            quando todo o lado direito foi reconhecido, com os valores dos seus símbolos
+            (o `Token` de cada terminal; o valor da ação de cada não terminal; nada para
+            ε). Com ações, `parse` não constrói a árvore de derivação e retorna o valor
+            do símbolo inicial; produções sem ação constroem o nó da árvore de derivação
+        :param synchronizing: terminais de sincronização da recuperação de erros (os
+            finais de comando, como ';' e 'fim_se'), além dos conjuntos FOLLOW
+        """
+        self.table = table
         self.start_symbol = start_symbol
+        self.expressions = expressions
+        self.actions = actions
+        self.synchronizing = tuple(synchronizing)
+        self._reductions = None
+        self._follow_ids = None
+        self._ends = None
+        self._production_reductions()
+
+    def _production_reductions(self) -> tuple[list[Callable] | None, list[tuple[int, ...]]]:
+        """
+        Ações (None sem `actions`) e lados direitos sem ε (na ordem de empilhamento) de
+        cada produção; refeitos quando `LL1Table.update` acrescenta produções à gramática.
+        """
+        grammar = self.table.grammar
+        if self._stale(self._reductions):
+            epsilon = len(grammar.symbols) - 1
+            actions = self.actions
+            self._reductions = (
+                len(grammar.productions),
+                grammar.symbols,
+                self._production_actions(grammar, actions) if actions is not None else None,
+                [tuple(s for s in reversed(rhs) if s != epsilon) for _, rhs in grammar.production_ids],
+            )
+        return self._reductions[2:]
+
+    def _stale(self, cache: tuple | None) -> bool:
+        """
+        Se um cache por id (tupla que começa com o número de produções e a lista de
+        símbolos) ficou para trás: `Grammar.add_productions` acrescenta produções e
+        renumera os símbolos.
+        """
+        grammar = self.table.grammar
+        return cache is None or cache[0] != len(grammar.productions) or cache[1] is not grammar.symbols
 
-    def parse(self, tokens: list[Token]) -> tuple[bool, Node]:
+    def _recovery_sets(self) -> tuple[list[frozenset[int]], frozenset[int]]:
+        """
+        FOLLOW (ids) de cada símbolo, pelo id (vazio para os terminais), e os ids dos
+        terminais de sincronização; refeitos como `_reductions`.
+        """
+        grammar = self.table.grammar
+        if self._stale(self._follow_ids):
+            ids, follow_sets = grammar.symbol_ids, grammar.follow_sets
+            self._follow_ids = (
+                len(grammar.productions),
+                grammar.symbols,
+                [
+                    frozenset(ids[t] for t in follow_sets.get(symbol, ()) if t in ids)
+                    for symbol in grammar.symbols
+                ],
+                frozenset(ids[terminal] for terminal in self.synchronizing),
+            )
+        return self._follow_ids[2:]
+
+    def _end_productions(self) -> list[int]:
+        """
+        Produção anulável de cada não terminal, pelo id (-1 se não houver): no fim da
+        entrada, é a única que ainda pode ser aplicada. A coluna "$" da tabela só a tem
+        quando "$" está no FOLLOW do não terminal, o que depende do símbolo inicial da
+        gramática; refeitas como `_reductions`.
+        """
+        grammar = self.table.grammar
+        if self._stale(self._ends):
+            ends = [-1] * len(grammar.symbols)
+            for index, (lhs, _) in enumerate(grammar.production_ids):
+                if Grammar.EPSILON in grammar.suffix_first(index)[0]:
+                    ends[lhs] = index
+            self._ends = (len(grammar.productions), grammar.symbols, ends)
+        return self._ends[2]
+
+    def _start(self, start: NonTerminal | None) -> tuple[NonTerminal, int]:
+        """O símbolo inicial do parsing (`start_symbol` por padrão) e o seu id."""
+        start = self.start_symbol if start is None else start
+        ids = self.table.grammar.symbol_ids
+        if not isinstance(start, NonTerminal) or start not in ids:
+            raise ValueError(f"Símbolo inicial fora da gramática: '{start}'")
+        return start, ids[start]
+
+    @classmethod
+    def from_grammar(cls, grammar: Grammar, **options) -> "LL1ParserTable":
+        return cls(LL1Table(grammar), grammar.start_symbol, **options)
+
+    def parse(
+        self, tokens: Iterable[Token], errors: list[SyntaxDiagnostic] = None, start: NonTerminal = None
+    ) -> tuple[bool, TreeNode]:
         """
         Realiza o parsing LL(1) com construção da árvore de derivação.
-        :param tokens: Lista de tokens, terminando com o símbolo "$"
-        :return: Tupla (bool, raiz da árvore de derivação (anytree.Node))
+        Os tokens são consumidos com um único token de lookahead, então qualquer
+        iterável serve (lista, `TokenArray` ou `Tokenizer.iter_tokens`). A pilha e a
+        tabela (densa ou comprimida) trabalham com os ids inteiros dos símbolos.
+        :param tokens: Tokens da entrada; o fim da sequência equivale ao símbolo "$"
+        :param errors: se informada, o parsing se recupera dos erros de sintaxe (modo
+            pânico, ver `_parse_recovering`) e a lista recebe um `SyntaxDiagnostic` por
+            erro, em vez de parar no primeiro
+        :param start: não terminal a reconhecer no lugar de `start_symbol` (uma
+            expressão ou um comando avulso, por exemplo), com a mesma tabela: a entrada
+            deve terminar junto com ele
+        :return: Tupla (bool, raiz da árvore de derivação (TreeNode)), ou (bool,
+            valor do símbolo inicial) com `actions`
         """
-        start_symbol = self.start_symbol
-
-        stack = deque()
-        root = Node(start_symbol)
-        stack.append((start_symbol, root))
-        token_index = 0
+        if errors is not None:
+            if self.actions is not None:
+                raise ValueError("A recuperação de erros constrói a árvore de derivação; não use com `actions`.")
+            return self._parse_recovering(tokens, errors, start)
+        if self.actions is not None:
+            return self._parse_values(tokens, start)
+        start, start_id = self._start(start)
+        grammar = self.table.grammar
+        symbols, rhs_ids = grammar.symbols, [rhs for _, rhs in grammar.production_ids]
+        offsets, values, check = self.table.lookup_arrays()
+        n_terminals = grammar.n_terminals
+        epsilon = len(symbols) - 1
+
+        ends = self._end_productions()
+
+        root = TreeNode(start)
+        stack = [(start_id, root)]
+        tokens = self._token_ids(tokens)
+        end_of_input = (n_terminals - 1, Token(Grammar.EOF, "$"))
+        kind, current_token = next(tokens, end_of_input)
+        expressions = self.expressions
+        delegated = grammar.symbol_ids[expressions.non_terminal] if expressions else -1
 
         while stack:
             top_symbol, top_node = stack.pop()
 
-            current_token = tokens[token_index] \
-                if token_index < len(tokens) \
-                else Token(Grammar.EOF, "$")
+            if top_symbol == delegated:
+                ast, kind, current_token = expressions.parse(kind, current_token, tokens, end_of_input)
+                if ast is None:
+                    return False, root
+                top_node.children.append(ast)
+                ast.parent = top_node
+                continue
 
-            if isinstance(top_symbol, Terminal):
-                if top_symbol != current_token.terminal:
+            if top_symbol < n_terminals:
+                if top_symbol != kind:
                     return False, root
                 top_node.name = current_token
-                token_index += 1
+                kind, current_token = next(tokens, end_of_input)
                 continue
 
-            production = self.table.get((top_symbol, current_token.terminal))
-            if production is None:
-                return False, root
+            index = offsets[top_symbol] + kind
+            production = values[index]
+            if production < 0 or (check is not None and check[index] != top_symbol):
+                production = ends[top_symbol] if current_token is end_of_input[1] else -1
+                if production < 0:
+                    return False, root
 
             children = []
-            for symbol in production.rhs:
-                if symbol == Grammar.EPSILON:
-                    Node(Grammar.EPSILON, parent=top_node)
-                    continue
-                child = Node(symbol, parent=top_node)
-                children.append((symbol, child))
+            for symbol in rhs_ids[production]:
+                child = TreeNode(symbols[symbol], parent=top_node)
+                if symbol != epsilon:
+                    children.append((symbol, child))
 
             # Empilha os filhos em ordem reversa
-            for symbol, child in reversed(children):
-                stack.append((symbol, child))
+            stack.extend(reversed(children))
 
-        if token_index != len(tokens):
+        # Sobraram tokens após a derivação completa
+        if current_token is not end_of_input[1]:
             return False, root
 
         return True, root
 
+    def _parse_recovering(
+        self, tokens: Iterable[Token], errors: list[SyntaxDiagnostic], start: NonTerminal = None
+    ) -> tuple[bool, TreeNode]:
+        """
+        O driver de `parse` com recuperação de erros em modo pânico. Em cada erro, um
+        `SyntaxDiagnostic` vai para `errors` e a pilha e a entrada são sincronizadas
+        (`_synchronize`); um erro na posição em que a recuperação anterior terminou não
+        é relatado, pois é consequência dela. Os não terminais abandonados ficam na
+        árvore como folhas e os tokens descartados ficam fora dela. Fora dos erros, só
+        se acrescenta a contagem da posição do token atual.
+        :return: Tupla (bool: nenhum erro de sintaxe, raiz da árvore de derivação)
+        """
+        start, start_id = self._start(start)
+        grammar = self.table.grammar
+        symbols, rhs_ids = grammar.symbols, [rhs for _, rhs in grammar.production_ids]
+        offsets, values, check = self.table.lookup_arrays()
+        n_terminals = grammar.n_terminals
+        epsilon = len(symbols) - 1
+        reported = len(errors)
+
+        ends = self._end_productions()
+
+        root = TreeNode(start)
+        stack = [(start_id, root)]
+        tokens = self._token_ids(tokens)
+        end_of_input = (n_terminals - 1, Token(Grammar.EOF, "$"))
+        kind, current_token = next(tokens, end_of_input)
+        # Posição (índice) do token atual e posição onde terminou a última recuperação
+        position, resumed = 0, -1
+        expressions = self.expressions
+        delegated = grammar.symbol_ids[expressions.non_terminal] if expressions else -1
+
+        while stack:
+            top_symbol, top_node = stack.pop()
+
+            if top_symbol == delegated:
+                expected, consumed, ended = [], [0], current_token is end_of_input[1]
+                ast, kind, current_token = expressions.parse(
+                    kind, current_token, _counted(tokens, consumed), end_of_input, expected
+                )
+                # O fim da entrada também avança a posição (ela passa a ser o número de tokens)
+                position += consumed[0] + (not ended and current_token is end_of_input[1])
+                if ast is None:
+                    # A expressão termina no erro; a sincronização segue pela pilha abaixo dela
+                    if position > resumed:
+                        errors.append(self._diagnostic(position, current_token, expected))
+                    kind, current_token, position = self._synchronize(
+                        stack, kind, current_token, position, tokens, end_of_input
+                    )
+                    resumed = position
+                    continue
+                top_node.children.append(ast)
+                ast.parent = top_node
+                continue
+
+            if top_symbol < n_terminals:
+                if top_symbol != kind:
+                    if position > resumed:
+                        errors.append(self._diagnostic(position, current_token, [top_symbol]))
+                    stack.append((top_symbol, top_node))
+                    kind, current_token, position = self._synchronize(
+                        stack, kind, current_token, position, tokens, end_of_input
+                    )
+                    resumed = position
+                    continue
+                top_node.name = current_token
+                kind, current_token = next(tokens, end_of_input)
+                position += 1
+                continue
+
+            index = offsets[top_symbol] + kind
+            production = values[index]
+            if production < 0 or (check is not None and check[index] != top_symbol):
+                production = ends[top_symbol] if current_token is end_of_input[1] else -1
+            if production < 0:
+                if position > resumed:
+                    accepts = self._acceptor()
+                    expected = [t for t in range(n_terminals) if accepts(top_symbol, t)]
+                    errors.append(self._diagnostic(position, current_token, expected))
+                stack.append((top_symbol, top_node))
+                kind, current_token, position = self._synchronize(
+                    stack, kind, current_token, position, tokens, end_of_input
+                )
+                resumed = position
+                continue
+
+            children = []
+            for symbol in rhs_ids[production]:
+                child = TreeNode(symbols[symbol], parent=top_node)
+                if symbol != epsilon:
+                    children.append((symbol, child))
+            stack.extend(reversed(children))
+
+        # Sobraram tokens após a derivação completa
+        if current_token is not end_of_input[1] and position > resumed:
+            errors.append(self._diagnostic(position, current_token, [end_of_input[0]]))
+
+        return len(errors) == reported, root
+
+    def _acceptor(self) -> Callable[[int, int], bool]:
+        """Função (símbolo, terminal) → se o símbolo no topo da pilha aceita o terminal no lookahead."""
+        offsets, values, check = self.table.lookup_arrays()
+        n_terminals = self.table.grammar.n_terminals
+
+        def accepts(symbol: int, kind: int) -> bool:
+            if symbol < n_terminals:
+                return symbol == kind
+            index = offsets[symbol] + kind
+            return values[index] >= 0 and (check is None or check[index] == symbol)
+
+        return accepts
+
+    def _diagnostic(self, position: int, token: Token, expected: Iterable[int]) -> SyntaxDiagnostic:
+        symbols = self.table.grammar.symbols
+        return SyntaxDiagnostic(position, token, tuple(symbols[t] for t in sorted(set(expected))))
+
+    def _synchronize(
+        self,
+        stack: list[tuple[int, TreeNode]],
+        kind: int,
+        token: Token,
+        position: int,
+        tokens: Iterator[tuple[int, Token]],
+        end_of_input: tuple[int, Token],
+    ) -> tuple[int, Token, int]:
+        """
+        Recuperação em modo pânico: até que o topo da pilha aceite o token atual,
+        - no fim da entrada, desempilha;
+        - desempilha um não terminal que não aceita o token mas tem o token no seu
+          FOLLOW (o trecho dele fica vazio);
+        - desempilha um terminal se o símbolo abaixo dele aceita o token (o terminal
+          conta como inserido);
+        - num terminal de sincronização (`synchronizing`), desempilha até a entrada mais
+          próxima que o aceita, se houver;
+        - senão, descarta o token.
+        Cada entrada sai da pilha e cada token é descartado no máximo uma vez, então a
+        recuperação é linear; só a busca por um terminal de sincronização que nenhuma
+        entrada aceita percorre a pilha inteira.
+        :return: (id, token e posição do token atual)
+        """
+        n_terminals = self.table.grammar.n_terminals
+        follow, synchronizing = self._recovery_sets()
+        accepts = self._acceptor()
+        while stack:
+            symbol = stack[-1][0]
+            if accepts(symbol, kind):
+                break
+            if (
+                kind == end_of_input[0]
+                or (symbol >= n_terminals and kind in follow[symbol])
+                or (symbol < n_terminals and len(stack) > 1 and accepts(stack[-2][0], kind))
+            ):
+                stack.pop()
+                continue
+            if kind in synchronizing:
+                depth = next((i for i in range(len(stack) - 2, -1, -1) if accepts(stack[i][0], kind)), -1)
+                if depth >= 0:
+                    del stack[depth + 1 :]
+                    break
+            kind, token = next(tokens, end_of_input)
+            position += 1
+        return kind, token, position
+
+    def _parse_values(self, tokens: Iterable[Token], start: NonTerminal = None) -> tuple[bool, object]:
+        """
+        Parsing LL(1) com as ações semânticas, sem árvore de derivação. Ao expandir a
+        produção p, a pilha recebe, abaixo do lado direito, o marcador ~p (negativo);
+        quando ele é desempilhado, os valores do lado direito estão no topo da pilha de
+        valores e são substituídos pelo resultado da ação. Em erro, a raiz tem como
+        filhos os valores já calculados, como no `LALR1Parser`.
+        """
+        start, start_id = self._start(start)
+        grammar = self.table.grammar
+        offsets, table_values, check = self.table.lookup_arrays()
+        n_terminals = grammar.n_terminals
+        actions, reversed_rhs = self._production_reductions()
+        ends = self._end_productions()
+
+        stack, values = [start_id], []
+        tokens = self._token_ids(tokens)
+        end_of_input = (n_terminals - 1, Token(Grammar.EOF, "$"))
+        kind, current_token = next(tokens, end_of_input)
+        expressions = self.expressions
+        delegated = grammar.symbol_ids[expressions.non_terminal] if expressions else -1
+
+        def failure() -> tuple[bool, TreeNode]:
+            children = [value if isinstance(value, TreeNode) else TreeNode(value) for value in values]
+            return False, TreeNode(start, children=children)
+
+        while stack:
+            top_symbol = stack.pop()
+
+            if top_symbol < 0:
+                production = ~top_symbol
+                length = len(reversed_rhs[production])
+                if length:
+                    arguments = values[-length:]
+                    del values[-length:]
+                    values.append(actions[production](*arguments))
+                else:
+                    values.append(actions[production]())
+                continue
+
+            if top_symbol == delegated:
+                ast, kind, current_token = expressions.parse(kind, current_token, tokens, end_of_input)
+                if ast is None:
+                    return failure()
+                values.append(ast)
+                continue
+
+            if top_symbol < n_terminals:
+                if top_symbol != kind:
+                    return failure()
+                values.append(current_token)
+                kind, current_token = next(tokens, end_of_input)
+                continue
+
+            index = offsets[top_symbol] + kind
+            production = table_values[index]
+            if production < 0 or (check is not None and check[index] != top_symbol):
+                production = ends[top_symbol] if current_token is end_of_input[1] else -1
+                if production < 0:
+                    return failure()
+            stack.append(~production)
+            stack.extend(reversed_rhs[production])
+
+        # Sobraram tokens após a derivação completa
+        if current_token is not end_of_input[1]:
+            return failure()
+
+        return True, values[0]
+
+    def recognize(self, tokens: Iterable[Token], start: NonTerminal = None) -> tuple[bool, int | None]:
+        """
+        Apenas reconhece a entrada: a mesma máquina de pilha de `parse`, com somente os
+        ids dos símbolos na pilha, sem nós nem valores. Com `Tokenizer.iter_tokens`, a
+        memória não depende do tamanho do script. O parser de precedência não é usado:
+        a tabela já tem as linhas das expressões.
+        :param tokens: Tokens da entrada; o fim da sequência equivale ao símbolo "$"
+        :param start: não terminal a reconhecer no lugar de `start_symbol`, como em `parse`
+        :return: Tupla (bool, posição do token que falhou: índice na sequência de
+            tokens, ou o número de tokens se a entrada terminou antes; None se aceita)
+        """
+        start_id = self._start(start)[1]
+        grammar = self.table.grammar
+        offsets, values, check = self.table.lookup_arrays()
+        n_terminals = grammar.n_terminals
+        reversed_rhs = self._production_reductions()[1]
+        ends = self._end_productions()
+
+        stack = [start_id]
+        kinds = self._token_kinds(tokens)
+        end_of_input = n_terminals - 1
+        kind, position = next(kinds, end_of_input), 0
+
+        while stack:
+            top_symbol = stack.pop()
+            if top_symbol < n_terminals:
+                if top_symbol != kind:
+                    return False, position
+                kind, position = next(kinds, end_of_input), position + 1
+                continue
+            index = offsets[top_symbol] + kind
+            production = values[index]
+            if production < 0 or (check is not None and check[index] != top_symbol):
+                production = ends[top_symbol] if kind == end_of_input else -1
+                if production < 0:
+                    return False, position
+            stack.extend(reversed_rhs[production])
+
+        # Sobraram tokens após a derivação completa
+        if kind != end_of_input:
+            return False, position
+        return True, None
+
     @staticmethod
-    def print_ast(ast: Node):
+    def print_ast(ast: TreeNode):
         """Imprime a árvore sintática abstrata (AST) de forma legível."""
-        for pre, _, node in RenderTree(ast):
+        for pre, _, node in RenderTree(ast.to_anytree()):
             node: Node
             print(_)
             print(f"{pre}{node.name}")
@@ -428,7 +2380,7 @@ if __name__ == "__main__":
         parsed, derivation_tree = parser.parse(tokens)
 
         print(Fore.BLUE + "\nÁrvore de Derivação:")
-        for pre, _, node in RenderTree(derivation_tree):
+        for pre, _, node in RenderTree(derivation_tree.to_anytree()):
             node: Node
             color = Fore.BLACK
             if node.is_leaf and node.name is not Grammar.EPSILON:
@@ -3,9 +3,11 @@
 from colorama import Fore
 from anytree import RenderTree
 from grammar import grammar
-from table_parser_ll1 import LL1Table, LL1ParserTable, Token, Tokenizer
-from abstract_syntax_tree import get_ast_root
+from table_parser_ll1 import Token, Tokenizer
+from parsers import ENGINES, create_parser
+from abstract_syntax_tree import ast_actions
 from generator import Generator
+import argparse
 import os
 import sys
 
@@ -26,10 +28,12 @@ if __name__ == "__main__":
         "./inputs/entrada4.txt",
     ]
 
-    # Tabela LL(1)
-    ll1_table = LL1Table(grammar=grammar)
-    # Parser LL(1)
-    parser = LL1ParserTable(table=ll1_table, start_symbol=grammar.start_symbol)
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--engine", choices=list(ENGINES), default="ll1", help="motor de parsing")
+    args = arg_parser.parse_args()
+
+    # Parser (LL(1) ou LALR(1)); as ações semânticas constroem a AST durante o parsing
+    parser = create_parser(grammar, args.engine, actions=ast_actions(grammar))
     # Gerador
     generator = Generator()
 
@@ -47,11 +51,11 @@ if __name__ == "__main__":
             print(script_input)
             print("-" * 40)
 
-            # Tokenização
-            tokens = Tokenizer.tokenize(script_input, grammar=grammar)
+            # Tokenização (direto do arquivo mapeado em memória)
+            tokens = Tokenizer.tokenize_file(input_file, grammar=grammar)
 
-            # Parsing
-            parsed, derivation_tree_root = parser.parse(tokens)
+            # Parsing e AST, sem a árvore de derivação
+            parsed, ast_root = parser.parse(tokens)
 
             if not parsed:
                 print(Fore.RED + "Erro na análise sintática." + Fore.RESET)
@@ -59,11 +63,8 @@ if __name__ == "__main__":
             else:
                 print(Fore.GREEN + "Análise sintática bem-sucedida!" + Fore.RESET)
 
-            # Gera AST
-            ast_root = get_ast_root(derivation_tree_root)
-
             print(Fore.MAGENTA + "AST gerada:" + Fore.RESET)
-            for pre, fill, node in RenderTree(ast_root):
+            for pre, fill, node in RenderTree(ast_root.to_anytree()):
                 if isinstance(node.name, Token):
                     print(
                         f"{pre}{Fore.YELLOW}{node.name.lexeme} "
@@ -0,0 +1,116 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import random
+import unittest
+from anytree import PreOrderIter, RenderTree
+from abstract_syntax_tree import ast_actions, get_ast_root
+from grammar import Program, expression_parser, grammar
+from table_parser_ll1 import Grammar, LL1ParserTable, LL1Table, NonTerminal, Terminal, Token, Tokenizer
+from table_parser_lalr1 import LALR1Parser
+from test_expression_parser import random_expression
+
+INPUTS = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+)
+
+
+def render(root) -> str:
+    return RenderTree(root).by_attr(lambda node: str(node.name))
+
+
+class TestAstActions(unittest.TestCase):
+    def setUp(self):
+        table = LL1Table(grammar)
+        actions = ast_actions(grammar)
+        self.derivation = LL1ParserTable(table, grammar.start_symbol)
+        self.parsers = {
+            "ll1": LL1ParserTable(table, grammar.start_symbol, actions=actions),
+            "ll1+precedência": LL1ParserTable(
+                table, grammar.start_symbol, expressions=expression_parser, actions=actions
+            ),
+            "lalr1": LALR1Parser.from_grammar(grammar, actions=actions),
+        }
+
+    def assertSameAst(self, text: str):
+        """A AST das ações é a de `get_ast_root`, com o mesmo resultado do parsing."""
+        tokens = Tokenizer.tokenize(text, grammar)
+        accepted, root = self.derivation.parse(tokens)
+        expected = render(get_ast_root(root)) if accepted else None
+        for name, parser in self.parsers.items():
+            with self.subTest(engine=name):
+                parsed, ast = parser.parse(tokens)
+                self.assertEqual(parsed, accepted)
+                if accepted:
+                    self.assertEqual(render(ast), expected)
+
+    def test_corpus(self):
+        for path in INPUTS:
+            with self.subTest(path=os.path.basename(path)):
+                with open(path, "r", encoding="utf-8") as f:
+                    self.assertSameAst(f.read())
+
+    def test_random_expressions(self):
+        rng = random.Random(21)
+        for _ in range(200):
+            expression = random_expression(rng)
+            with self.subTest(expression=expression):
+                self.assertSameAst(
+                    f"inicio var real : x, y = {expression}, 1; se {expression} entao "
+                    f"x = {expression}; senao ir_para x {expression}; fim_se; fim"
+                )
+
+    def test_invalid_inputs(self):
+        for text in ["", "inicio", "inicio avancar; fim", "inicio fim fim", "inicio avancar 1 + ; fim"]:
+            with self.subTest(text=text):
+                self.assertSameAst(text)
+                parsed, root = self.parsers["ll1"].parse(Tokenizer.tokenize(text, grammar))
+                self.assertFalse(parsed)
+                self.assertEqual(root.name, Program)
+
+    def test_no_derivation_nodes(self):
+        """Só a raiz é um não terminal; não há nós de ε nem da cascata de expressões."""
+        with open(INPUTS[-1], "r", encoding="utf-8") as f:
+            tokens = Tokenizer.tokenize(f.read(), grammar)
+        _, ast = self.parsers["ll1"].parse(tokens)
+        for node in PreOrderIter(ast):
+            if node is ast:
+                self.assertEqual(node.name, Program)
+            else:
+                self.assertIsInstance(node.name, (Token, Terminal))
+
+    def test_long_chain(self):
+        """A AST é montada na pilha de valores, sem recursão (ao contrário de `f_expr`)."""
+        chain = " + ".join(f"v{i}" for i in range(3000))
+        parsed, ast = self.parsers["ll1"].parse(Tokenizer.tokenize(f"inicio avancar {chain}; fim", grammar))
+        self.assertTrue(parsed)
+        node, depth = ast.children[0].children[0], 0
+        while node.children:
+            node, depth = node.children[1], depth + 1
+        self.assertEqual(depth, 2999)
+
+    def test_default_actions(self):
+        """Sem ação, a produção constrói o nó da árvore de derivação."""
+        S, A = NonTerminal("S"), NonTerminal("A")
+        a, b = Terminal("a", "a"), Terminal("b", "b")
+        small = Grammar(S, [a, b], [S, A], [S >> [a, A], A >> [b], A >> []])
+        parser = LL1ParserTable(LL1Table(small), S, actions={A >> [b]: lambda token: token.lexeme.upper()})
+        parsed, root = parser.parse(Tokenizer.tokenize("ab", small))
+        self.assertTrue(parsed)
+        self.assertEqual(root.name, S)
+        self.assertEqual([str(child.name) for child in root.children], [str(Token(a, "a")), "B"])
+        parsed, root = parser.parse(Tokenizer.tokenize("a", small))
+        self.assertTrue(parsed)
+        derivation = LL1ParserTable(LL1Table(small), S).parse(Tokenizer.tokenize("a", small))[1]
+        self.assertEqual(render(root), render(derivation))
+        with self.assertRaises(ValueError):
+            LL1ParserTable(LL1Table(small), S, actions={S >> [b]: print})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import unittest
+from grammar import expression_parser, grammar, synchronizing
+from table_parser_ll1 import LL1ParserTable, LL1Table, Tokenizer
+
+
+class TestErrorRecovery(unittest.TestCase):
+    """Recuperação de erros do `LL1ParserTable` com os terminais de sincronização da gramática."""
+
+    def setUp(self):
+        self.grammar, self.tokenize = grammar, Tokenizer.tokenize
+        table = LL1Table(grammar)
+        self.parsers = {
+            "ll1": LL1ParserTable(table, grammar.start_symbol, synchronizing=synchronizing),
+            "ll1+precedência": LL1ParserTable(
+                table, grammar.start_symbol, expressions=expression_parser, synchronizing=synchronizing
+            ),
+        }
+
+    def assertErrors(self, text: str, positions: list[int]):
+        tokens = self.tokenize(text, self.grammar)
+        for name, parser in self.parsers.items():
+            with self.subTest(engine=name, text=text):
+                errors = []
+                parsed, _ = parser.parse(tokens, errors)
+                self.assertEqual(parsed, not positions)
+                self.assertEqual([error.position for error in errors], positions)
+                self.assertEqual(parser.parse(tokens)[0], parsed)
+
+    def test_corpus(self):
+        inputs = glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+        for path in sorted(inputs):
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertErrors(f.read(), [])
+
+    def test_errors_in_one_pass(self):
+        # Expressões faltando e um token a mais no mesmo script
+        self.assertErrors("inicio avancar ; girar_direita ; avancar 1 2; fim", [2, 4, 7])
+        # ';' faltando antes de 'fim_se': o comando termina no terminal de sincronização
+        self.assertErrors("inicio se x entao avancar 1 fim_se; recuar 2; fim", [6])
+        self.assertErrors(
+            "inicio var inteiro : a = ; avancar 1 + * 2; repita 3 vezes avancar 1 fim_repita; fim fim",
+            [6, 10, 18, 21],
+        )
+        # 'fim_enquanto' sem laço aberto é descartado
+        self.assertErrors("inicio avancar 1; fim_enquanto; recuar 1; fim", [4])
+        self.assertErrors("inicio avancar 1;", [4])
+        self.assertErrors("inicio avancar 1 +", [4])
+
+    def test_error_messages(self):
+        errors = []
+        text = "inicio\n    se x entao\n        avancar (1 + ;\n    fim_se;\nfim"
+        self.parsers["ll1+precedência"].parse(self.tokenize(text, self.grammar), errors)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(str(errors[0]).startswith("Erro de sintaxe (linha 3, coluna 22): encontrado ';'"))
+        # Terminais sem `repr` aparecem pela grafia na fonte, como as palavras-chave
+        errors = []
+        self.parsers["ll1"].parse(self.tokenize("inicio var inteiro a; se x faca", self.grammar), errors)
+        self.assertEqual(str(errors[0]), "Erro de sintaxe (linha 1, coluna 20): encontrado 'a', esperado ':'")
+        self.assertIn("'entao'", str(errors[1]))
+        self.assertNotIn("kw_", str(errors[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
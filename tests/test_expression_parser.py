@@ -0,0 +1,138 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import random
+import unittest
+from anytree import RenderTree
+from abstract_syntax_tree import ast_actions, get_ast_root
+from grammar import Commands, Expr, expression_parser, grammar
+from table_parser_ll1 import LL1ParserTable, LL1Table, Token, Tokenizer
+
+INPUTS = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+)
+
+OPERATORS = ["||", "&&", "+", "-", "==", "!=", "<=", ">=", "<", ">", "*", "/", "%"]
+ATOMS = ["a", "b", "1", "2.5", '"x"', "verdadeiro"]
+
+
+def render(root) -> str:
+    return RenderTree(root).by_attr(lambda node: str(node.name))
+
+
+def random_expression(rng: random.Random, depth: int = 0) -> str:
+    """Expressão válida com operadores, negações e parênteses aleatórios."""
+    roll = rng.random()
+    if depth > 3 or roll < 0.3:
+        return rng.choice(ATOMS)
+    if roll < 0.4:
+        return "!" + random_expression(rng, depth + 1)
+    if roll < 0.5:
+        return "(" + random_expression(rng, depth + 1) + ")"
+    operator = rng.choice(OPERATORS)
+    return f"{random_expression(rng, depth + 1)} {operator} {random_expression(rng, depth + 1)}"
+
+
+class TestExpressionParser(unittest.TestCase):
+    def setUp(self):
+        table = LL1Table(grammar)
+        self.ll1 = LL1ParserTable(table, grammar.start_symbol)
+        self.pratt = LL1ParserTable(table, grammar.start_symbol, expressions=expression_parser)
+
+    def assertSameParse(self, text: str):
+        """Mesmo resultado e mesma AST com e sem o parser de precedência."""
+        tokens = Tokenizer.tokenize(text, grammar)
+        accepted, root = self.ll1.parse(tokens)
+        self.assertEqual(self.pratt.parse(tokens)[0], accepted)
+        if accepted:
+            expected = render(get_ast_root(root))
+            self.assertEqual(render(get_ast_root(self.pratt.parse(tokens)[1])), expected)
+
+    def test_corpus(self):
+        for path in INPUTS:
+            with self.subTest(path=os.path.basename(path)):
+                with open(path, "r", encoding="utf-8") as f:
+                    self.assertSameParse(f.read())
+
+    def test_random_expressions(self):
+        rng = random.Random(2025)
+        for _ in range(300):
+            expression = random_expression(rng)
+            with self.subTest(expression=expression):
+                self.assertSameParse(f"inicio avancar {expression}; fim")
+
+    def test_invalid_expressions(self):
+        """Sequências aleatórias de tokens: aceitas e rejeitadas como no LL(1)."""
+        rng = random.Random(7)
+        pieces = OPERATORS + ATOMS + ["!", "(", ")", "entao"]
+        for _ in range(500):
+            expression = " ".join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+            with self.subTest(expression=expression):
+                self.assertSameParse(f"inicio se {expression} entao avancar 1; fim_se; fim")
+
+    def test_expression_nodes(self):
+        """O nó Expr recebe a AST da expressão, sem a cascata de não terminais."""
+        tokens = Tokenizer.tokenize("inicio avancar 150; fim", grammar)
+        accepted, root = self.pratt.parse(tokens)
+        self.assertTrue(accepted)
+        (expr,) = [node for node in root.descendants if node.name == Expr]
+        self.assertEqual(len(expr.descendants), 1)
+        self.assertIsInstance(expr.children[0].name, Token)
+        self.assertEqual(expr.children[0].name.lexeme, "150")
+
+    def test_long_chain(self):
+        """Cadeias longas não dependem de recursão (associatividade à direita)."""
+        chain = " + ".join(f"v{i}" for i in range(5000))
+        accepted, root = self.pratt.parse(Tokenizer.tokenize(f"inicio avancar {chain}; fim", grammar))
+        self.assertTrue(accepted)
+        node, depth = get_ast_root(root).children[0].children[0], 0
+        while node.children:
+            node, depth = node.children[1], depth + 1
+        self.assertEqual(depth, 4999)
+        self.assertEqual(node.name.lexeme, "v4999")
+
+    def test_start_expression(self):
+        """`parse(tokens, start=Expr)`: a expressão avulsa, sem envolvê-la num programa."""
+        actions = LL1ParserTable(LL1Table(grammar), grammar.start_symbol, actions=ast_actions(grammar))
+        rng = random.Random(25)
+        pieces = OPERATORS + ATOMS + ["!", "(", ")", ";"]
+        for index in range(400):
+            if index % 2:
+                expression = random_expression(rng)
+            else:
+                expression = " ".join(rng.choice(pieces) for _ in range(rng.randint(0, 6)))
+            with self.subTest(expression=expression):
+                tokens = Tokenizer.tokenize(expression, grammar)
+                program = Tokenizer.tokenize(f"inicio avancar {expression}; fim", grammar)
+                accepted, root = self.ll1.parse(program)
+                self.assertEqual(self.ll1.parse(tokens, start=Expr)[0], accepted)
+                self.assertEqual(self.pratt.parse(tokens, start=Expr)[0], accepted)
+                self.assertEqual(self.ll1.recognize(tokens, start=Expr)[0], accepted)
+                parsed, ast = actions.parse(tokens, start=Expr)
+                self.assertEqual(parsed, accepted)
+                if accepted:
+                    # A AST do comando `avancar` tem a da expressão como filho
+                    self.assertEqual(render(ast), render(get_ast_root(root).children[0].children[0]))
+
+    def test_start_commands(self):
+        cases = [("avancar 1; girar_direita x + 2;", True), ("", True), ("avancar 1", False), ("fim", False)]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                tokens = Tokenizer.tokenize(text, grammar)
+                for parser in (self.ll1, self.pratt):
+                    accepted, root = parser.parse(tokens, start=Commands)
+                    self.assertEqual(accepted, expected)
+                    self.assertEqual(root.name, Commands)
+                # O símbolo inicial volta a ser o da gramática na chamada seguinte
+                self.assertFalse(self.ll1.parse(tokens)[0])
+        with self.assertRaises(ValueError):
+            self.ll1.parse([], start=grammar.terminals[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import subprocess
+import tempfile
+import unittest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+
+
+def run(code: str, env: dict = None) -> str:
+    """Executa `code` em um interpretador novo (módulos ainda não importados)."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True, env=env
+    )
+    return result.stdout.strip()
+
+
+class TestLazyGrammar(unittest.TestCase):
+    def test_import_does_not_build(self):
+        """Importar o módulo (ou só os símbolos) não constrói a gramática."""
+        code = (
+            "import grammar, abstract_syntax_tree, semantic\n"
+            "from grammar import kw_se\n"
+            "print('grammar' in vars(grammar), 'expression_parser' in vars(grammar))"
+        )
+        self.assertEqual(run(code), "False False")
+
+    def test_singleton(self):
+        """O primeiro acesso constrói a gramática uma única vez, sem calcular FIRST/FOLLOW."""
+        code = (
+            "import grammar\n"
+            "from grammar import grammar as g, expression_parser\n"
+            "print(g is grammar.grammar, expression_parser.grammar is g, g._first_sets is None)"
+        )
+        self.assertEqual(run(code), "True True True")
+
+    def test_cache_opt_in(self):
+        """O cache em disco só é usado com $TURTLE_SCRIPT_CACHE; sem ele nada é gravado."""
+        code = "from grammar import grammar\ngrammar.follow_sets\nprint(grammar._cache_dir)"
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as cache_dir:
+            env = {k: v for k, v in os.environ.items() if k != "TURTLE_SCRIPT_CACHE"}
+            env["HOME"] = home
+            self.assertEqual(run(code, env), "None")
+            self.assertEqual(run(code, dict(env, TURTLE_SCRIPT_CACHE="")), "None")
+            self.assertEqual(os.listdir(home), [])
+            self.assertEqual(run(code, dict(env, TURTLE_SCRIPT_CACHE=cache_dir)), cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertEqual(os.listdir(home), [])
+
+    def test_unknown_attribute(self):
+        import grammar
+
+        with self.assertRaises(AttributeError):
+            grammar.gramatica
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import random
+import tempfile
+import unittest
+from grammar import grammar
+from incremental_lexer import TokenChange, retokenize
+from table_parser_ll1 import Tokenizer
+
+INPUTS = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+)
+
+
+def read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def columns(tokens):
+    """(terminal, início, fim) de cada token."""
+    return list(zip(tokens.kinds, tokens.starts, tokens.ends))
+
+
+class TestRetokenize(unittest.TestCase):
+    def assertRetokenized(self, text: str, offset: int, deleted: int, inserted: str):
+        """A retokenização incremental equivale a tokenizar o texto editado do zero."""
+        tokens = Tokenizer.tokenize(text, grammar)
+        edited = text[:offset] + inserted + text[offset + deleted :]
+        try:
+            expected = Tokenizer.tokenize(edited, grammar)
+        except RuntimeError as error:
+            with self.assertRaises(RuntimeError) as context:
+                retokenize(tokens, grammar, offset, deleted, inserted)
+            self.assertEqual(str(context.exception), str(error))
+            return None
+        result, change = retokenize(tokens, grammar, offset, deleted, inserted)
+        self.assertEqual(result.source.text, edited)
+        self.assertEqual(columns(result), columns(expected))
+        # Fora do intervalo alterado, os tokens são os antigos (deslocados)
+        delta = len(inserted) - deleted
+        self.assertEqual(columns(result)[: change.start], columns(tokens)[: change.start])
+        self.assertEqual(
+            columns(result)[change.new_end :],
+            [(kind, start + delta, end + delta) for kind, start, end in columns(tokens)[change.old_end :]],
+        )
+        return change
+
+    def test_edit_inside_identifier(self):
+        text = "inicio\n    lado = lado + 5;\n    avancar lado;\nfim\n"
+        offset = text.index("lado +") + 2
+        change = self.assertRetokenized(text, offset, 0, "x")
+        # Recomeça no token anterior e ressincroniza logo após o identificador
+        self.assertEqual(change, TokenChange(2, 4, 4))
+
+    def test_lookahead_and_boundaries(self):
+        """Edições que unem ou separam tokens vizinhos: `1.` + `5`, `<` + `=`, palavras-chave."""
+        cases = [
+            ("x = 1.y;", 6, 1, "5"),
+            ("se a < b entao", 6, 0, "="),
+            ("fim se;", 3, 1, "_"),
+            ("fim_se;", 3, 1, " "),
+            ("a / b;\nc;", 3, 0, "/"),
+            ("a // b;\nc;", 6, 2, ""),
+            ('x "a" b "c" d;', 3, 0, '" "'),
+            ('x "a" b\n "c" d;', 2, 1, ""),
+            ("  a;", 0, 0, "b"),
+            ("a;", 2, 0, " b;"),
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertRetokenized(*case)
+
+    def test_random_edits(self):
+        """Edições aleatórias sobre `inputs/` equivalem à retokenização completa."""
+        fragments = ["a", "1", ".", " ", "\n", '"', "/", "//", "=", "<", "se", "_", ";", "@"]
+        rng = random.Random(2025)
+        for path in INPUTS:
+            text = read(path)
+            for _ in range(100):
+                offset = rng.randint(0, len(text))
+                deleted = rng.randint(0, min(4, len(text) - offset))
+                inserted = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 3)))
+                with self.subTest(path=os.path.basename(path), edit=(offset, deleted, inserted)):
+                    self.assertRetokenized(text, offset, deleted, inserted)
+
+    def test_mapped_source(self):
+        """Fontes em bytes (`tokenize_file`) recebem o texto inserido codificado."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "entrada.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('inicio\n    definir_cor "ação";\n    avancar 10;\nfim\n')
+            tokens = Tokenizer.tokenize_file(path, grammar)
+            offset = tokens[-3].start  # "10"
+            result, _ = retokenize(tokens, grammar, offset, 2, "20 + lado")
+        self.assertEqual(
+            [token.lexeme for token in result][-6:],
+            ["avancar", "20", "+", "lado", ";", "fim"],
+        )
+
+    def test_edit_out_of_bounds(self):
+        tokens = Tokenizer.tokenize("inicio fim", grammar)
+        for offset, deleted in [(-1, 0), (5, 6), (11, 0)]:
+            with self.subTest(offset=offset, deleted=deleted):
+                with self.assertRaises(ValueError):
+                    retokenize(tokens, grammar, offset, deleted, "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
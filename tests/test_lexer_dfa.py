@@ -0,0 +1,150 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import random
+import unittest
+from grammar import grammar
+from lexer_dfa import DFALexer
+from table_parser_ll1 import CompiledLexer, Grammar, NonTerminal, Terminal, Tokenizer
+
+INPUTS = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+)
+
+
+def read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def tokenize_both(text: str):
+    """Tokeniza com os dois motores; erros são comparados pela mensagem."""
+    results = []
+    for engine in Tokenizer.ENGINES:
+        try:
+            tokens = Tokenizer.tokenize(text, grammar, engine=engine)
+            results.append([(token.terminal, token.lexeme) for token in tokens])
+        except RuntimeError as error:
+            results.append(str(error))
+    return results
+
+
+def rules_grammar(rules: list[str]) -> Grammar:
+    """Gramática só com terminais (t0, t1, ...), para tokenizar com os dois motores."""
+    terminals = [Terminal(f"t{index}", rule) for index, rule in enumerate(rules)]
+    return Grammar(NonTerminal("S"), terminals + [Grammar.EOF], [NonTerminal("S")], [])
+
+
+def tokenize_rules(text: str, rules: Grammar, engine: str) -> list[tuple[str, str]]:
+    return [(token.terminal.name, token.lexeme) for token in Tokenizer.tokenize(text, rules, engine=engine)]
+
+
+class TestDFALexer(unittest.TestCase):
+    def test_longest_match_and_priority(self):
+        """Vence o casamento mais longo; empates ficam com a regra anterior."""
+        rules = rules_grammar([r"\bse\b", r"[a-z_]+", r"<=", r"<", r"\d+\.\d+", r"\d+", r"\."])
+        cases = [
+            ("se", [("t0", "se")]),
+            ("senao", [("t1", "senao")]),
+            ("se_x", [("t1", "se_x")]),
+            ("<=<", [("t2", "<="), ("t3", "<")]),
+            ("1.5", [("t4", "1.5")]),
+            ("1.x", [("t5", "1"), ("t6", "."), ("t1", "x")]),
+            ("10se", [("t5", "10"), ("t1", "se")]),  # sem \b antes de "se"
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(tokenize_rules(text, rules, "dfa"), expected)
+                self.assertEqual(tokenize_rules(text, rules, "regex"), expected)
+
+    def test_first_match_conflict(self):
+        """
+        O regex mestre fica com a primeira regra que casa, e o AFD com a mais longa:
+        regras em que isso difere são recusadas na construção do AFD.
+        """
+        rules = rules_grammar(["a", "ab", "b"])
+        self.assertEqual(tokenize_rules("ab", rules, "regex"), [("t0", "a"), ("t2", "b")])
+        with self.assertRaises(ValueError):
+            Tokenizer.tokenize("ab", rules, engine="dfa")
+        for patterns in [[r"\d+", r"\d+\.\d+"], [r"<", r"<="], [r"\s+a"]]:
+            with self.subTest(patterns=patterns):
+                with self.assertRaises(ValueError):
+                    DFALexer(patterns)
+        # Com a regra mais longa antes, os motores coincidem
+        rules = rules_grammar(["ab", "a", "b"])
+        for engine in Tokenizer.ENGINES:
+            self.assertEqual(tokenize_rules("aba", rules, engine), [("t0", "ab"), ("t1", "a")])
+
+    def test_lex_error_position(self):
+        rules = rules_grammar([r"[a-z]+"])
+        with self.assertRaisesRegex(RuntimeError, r"posição 5\)"):
+            Tokenizer.tokenize("ab  c@", rules, engine="dfa")
+
+    def test_unsupported_pattern(self):
+        for pattern in [r"(?=a)", r"a\Z", r"a*?", r"^a", r"a\bb"]:
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    DFALexer([pattern])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Tokenizer.tokenize("inicio fim", grammar, engine="lalr")
+
+
+class TestDFAConformance(unittest.TestCase):
+    def test_inputs(self):
+        """O motor AFD produz os mesmos tokens que o motor regex em `inputs/`."""
+        self.assertTrue(INPUTS)
+        for path in INPUTS:
+            with self.subTest(path=os.path.basename(path)):
+                regex_tokens, dfa_tokens = tokenize_both(read(path))
+                self.assertIsInstance(regex_tokens, list)
+                self.assertEqual(regex_tokens, dfa_tokens)
+
+    def test_keyword_table(self):
+        """A classificação de palavras-chave por tabela equivale à alternância completa."""
+        full = CompiledLexer(grammar, keyword_table=False)
+        texts = [read(path) for path in INPUTS]
+        texts += ["10vezes se١ fim_se fimse _se verdadeiro_ falso", "seé"]
+        for text in texts:
+            with self.subTest(text=text[:20]):
+                try:
+                    expected = Tokenizer._tokenize(text, full)
+                except RuntimeError as error:
+                    expected = str(error)
+                try:
+                    actual = Tokenizer._tokenize(text, CompiledLexer.of(grammar))
+                except RuntimeError as error:
+                    actual = str(error)
+                self.assertEqual(expected, actual)
+
+    def test_comments(self):
+        """Comentários são pulados pela varredura; `//` dentro de texto faz parte do lexema."""
+        text = 'inicio // abre\n  definir_cor "http://x"; // cor\nfim // fecha'
+        regex_tokens, dfa_tokens = tokenize_both(text)
+        self.assertEqual(regex_tokens, dfa_tokens)
+        self.assertIn(("texto", '"http://x"'), [(t.name, lexeme) for t, lexeme in regex_tokens])
+        self.assertEqual(len(regex_tokens), 5)
+
+    def test_random_fragments(self):
+        """Concatenações aleatórias de fragmentos (válidos ou não) tokenizam igual."""
+        fragments = [
+            "se", "senao", "fim", "fim_se", "_x1", "avancar", "verdadeiro", "falso",
+            "10", "1.5", "1.", ".5", '"a b"', '"', "<=", "<", "==", "=", "!", "!=",
+            "&&", "|", "||", "/", "//", "// x\n", "*", ";", "(", ")", " ", "\n", "\t", "é", "@", "١٢",
+        ]
+        rng = random.Random(2025)
+        for _ in range(500):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            with self.subTest(text=text):
+                regex_result, dfa_result = tokenize_both(text)
+                self.assertEqual(regex_result, dfa_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/turtle_script"))
+)
+
+import glob
+import random
+import unittest
+from anytree import Node, RenderTree
+from grammar import grammar
+from parsers import ENGINES, create_parser
+from table_parser_lalr1 import LALR1Parser, LALR1Table
+from table_parser_ll1 import Grammar, LL1ParserTable, LL1Table, NonTerminal, Terminal, Tokenizer
+
+INPUTS = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "inputs", "entrada*.txt"))
+)
+
+
+def render(root: Node) -> str:
+    return RenderTree(root).by_attr(lambda node: repr(node.name))
+
+
+class TestLALR1Parser(unittest.TestCase):
+    def setUp(self):
+        self.E, self.T, self.F = [NonTerminal(name) for name in "ETF"]
+        self.plus = Terminal("plus", r"\+")
+        self.times = Terminal("times", r"\*")
+        self.left_p = Terminal("left_paren", r"\(")
+        self.right_p = Terminal("right_paren", r"\)")
+        self.number = Terminal("number", r"\d+")
+        E, T, F = self.E, self.T, self.F
+        # Recursiva à esquerda: não é LL(1)
+        self.sum, self.product = E >> [E, self.plus, T], T >> [T, self.times, F]
+        self.grammar = Grammar(
+            start_symbol=E,
+            terminals=[self.plus, self.times, self.left_p, self.right_p, self.number],
+            non_terminals=[E, T, F],
+            productions=[
+                self.sum,
+                E >> T,
+                self.product,
+                T >> F,
+                F >> [self.left_p, E, self.right_p],
+                F >> self.number,
+            ],
+        )
+
+    def test_left_recursive_grammar(self):
+        with self.assertRaises(ValueError):
+            LL1Table(self.grammar)
+        parser = LALR1Parser(LALR1Table(self.grammar))
+        for text, accepted in [("1", True), ("1 + 2 * 3", True), ("(1 + 2) * 3", True), ("1 +", False), ("(1", False), ("1 2", False)]:
+            with self.subTest(text=text):
+                self.assertEqual(parser.parse(Tokenizer.tokenize(text, self.grammar))[0], accepted)
+
+    def test_reduce_actions(self):
+        """Ações por produção constroem o resultado de baixo para cima."""
+        E, T, F = self.E, self.T, self.F
+        actions = {
+            self.sum: lambda left, _, right: left + right,
+            E >> T: lambda value: value,
+            self.product: lambda left, _, right: left * right,
+            T >> F: lambda value: value,
+            F >> [self.left_p, E, self.right_p]: lambda _, value, __: value,
+            F >> self.number: lambda token: int(token.lexeme),
+        }
+        parser = LALR1Parser(LALR1Table(self.grammar), actions)
+        self.assertEqual(parser.parse(Tokenizer.tokenize("2 + 3 * 4", self.grammar)), (True, 14))
+        self.assertEqual(parser.parse(Tokenizer.tokenize("(2 + 3) * 4", self.grammar)), (True, 20))
+
+        # Associatividade à esquerda, sem não terminais de cauda
+        actions[self.sum] = lambda left, _, right: ("+", left, right)
+        parser = LALR1Parser(LALR1Table(self.grammar), actions)
+        accepted, value = parser.parse(Tokenizer.tokenize("1 + 2 + 3", self.grammar))
+        self.assertTrue(accepted)
+        self.assertEqual(value, ("+", ("+", 1, 2), 3))
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            LALR1Parser(LALR1Table(self.grammar), {self.E >> self.number: print})
+
+    def test_conflict(self):
+        E, plus, number = self.E, self.plus, self.number
+        ambiguous = Grammar(E, [plus, number], [E], [E >> [E, plus, E], E >> number])
+        with self.assertRaises(ValueError) as context:
+            LALR1Table(ambiguous)
+        self.assertIn("conflito", str(context.exception))
+
+    def test_epsilon_productions(self):
+        """Produções vazias e ε explícito geram a mesma árvore que o LL(1)."""
+        S, A, B = [NonTerminal(name) for name in "SAB"]
+        a, b = Terminal("a", "a"), Terminal("b", "b")
+        small = Grammar(S, [a, b], [S, A, B], [S >> [A, B, a], A >> b, A >> [], B >> Grammar.EPSILON])
+        ll1, lalr1 = LL1ParserTable.from_grammar(small), LALR1Parser.from_grammar(small)
+        for text in ["a", "ba", "", "bb"]:
+            tokens = Tokenizer.tokenize(text, small)
+            (accepted, expected), (lalr_accepted, root) = ll1.parse(tokens), lalr1.parse(tokens)
+            with self.subTest(text=text):
+                self.assertEqual(lalr_accepted, accepted)
+                if accepted:
+                    self.assertEqual(render(root), render(expected))
+
+
+class TestEngines(unittest.TestCase):
+    def test_corpus(self):
+        """Os dois motores aceitam as entradas com a mesma árvore de derivação."""
+        parsers = {engine: create_parser(grammar, engine) for engine in ENGINES}
+        for path in INPUTS:
+            tokens = Tokenizer.tokenize_file(path, grammar)
+            results = {engine: parser.parse(tokens) for engine, parser in parsers.items()}
+            with self.subTest(path=os.path.basename(path)):
+                self.assertTrue(all(accepted for accepted, _ in results.values()))
+                self.assertEqual(render(results["lalr1"][1]), render(results["ll1"][1]))
+
+    def test_corrupted_inputs(self):
+        """Entradas com um token removido ou duplicado: mesmo veredito nos dois motores."""
+        ll1, lalr1 = create_parser(grammar, "ll1"), create_parser(grammar, "lalr1")
+        rng = random.Random(2025)
+        for path in INPUTS:
+            tokens = list(Tokenizer.tokenize_file(path, grammar))
+            for _ in range(40):
+                index = rng.randrange(len(tokens))
+                edited = tokens[:index] + tokens[index + rng.choice([1, 0]) :]
+                if len(edited) == len(tokens):
+                    edited.insert(index, tokens[index])
+                with self.subTest(path=os.path.basename(path), index=index):
+                    self.assertEqual(lalr1.parse(edited)[0], ll1.parse(edited)[0])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            create_parser(grammar, "earley")
+
+
+if __name__ == "__main__":
+    unittest.main()
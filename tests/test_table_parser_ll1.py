@@ -3,7 +3,13 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
+import io
+import pathlib
+import random
+import tempfile
 import unittest
+from array import array
+from anytree import Node, PreOrderIter, RenderTree
 from turtle_script.table_parser_ll1 import (
     Symbol,
     NonTerminal,
@@ -12,9 +18,19 @@ from turtle_script.table_parser_ll1 import (
     Grammar,
     Tokenizer,
     LL1Table,
+    CompressedLL1Table,
     LL1ParserTable,
     Token,
+    TokenArray,
+    Source,
+    CompiledLexer,
+    GrammarCache,
+    TreeNode,
+    SyntaxDiagnostic,
+    ExpressionParser,
+    TableParser,
 )
+from turtle_script.parsers import ENGINES, create_parser
 
 
 class TestSymbol(unittest.TestCase):
@@ -110,6 +126,44 @@ class TestProduction(unittest.TestCase):
         self.assertEqual(A >> Grammar.EPSILON, Production(A, [Grammar.EPSILON]))
 
 
+class TestTreeNode(unittest.TestCase):
+    def setUp(self):
+        self.root = TreeNode("S")
+        self.a = TreeNode("a", parent=self.root)
+        self.b = TreeNode("B", children=[TreeNode("b"), TreeNode("c")])
+        self.b.parent = self.root
+        self.root.children.append(self.b)
+
+    def test_links(self):
+        self.assertEqual([child.name for child in self.root.children], ["a", "B"])
+        self.assertIs(self.a.parent, self.root)
+        self.assertTrue(all(child.parent is self.b for child in self.b.children))
+        self.assertEqual([node.depth for node in (self.root, self.a, self.b.children[0])], [0, 1, 2])
+        self.assertTrue(self.a.is_leaf)
+        self.assertFalse(self.b.is_leaf)
+
+    def test_descendants(self):
+        """Pré-ordem, como no anytree (inclusive com `PreOrderIter`)."""
+        names = [node.name for node in self.root.descendants]
+        self.assertEqual(names, ["a", "B", "b", "c"])
+        self.assertEqual([node.name for node in PreOrderIter(self.root)], ["S"] + names)
+
+    def test_to_anytree(self):
+        converted = self.root.to_anytree()
+        self.assertIsInstance(converted, Node)
+        self.assertEqual(RenderTree(converted).by_attr(), RenderTree(self.root).by_attr())
+        self.assertEqual(converted.height, 2)
+
+    def test_deep_tree(self):
+        """`descendants`, `depth` e `to_anytree` não usam recursão."""
+        node = root = TreeNode(0)
+        for index in range(1, 5000):
+            node = TreeNode(index, parent=node)
+        self.assertEqual(node.depth, 4999)
+        self.assertEqual(len(root.descendants), 4999)
+        self.assertEqual(root.to_anytree().children[0].name, 1)
+
+
 class BaseGrammarTest(unittest.TestCase):
     def setUp(self):
         self.E, self.X, self.T, self.Y, self.F = [
@@ -191,6 +245,153 @@ class TestGrammar(BaseGrammarTest):
         self.assertEqual(follow_T, follow_T_expected)
         self.assertEqual(follow_X, follow_X_expected)
 
+    def test_mutually_recursive_sets(self):
+        """Não terminais mutuamente recursivos (um ciclo de dependências) recebem os mesmos conjuntos."""
+        S, A, B = NonTerminal("S"), NonTerminal("A"), NonTerminal("B")
+        a, b, c = Terminal("a", "a"), Terminal("b", "b"), Terminal("c", "c")
+        grammar = Grammar(
+            S,
+            [a, b, c, Grammar.EOF],
+            [S, A, B],
+            [S >> [A, b], A >> B, A >> a, B >> [A, c], B >> []],
+        )
+        self.assertEqual(grammar.compute_nullable(), {A, B})
+        self.assertEqual(grammar.first_sets[S], {a, b, c})
+        self.assertEqual(grammar.first_sets[A], {a, c, Grammar.EPSILON})
+        self.assertEqual(grammar.first_sets[B], {a, c, Grammar.EPSILON})
+        self.assertEqual(grammar.follow_sets[S], {Grammar.EOF})
+        self.assertEqual(grammar.follow_sets[A], {b, c})
+        self.assertEqual(grammar.follow_sets[B], {b, c})
+        self.assertIsNot(grammar.follow_sets[A], grammar.follow_sets[B])
+
+    def test_deep_chain(self):
+        """Cadeias longas de não terminais não esbarram no limite de recursão."""
+        chain = [NonTerminal(f"X{i}") for i in range(5000)]
+        t = Terminal("t", "t")
+        productions = [lhs >> rhs for lhs, rhs in zip(chain, chain[1:])] + [chain[-1] >> t]
+        grammar = Grammar(chain[0], [t, Grammar.EOF], chain, productions)
+        self.assertEqual(grammar.first_sets[chain[0]], {t})
+        self.assertEqual(grammar.follow_sets[chain[-1]], {Grammar.EOF})
+
+    def test_lazy_analysis(self):
+        """FIRST e FOLLOW só são calculados no primeiro acesso (ou ao construir a tabela)."""
+        grammar = Grammar(self.start_symbol, self.terminals, self.non_terminals, self.productions)
+        self.assertIsNone(grammar._first_sets)
+        self.assertEqual(grammar.follow_sets[self.X], {Grammar.EOF, self.right_p})
+        self.assertIsNotNone(grammar._first_sets)
+        grammar = Grammar(self.start_symbol, self.terminals, self.non_terminals, self.productions)
+        LL1Table(grammar)
+        self.assertIsNotNone(grammar._follow_sets)
+
+    def test_production_first(self):
+        """FIRST por produção e por sufixo coincidem com `first_rhs`."""
+        grammar = self.grammar
+        for index, prod in enumerate(grammar.productions):
+            self.assertEqual(grammar.production_first[index], grammar.first_rhs(prod.rhs))
+            self.assertEqual(grammar.production_nullable[index], prod.rhs == [])
+            suffixes = grammar.suffix_first(index)
+            self.assertEqual(len(suffixes), len(prod.rhs) + 1)
+            for position, first in enumerate(suffixes):
+                self.assertIsInstance(first, frozenset)
+                self.assertEqual(first, grammar.first_rhs(prod.rhs[position:]))
+        # T → F Y: FIRST(Y) = {*, ε}
+        self.assertEqual(grammar.suffix_first(3)[1], {self.dot, Grammar.EPSILON})
+
+    def test_symbol_ids(self):
+        """Ids densos: terminais (EOF por último), não terminais e ε; produções como tuplas de ids."""
+        grammar, ids = self.grammar, self.grammar.symbol_ids
+        self.assertEqual(grammar.n_terminals, len(self.terminals) + 1)
+        self.assertEqual(grammar.symbols[: grammar.n_terminals], self.terminals + [Grammar.EOF])
+        self.assertEqual(grammar.symbols[grammar.n_terminals : -1], self.non_terminals)
+        self.assertIs(grammar.symbols[-1], Grammar.EPSILON)
+        self.assertEqual([ids[symbol] for symbol in grammar.symbols], list(range(len(grammar.symbols))))
+        self.assertEqual(
+            grammar.production_ids[1], (ids[self.X], (ids[self.plus], ids[self.T], ids[self.X]))
+        )
+        self.assertEqual(grammar.production_ids[2], (ids[self.X], ()))
+        # As regras do léxico seguem os ids dos terminais
+        tokens = Tokenizer.tokenize("a + b", grammar)
+        self.assertEqual(list(tokens.kinds), [ids[self.iden], ids[self.plus], ids[self.iden]])
+
+    def test_invalid_symbol_in_production(self):
+        with self.assertRaises(ValueError):
+            Grammar(self.E, self.terminals, [self.E], [self.E >> [Symbol("x")]])
+
+
+class TestGrammarCache(BaseGrammarTest):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def cached_grammar(self, productions=None) -> Grammar:
+        return Grammar(
+            start_symbol=self.start_symbol,
+            terminals=self.terminals,
+            non_terminals=self.non_terminals,
+            productions=self.productions if productions is None else productions,
+            cache_dir=self.directory,
+        )
+
+    def test_miss_then_hit(self):
+        """A primeira análise grava o instantâneo; a segunda o carrega com os mesmos resultados."""
+        first = self.cached_grammar()
+        path = GrammarCache(self.directory).path(first)
+        # A análise só acontece no primeiro acesso a FIRST/FOLLOW (ou à tabela)
+        self.assertFalse(os.path.exists(path))
+        first.follow_sets
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(path)])
+
+        second = self.cached_grammar()
+        self.assertEqual(second.first_sets, self.grammar.first_sets)
+        self.assertEqual(second.follow_sets, self.grammar.follow_sets)
+        table = LL1Table(second).table
+        self.assertEqual(table, LL1Table(self.grammar).table)
+        # A tabela carregada aponta para as produções da própria gramática
+        for prod in table.values():
+            self.assertTrue(any(prod is own for own in second.productions))
+
+    def test_key_depends_on_content(self):
+        """Mudar uma produção ou a regex de um terminal muda a chave."""
+        key = GrammarCache.key(self.grammar)
+        self.assertEqual(key, GrammarCache.key(self.cached_grammar()))
+        changed = self.cached_grammar(self.productions[:-1] + [self.F >> [self.dot]])
+        self.assertNotEqual(key, GrammarCache.key(changed))
+        self.iden.regex = r"[a-z]+"
+        self.assertNotEqual(key, GrammarCache.key(self.cached_grammar()))
+
+    def test_corrupt_snapshot(self):
+        """Um instantâneo ilegível é ignorado e regravado."""
+        grammar = self.cached_grammar()
+        path = GrammarCache(self.directory).path(grammar)
+        with open(path, "wb") as f:
+            f.write(b"\x00corrompido")
+        self.assertIsNone(GrammarCache(self.directory).load(grammar))
+        grammar = self.cached_grammar()
+        self.assertEqual(grammar.follow_sets, self.grammar.follow_sets)
+        self.assertIsNotNone(GrammarCache(self.directory).load(grammar))
+
+    def test_non_ll1_grammar(self):
+        """Gramáticas não LL(1) são cacheadas sem tabela, e a construção da tabela ainda falha."""
+        productions = self.productions + [self.F >> [self.iden, self.dot]]
+        for _ in range(2):  # gravação e carga
+            grammar = self.cached_grammar(productions)
+            with self.assertRaises(ValueError):
+                LL1Table(grammar)
+
+    def test_unwritable_directory(self):
+        """Falhas de escrita apenas desativam o cache."""
+        blocker = os.path.join(self.directory, "arquivo")
+        with open(blocker, "w") as f:
+            f.write("")
+        grammar = Grammar(
+            self.start_symbol, self.terminals, self.non_terminals, self.productions,
+            cache_dir=os.path.join(blocker, "cache"),
+        )
+        self.assertEqual(grammar.first_sets, self.grammar.first_sets)
+
 
 class TestTokenizer(BaseGrammarTest):
     def setUp(self):
@@ -218,6 +419,19 @@ class TestTokenizer(BaseGrammarTest):
                     # Verifica se todos os tokens são instâncias de Token
                     self.assertIsInstance(token, Token)
 
+    def test_dfa_engine(self):
+        """O motor "dfa" produz os mesmos tokens e erros que o regex, também pelo pacote."""
+        for text in ["a + b * (c + d)", "(a+b)*(c+d)   ", "", "a & b"]:
+            with self.subTest(text=text):
+                results = []
+                for engine in Tokenizer.ENGINES:
+                    try:
+                        tokens = Tokenizer.tokenize(text, self.grammar, engine=engine)
+                        results.append([(token.terminal, token.lexeme) for token in tokens])
+                    except RuntimeError as error:
+                        results.append(str(error))
+                self.assertEqual(results[0], results[1])
+
     def test_tokenize_invalid(self):
         """Testa a tokenização de expressões inválidas."""
         error_cases = [
@@ -231,6 +445,155 @@ class TestTokenizer(BaseGrammarTest):
                 with self.assertRaises(RuntimeError):
                     Tokenizer.tokenize(text, self.grammar)
 
+    def test_tokenize_error_position(self):
+        """O erro de tokenização informa linha e coluna do trecho inválido."""
+        with self.assertRaisesRegex(RuntimeError, "linha 3, coluna 5"):
+            Tokenizer.tokenize("a +\n  b\n  (c@d)\n", self.grammar)
+
+    def test_token_offsets_and_location(self):
+        """Tokens guardam deslocamentos; linha e coluna são calculadas sob demanda."""
+        text = "a +\n  (b)"
+        tokens = Tokenizer.tokenize(text, self.grammar)
+        self.assertIsInstance(tokens, TokenArray)
+        self.assertEqual(
+            [(token.start, token.end) for token in tokens],
+            [(0, 1), (2, 3), (6, 7), (7, 8), (8, 9)],
+        )
+        self.assertEqual([token.lexeme for token in tokens], ["a", "+", "(", "b", ")"])
+        self.assertEqual(tokens[3].location, (2, 4))
+        self.assertEqual(tokens[1:3], [Token(self.plus, "+"), Token(self.left_p, "(")])
+        self.assertIsNone(Token(self.plus, "+").location)
+
+    def test_comments_skipped_in_scan(self):
+        """Comentários são pulados na varredura: deslocamentos referem-se ao texto original."""
+        text = "a // soma\n+ b // fim"
+        tokens = Tokenizer.tokenize(text, self.grammar)
+        self.assertEqual([token.lexeme for token in tokens], ["a", "+", "b"])
+        self.assertEqual([token.start for token in tokens], [0, 10, 12])
+        self.assertEqual(tokens[1].location, (2, 1))
+        with self.assertRaisesRegex(RuntimeError, "linha 2, coluna 5"):
+            Tokenizer.tokenize("a // comentário\n+ b @ // fim", self.grammar)
+
+    def test_fixed_lexemes(self):
+        """Lexemas de grafia única vêm do regex: literais, pontuação escapada e `\\b(...)\\b`."""
+        cases = [
+            (r"\+", "+"),
+            (r"\|\|", "||"),
+            (r"==", "=="),
+            (r"\bfim_se\b", "fim_se"),
+            (r"\b(avancar)\b", "avancar"),
+            (r"\n", None),
+            (r"\d+", None),
+            (r"\b(sim|nao)\b", None),
+            (r"[a-z]", None),
+        ]
+        for regex, expected in cases:
+            with self.subTest(regex=regex):
+                self.assertEqual(CompiledLexer._fixed_lexeme(regex), expected)
+
+    def test_iter_tokens_is_lazy(self):
+        """`iter_tokens` gera os tokens sob demanda; o erro só surge ao alcançá-lo."""
+        tokens = Tokenizer.iter_tokens("a + b @", self.grammar)
+        self.assertEqual(next(tokens), Token(self.iden, "a"))
+        self.assertEqual(next(tokens), Token(self.plus, "+"))
+        self.assertEqual(next(tokens), Token(self.iden, "b"))
+        with self.assertRaises(RuntimeError):
+            next(tokens)
+
+    def test_iter_tokens_from_file(self):
+        with io.StringIO("(a+b)*c") as f:
+            tokens = list(Tokenizer.iter_tokens(f, self.grammar))
+        self.assertEqual(tokens, list(Tokenizer.tokenize("(a+b)*c", self.grammar)))
+
+    def write_file(self, content: str) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "entrada.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_tokenize_file(self):
+        """`tokenize_file` (mmap, bytes) produz os mesmos tokens que `tokenize`."""
+        text = "// soma de ação\n(a+b) // fim\n* c\n"
+        path = self.write_file(text)
+        tokens = Tokenizer.tokenize_file(path, self.grammar)
+        self.assertEqual(tokens, Tokenizer.tokenize(text, self.grammar))
+        self.assertEqual(list(Tokenizer.iter_tokens(pathlib.Path(path), self.grammar)), tokens)
+        # Deslocamentos em bytes; lexemas e linha/coluna em caracteres
+        self.assertEqual((tokens[0].start, tokens[0].end), (18, 19))
+        self.assertEqual(tokens[0].location, (2, 1))
+        self.assertEqual(tokens[-1].lexeme, "c")
+
+    def test_tokenize_file_error_and_empty(self):
+        with self.assertRaisesRegex(RuntimeError, "linha 2, coluna 5"):
+            Tokenizer.tokenize_file(self.write_file("// ação\na + é"), self.grammar)
+        self.assertEqual(len(Tokenizer.tokenize_file(self.write_file(""), self.grammar)), 0)
+
+    def test_source_line_col(self):
+        source = Source("ab\n\ncd\n")
+        self.assertEqual(source.line_starts(), [0, 3, 4, 7])
+        self.assertEqual(source.line_col(0), (1, 1))
+        self.assertEqual(source.line_col(2), (1, 3))
+        self.assertEqual(source.line_col(3), (2, 1))
+        self.assertEqual(source.line_col(5), (3, 2))
+
+    def test_compiled_lexer_cached(self):
+        """O léxico compilado é construído uma única vez por gramática."""
+        lexer = CompiledLexer.of(self.grammar)
+        Tokenizer.tokenize("a + b", self.grammar)
+        self.assertIs(CompiledLexer.of(self.grammar), lexer)
+        tokens = Tokenizer.tokenize("(a+b)", self.grammar)
+        self.assertEqual(
+            [token.terminal for token in tokens],
+            [self.left_p, self.iden, self.plus, self.iden, self.right_p],
+        )
+
+
+class TestKeywordTable(unittest.TestCase):
+    def setUp(self):
+        self.kw_se = Terminal("kw_se", r"\bse\b")
+        self.logico = Terminal("logico", r"\b(sim|nao)\b")
+        self.iden = Terminal("id", r"[a-z_][a-z_0-9]*")
+        self.num = Terminal("num", r"\d+")
+        self.kw_late = Terminal("kw_late", r"\bfim\b")  # depois do identificador
+        S = NonTerminal("S")
+        self.terminals = [self.kw_se, self.logico, self.num, self.iden, self.kw_late]
+        self.grammar = Grammar(S, self.terminals, [S], [S >> [self.iden]])
+
+    def test_keywords_leave_master_regex(self):
+        """Palavras-chave antes do identificador são classificadas por tabela."""
+        lexer = CompiledLexer.of(self.grammar)
+        self.assertNotIn(self.kw_se.name, lexer.pattern.groupindex)
+        self.assertNotIn(self.logico.name, lexer.pattern.groupindex)
+        self.assertIn(self.kw_late.name, lexer.pattern.groupindex)
+
+    def test_keyword_classification(self):
+        cases = [
+            ("se", [self.kw_se]),
+            ("sim nao", [self.logico, self.logico]),
+            ("senao se_x", [self.iden, self.iden]),
+            ("10se", [self.num, self.iden]),  # sem fronteira antes de "se"
+            ("fim", [self.iden]),  # o identificador vem antes de kw_late
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                tokens = Tokenizer.tokenize(text, self.grammar)
+                self.assertEqual([token.terminal for token in tokens], expected)
+
+    def test_shared_lexemes(self):
+        """Terminais de grafia única compartilham o lexema; identificadores são internados."""
+        lexer = CompiledLexer.of(self.grammar)
+        self.assertEqual(lexer.lexemes, ["se", None, None, None, "fim"])
+        tokens = list(Tokenizer.tokenize("se lado\nse " + "la" + "do 10 10", self.grammar))
+        self.assertEqual([token.lexeme for token in tokens], ["se", "lado", "se", "lado", "10", "10"])
+        self.assertIs(tokens[0].lexeme, tokens[2].lexeme)
+        self.assertIs(tokens[1].lexeme, tokens[3].lexeme)
+        self.assertIsNot(tokens[4].lexeme, tokens[5].lexeme)  # números não são internados
+        streamed = list(Tokenizer.iter_tokens("lado se", self.grammar))
+        self.assertIs(streamed[0].lexeme, tokens[1].lexeme)
+        self.assertIs(streamed[1].lexeme, tokens[0].lexeme)
+
 
 class TestLL1Table(BaseGrammarTest):
     def setUp(self):
@@ -255,6 +618,328 @@ class TestLL1Table(BaseGrammarTest):
                             f"Esperado {Grammar.EPSILON} para {non_terminal} e {follow_symbol}",
                         )
 
+    def test_dense_cells(self):
+        """Cada célula guarda o índice da produção (ou -1), linha por não terminal."""
+        ll1_table = LL1Table(self.grammar)
+        ids, n_terminals = self.grammar.symbol_ids, self.grammar.n_terminals
+        self.assertEqual(ll1_table.n_columns, n_terminals + 1)
+        self.assertEqual(len(ll1_table.cells), len(self.non_terminals) * ll1_table.n_columns)
+        filled = 0
+        for (non_terminal, terminal), prod in ll1_table.table.items():
+            index = (ids[non_terminal] - n_terminals) * ll1_table.n_columns + ids[terminal]
+            self.assertIs(self.grammar.productions[ll1_table.cells[index]], prod)
+            filled += 1
+        self.assertEqual(sum(cell >= 0 for cell in ll1_table.cells), filled)
+        # A coluna de terminais desconhecidos fica vazia
+        self.assertTrue(all(cell < 0 for cell in ll1_table.cells[n_terminals :: ll1_table.n_columns]))
+
+    def test_table_dict_cached(self):
+        """O dicionário de `table` é montado uma vez e refeito quando `update` troca as células."""
+        ll1_table = LL1Table(self.grammar)
+        table = ll1_table.table
+        self.assertIs(ll1_table.table, table)
+        bang, G = Terminal("bang", "!"), NonTerminal("G")
+        ll1_table.update(self.grammar.add_productions([self.F >> [G], G >> [bang]], [bang], [G]))
+        self.assertIsNot(ll1_table.table, table)
+        self.assertEqual(ll1_table.table, LL1Table(self.grammar).table)
+        self.assertIn((G, bang), ll1_table.table)
+
+    def test_compressed_table(self):
+        """A tabela comprimida responde como a densa, inclusive a coluna de terminais desconhecidos."""
+        # Gramática esparsa: cada não terminal A_i só tem entrada para o terminal t_i
+        terminals = [Terminal(f"t{i}", f"t{i}") for i in range(40)]
+        chain = [NonTerminal(f"A{i}") for i in range(40)]
+        productions = [A >> [t, B] for A, t, B in zip(chain, terminals, chain[1:])]
+        productions += [chain[-1] >> terminals[-1], chain[0] >> []]
+        grammars = [self.grammar, Grammar(chain[0], terminals, chain, productions)]
+        for grammar in grammars:
+            with self.subTest(grammar=grammar.start_symbol):
+                dense = LL1Table(grammar)
+                compressed = dense.compress()
+                for lhs in range(grammar.n_terminals, len(grammar.symbols) - 1):
+                    for terminal in range(dense.n_columns):
+                        self.assertEqual(
+                            compressed.lookup(lhs, terminal), dense.lookup(lhs, terminal)
+                        )
+                restored = CompressedLL1Table.from_bytes(grammar, compressed.to_bytes())
+                self.assertEqual(restored.values, compressed.values)
+                self.assertEqual(restored.check, compressed.check)
+                self.assertEqual(restored.offsets, compressed.offsets)
+        self.assertLess(compressed.nbytes, dense.nbytes / 4)
+        with self.assertRaises(ValueError):
+            CompressedLL1Table.from_bytes(self.grammar, compressed.to_bytes())
+
+    def test_conflict(self):
+        productions = self.productions + [self.F >> [self.iden, self.dot]]
+        grammar = Grammar(self.E, self.terminals, self.non_terminals, productions)
+        with self.assertRaises(ValueError) as context:
+            LL1Table(grammar)
+        self.assertIn("(F, id)", str(context.exception))
+        self.assertIn("conflito FIRST/FIRST", str(context.exception))
+        # X → ε (FOLLOW(X) ∋ ")") contra X → ) X
+        productions = self.productions + [self.X >> [self.right_p, self.X]]
+        with self.assertRaises(ValueError) as context:
+            LL1Table(Grammar(self.E, self.terminals, self.non_terminals, productions))
+        self.assertIn("conflito FOLLOW/FIRST", str(context.exception))
+
+
+class TestAddProductions(BaseGrammarTest):
+    def assertSameAsRebuilt(self, grammar: Grammar, ll1_table: LL1Table):
+        """A gramática e a tabela atualizadas equivalem às construídas do zero."""
+        rebuilt = Grammar(
+            grammar.start_symbol, grammar.terminals, grammar.non_terminals, grammar.productions
+        )
+        for non_terminal in grammar.non_terminals:
+            self.assertEqual(grammar.first_sets[non_terminal], rebuilt.first_sets[non_terminal])
+            self.assertEqual(grammar.follow_sets[non_terminal], rebuilt.follow_sets[non_terminal])
+        self.assertEqual(ll1_table.cells, LL1Table(rebuilt).cells)
+        self.assertEqual(ll1_table.offsets, LL1Table(rebuilt).offsets)
+        self.assertEqual(grammar.production_first, rebuilt.production_first)
+        self.assertEqual(grammar.production_nullable, rebuilt.production_nullable)
+        for index in range(len(grammar.productions)):
+            self.assertEqual(grammar.suffix_first(index), rebuilt.suffix_first(index))
+
+    def test_add_command(self):
+        """Um "comando" novo: terminal, não terminal e produções, um a um."""
+        ll1_table = LL1Table(self.grammar)
+        affected = set()
+        for name, regex in [("neg", "~"), ("abs", "#"), ("sqrt", r"\?")]:
+            keyword, Call = Terminal(name, regex), NonTerminal(name.upper())
+            affected = self.grammar.add_productions(
+                [self.F >> [Call], Call >> [keyword, self.left_p, self.E, self.right_p]],
+                terminals=[keyword],
+                non_terminals=[Call],
+            )
+            ll1_table.update(affected)
+            self.assertSameAsRebuilt(self.grammar, ll1_table)
+        # FIRST(F) cresce e alcança T e E; X não depende de F
+        self.assertTrue({self.F, self.T, self.E, NonTerminal("SQRT")} <= affected)
+        self.assertNotIn(self.X, affected)
+        # O léxico é reconstruído com os terminais novos
+        parser = LL1ParserTable(ll1_table, self.E)
+        self.assertTrue(parser.parse(Tokenizer.tokenize("~(a) * ?(#(b))", self.grammar))[0])
+
+    def test_propagation(self):
+        """Alternativas anuláveis alteram FIRST e FOLLOW de outros não terminais."""
+        ll1_table = LL1Table(self.grammar)
+        # F → ε torna F, T e E anuláveis
+        affected = self.grammar.add_productions([self.F >> []])
+        self.assertTrue({self.F, self.T, self.E} <= affected)
+        ll1_table.update(affected)
+        self.assertSameAsRebuilt(self.grammar, ll1_table)
+        # FOLLOW(G) ⊇ FOLLOW(Y), e "!" entra em FIRST(Y) e FOLLOW(F)
+        bang, G = Terminal("bang", "!"), NonTerminal("G")
+        affected = self.grammar.add_productions(
+            [self.Y >> [bang, G], G >> [self.iden], G >> []], [bang], [G]
+        )
+        ll1_table.update(affected)
+        self.assertSameAsRebuilt(self.grammar, ll1_table)
+        self.assertIn(bang, self.grammar.follow_sets[self.F])
+
+    def test_random_additions(self):
+        """Produções aleatórias acrescentadas uma a uma: FIRST, FOLLOW e conflitos como do zero."""
+        rng = random.Random(2025)
+        terminals = [Terminal(name, name) for name in "abcd"]
+        non_terminals = [NonTerminal(name) for name in "SABC"]
+        for _ in range(30):
+            S, a = non_terminals[0], terminals[0]
+            grammar = Grammar(S, [a], [S], [S >> a])
+            ll1_table = LL1Table(grammar)
+            for _ in range(6):
+                lhs = rng.choice(non_terminals)
+                rhs = [rng.choice(terminals + non_terminals) for _ in range(rng.randint(0, 3))]
+                affected = grammar.add_productions([lhs >> rhs], terminals, non_terminals)
+                rebuilt = Grammar(S, grammar.terminals, grammar.non_terminals, grammar.productions)
+                for non_terminal in non_terminals:
+                    self.assertEqual(grammar.first_sets[non_terminal], rebuilt.first_sets[non_terminal])
+                    self.assertEqual(grammar.follow_sets[non_terminal], rebuilt.follow_sets[non_terminal])
+                try:
+                    expected = LL1Table(rebuilt).cells
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        ll1_table.update(affected)
+                    break
+                ll1_table.update(affected)
+                self.assertEqual(ll1_table.cells, expected)
+
+    def test_conflict_keeps_table(self):
+        ll1_table = LL1Table(self.grammar)
+        cells = array("h", ll1_table.cells)
+        affected = self.grammar.add_productions([self.F >> [self.iden, self.dot]])
+        with self.assertRaises(ValueError):
+            ll1_table.update(affected)
+        self.assertEqual(ll1_table.cells, cells)
+
+    def test_add_keyword(self):
+        """Uma palavra-chave nova entra antes do identificador e é reconhecida pelo léxico."""
+        ll1_table = LL1Table(self.grammar)
+        expressions = ExpressionParser(
+            self.grammar, self.E, {self.plus: 1, self.dot: 2}, {}, [self.iden], {self.left_p: self.right_p}
+        )
+        parsers = [
+            LL1ParserTable(ll1_table, self.E),
+            LL1ParserTable(ll1_table, self.E, expressions=expressions),
+            LL1ParserTable(ll1_table, self.E, synchronizing=[self.iden]),
+        ]
+        for parser in parsers:
+            self.assertTrue(parser.parse(Tokenizer.tokenize("a + b", self.grammar))[0])
+        neg, Neg = Terminal("neg", r"\b(neg)\b"), NonTerminal("Neg")
+        ll1_table.update(
+            self.grammar.add_productions([self.F >> [Neg], Neg >> [neg, self.F]], terminals=[neg], non_terminals=[Neg])
+        )
+        self.assertSameAsRebuilt(self.grammar, ll1_table)
+        terminals = self.grammar.terminals
+        self.assertEqual(terminals.index(neg) + 1, terminals.index(self.iden))
+
+        tokens = Tokenizer.tokenize("neg a * negado", self.grammar)
+        self.assertEqual([token.terminal for token in tokens], [neg, self.iden, self.dot, self.iden])
+        self.assertTrue(parsers[0].parse(tokens)[0])
+        self.assertEqual(parsers[0].recognize(tokens), (True, None))
+        # Os vetores por id do parser de precedência e da recuperação seguem a numeração nova
+        self.assertTrue(parsers[1].parse(Tokenizer.tokenize("a + (b * c)", self.grammar))[0])
+        self.assertEqual(parsers[2]._recovery_sets()[1], {self.grammar.symbol_ids[self.iden]})
+        errors = []
+        self.assertFalse(parsers[2].parse(Tokenizer.tokenize("neg + a", self.grammar), errors)[0])
+        self.assertEqual([error.position for error in errors], [1])
+
+    def test_insertion_point(self):
+        """Palavras-chave e lexemas fixos entram antes do terminal que os casaria; o resto, no fim."""
+        terminals = self.grammar.terminals
+        cases = [
+            (Terminal("neg", r"\b(neg)\b"), terminals.index(self.iden)),
+            (Terminal("menos", "-"), len(terminals)),
+            (Terminal("numero", r"\d+"), len(terminals)),
+        ]
+        for terminal, expected in cases:
+            with self.subTest(terminal=terminal.name):
+                self.assertEqual(Grammar.insertion_point(terminal, terminals), expected)
+
+    def test_conflict_reverts_grammar(self):
+        """Um conflito em `update` desfaz a adição: símbolos, produções, FIRST e FOLLOW."""
+        ll1_table = LL1Table(self.grammar)
+        parser = LL1ParserTable(ll1_table, self.E)
+        parser.parse(Tokenizer.tokenize("a", self.grammar))
+        self.grammar.production_first
+        before = (
+            list(self.grammar.terminals),
+            list(self.grammar.productions),
+            list(self.grammar.symbols),
+            {symbol: set(first) for symbol, first in self.grammar.first_sets.items()},
+            {symbol: set(follow) for symbol, follow in self.grammar.follow_sets.items()},
+            list(self.grammar.production_first),
+        )
+        bang, G = Terminal("bang", "!"), NonTerminal("G")
+        affected = self.grammar.add_productions(
+            [self.F >> [G], G >> [bang], G >> [self.iden, bang]], [bang], [G]
+        )
+        with self.assertRaises(ValueError):
+            ll1_table.update(affected)
+        after = (
+            self.grammar.terminals,
+            self.grammar.productions,
+            self.grammar.symbols,
+            dict(self.grammar.first_sets),
+            dict(self.grammar.follow_sets),
+            self.grammar.production_first,
+        )
+        self.assertEqual(after, before)
+        self.assertTrue(parser.parse(Tokenizer.tokenize("a * (b)", self.grammar))[0])
+        # A gramática restaurada continua aceitando adições
+        ll1_table.update(self.grammar.add_productions([self.F >> [G], G >> [bang]], [bang], [G]))
+        self.assertSameAsRebuilt(self.grammar, ll1_table)
+        self.assertTrue(parser.parse(Tokenizer.tokenize("a * !", self.grammar))[0])
+
+    def test_invalid_productions(self):
+        terminals = list(self.grammar.terminals)
+        with self.assertRaises(ValueError):
+            self.grammar.add_productions([self.F >> [Terminal("novo")]])
+        with self.assertRaises(ValueError):
+            self.grammar.add_productions([self.F >> [NonTerminal("N")]], [Terminal("t")])
+        self.assertEqual(self.grammar.terminals, terminals)
+        self.assertEqual(len(self.grammar.productions), len(self.productions))
+
+
+class TestInlineUnits(unittest.TestCase):
+    def setUp(self):
+        self.S, self.A, self.B, self.C, self.D = [NonTerminal(name) for name in "SABCD"]
+        self.b, self.c, self.d, self.e, self.semi = [
+            Terminal(name, regex) for name, regex in [("b", "b"), ("c", "c"), ("d", "d"), ("e", "e"), ("semi", ";")]
+        ]
+        self.grammar = Grammar(
+            start_symbol=self.S,
+            terminals=[self.b, self.c, self.d, self.e, self.semi],
+            non_terminals=[self.S, self.A, self.B, self.C, self.D],
+            productions=[
+                self.S >> [self.A, self.semi, self.S],  # S → A ; S
+                self.S >> [],                           # S → ε
+                self.A >> self.B,                       # A → B (unitária)
+                self.A >> self.c,                       # A → c
+                self.B >> [self.b, self.C, self.D],     # B → b C D
+                self.C >> self.d,                       # C → d
+                self.C >> Grammar.EPSILON,              # C → ε
+                self.D >> self.e,                       # D → e (única, usada uma vez)
+            ],
+        )
+
+    def test_inlined_productions(self):
+        inlined = self.grammar.inline_units()
+        self.assertEqual(
+            set(inlined.productions),
+            {
+                self.S >> [self.A, self.semi, self.S],
+                self.S >> [],
+                self.A >> [self.b, self.C, self.e],
+                self.A >> self.c,
+                self.C >> self.d,
+                self.C >> Grammar.EPSILON,
+            },
+        )
+        self.assertEqual(inlined.non_terminals, [self.S, self.A, self.C])
+        self.assertEqual(len(inlined.origins), len(inlined.productions))
+        # A gramática original não é alterada
+        self.assertEqual(len(self.grammar.productions), 8)
+        self.assertIsNone(self.grammar.origins)
+
+    def test_expand(self):
+        """O parse na gramática reduzida, expandido, reproduz a árvore original."""
+        inlined = self.grammar.inline_units()
+        original = LL1ParserTable(LL1Table(self.grammar), self.S)
+        reduced = LL1ParserTable(LL1Table(inlined), self.S)
+
+        def shape(root):
+            return [
+                (node.name.terminal if isinstance(node.name, Token) else node.name, node.depth)
+                for node in PreOrderIter(root)
+            ]
+
+        for text in ["", "c;", "b e;", "b d e; c; b e;"]:
+            tokens = Tokenizer.tokenize(text, self.grammar)
+            accepted, expected = original.parse(tokens)
+            self.assertTrue(accepted)
+            accepted, root = reduced.parse(tokens)
+            self.assertTrue(accepted)
+            self.assertLessEqual(len(root.descendants), len(expected.descendants))
+            self.assertEqual(shape(inlined.expand(root)), shape(expected))
+        # "b d e;": os nós de B e D deixam de existir
+        tokens = Tokenizer.tokenize("b d e;", self.grammar)
+        self.assertEqual(len(original.parse(tokens)[1].descendants), 9)
+        self.assertEqual(len(reduced.parse(tokens)[1].descendants), 7)
+        for text in ["b;", "c c;", "e;"]:
+            tokens = Tokenizer.tokenize(text, self.grammar)
+            self.assertFalse(reduced.parse(tokens)[0])
+
+    def test_unit_to_epsilon(self):
+        """Unitária para um não terminal ε: o ε some do lado direito e volta na expansão."""
+        S, A, E = [NonTerminal(name) for name in "SAE"]
+        a = Terminal("a", "a")
+        grammar = Grammar(S, [a], [S, A, E], [S >> [A, a], A >> E, E >> Grammar.EPSILON])
+        inlined = grammar.inline_units()
+        self.assertEqual(inlined.productions, [S >> [a]])
+        accepted, root = LL1ParserTable(LL1Table(inlined), S).parse(Tokenizer.tokenize("a", grammar))
+        self.assertTrue(accepted)
+        inlined.expand(root)
+        self.assertEqual([node.name for node in root.children[0].descendants], [E, Grammar.EPSILON])
+
 
 class TestLL1ParserTable(BaseGrammarTest):
     def setUp(self):
@@ -262,6 +947,33 @@ class TestLL1ParserTable(BaseGrammarTest):
         self.ll1_table = LL1Table(self.grammar)
         self.parser = LL1ParserTable(self.ll1_table, self.grammar.start_symbol)
 
+    def test_create_parser(self):
+        """Os dois motores, pelo nome, também pelo pacote: mesma árvore de derivação."""
+        self.assertEqual(set(ENGINES), {"ll1", "lalr1"})
+        tokens = Tokenizer.tokenize("a + b * (c + d)", self.grammar)
+        trees = {}
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                parser = create_parser(self.grammar, engine)
+                self.assertIsInstance(parser, TableParser)
+                parsed, root = parser.parse(tokens)
+                self.assertTrue(parsed)
+                trees[engine] = RenderTree(root.to_anytree()).by_attr()
+        self.assertEqual(trees["lalr1"], trees["ll1"])
+        with self.assertRaises(ValueError):
+            create_parser(self.grammar, "earley")
+
+    def test_incomplete_engine(self):
+        """Um motor sem `parse` falha ao ser instanciado, não no meio do parsing."""
+
+        class Incomplete(TableParser):
+            @classmethod
+            def from_grammar(cls, grammar, **options):
+                return cls()
+
+        with self.assertRaises(TypeError):
+            Incomplete.from_grammar(self.grammar)
+
     def test_parse_valid(self):
         valid_cases = [
             "id + id * ( id + id )",
@@ -277,6 +989,49 @@ class TestLL1ParserTable(BaseGrammarTest):
                 # Verifica se a análise foi bem-sucedida
                 self.assertTrue(parsed)
 
+    def test_parse_token_stream(self):
+        """O parser aceita qualquer iterável de tokens, com um token de lookahead."""
+        for case, expected in [("a + b * (c + d)", True), ("a + b c", False), ("(a", False)]:
+            with self.subTest(case=case):
+                parsed, _ = self.parser.parse(Tokenizer.iter_tokens(case, self.grammar))
+                self.assertEqual(parsed, expected)
+
+    def test_parse_unknown_terminal(self):
+        """Tokens de terminais fora da gramática rejeitam a entrada."""
+        other = Terminal("other", r"\?")
+        tokens = [Token(self.iden, "a"), Token(self.plus, "+"), Token(other, "?")]
+        self.assertFalse(self.parser.parse(tokens)[0])
+        self.assertFalse(self.parser.parse([Token(self.iden, "a"), Token(other, "?")])[0])
+        self.assertTrue(self.parser.parse([Token(self.iden, "a")])[0])
+
+    def test_parse_tree(self):
+        """Tokens de uma lista e da `TokenArray` produzem a mesma árvore, com folhas ε."""
+        tokens = Tokenizer.tokenize("a * (b)", self.grammar)
+        trees = []
+        for source in (tokens, list(tokens)):
+            parsed, root = self.parser.parse(source)
+            self.assertTrue(parsed)
+            trees.append([(repr(node.name), node.depth) for node in PreOrderIter(root)])
+        self.assertEqual(trees[0], trees[1])
+        self.assertEqual([name for name, _ in trees[0]][:4], ["E", "T", "F", repr(tokens[0])])
+        self.assertEqual(trees[0][-1], ("X", 1))  # X → [] não cria filhos
+
+        # Produções com ε explícito criam uma folha ε
+        S, A = NonTerminal("S"), NonTerminal("A")
+        a, b = Terminal("a", "a"), Terminal("b", "b")
+        grammar = Grammar(S, [a, b], [S, A], [S >> [a, A], A >> b, A >> Grammar.EPSILON])
+        parsed, root = LL1ParserTable(LL1Table(grammar), S).parse(Tokenizer.tokenize("a", grammar))
+        self.assertTrue(parsed)
+        self.assertEqual([repr(node.name) for node in PreOrderIter(root)][-2:], ["A", "ε"])
+
+    def test_parse_compressed_table(self):
+        parser = LL1ParserTable(self.ll1_table.compress(), self.grammar.start_symbol)
+        for case, expected in [("a + b * (c + d)", True), ("a + b c", False), ("(a", False), (")", False)]:
+            with self.subTest(case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                self.assertEqual(parser.parse(tokens)[0], expected)
+                self.assertEqual(parser.parse(tokens)[0], self.parser.parse(tokens)[0])
+
     def test_parse_invalid(self):
         invalid_cases = [
             "())",
@@ -292,6 +1047,129 @@ class TestLL1ParserTable(BaseGrammarTest):
                 parsed, _ = self.parser.parse(tokens)
                 self.assertFalse(parsed)
 
+    def test_recognize(self):
+        """Mesmo veredito de `parse`, com a posição do token que falhou."""
+        cases = [
+            ("a + b * (c + d)", None),
+            ("a + b c", 3),  # tokens após a derivação completa
+            ("(a", 2),  # fim da entrada
+            ("", 0),
+            ("a + * b", 2),
+            ("())", 1),
+        ]
+        compressed = LL1ParserTable(self.ll1_table.compress(), self.grammar.start_symbol)
+        for case, position in cases:
+            with self.subTest(case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                expected = (position is None, position)
+                self.assertEqual(self.parser.recognize(tokens), expected)
+                self.assertEqual(self.parser.recognize(list(tokens)), expected)
+                self.assertEqual(self.parser.recognize(Tokenizer.iter_tokens(case, self.grammar)), expected)
+                self.assertEqual(compressed.recognize(tokens), expected)
+                self.assertEqual(self.parser.parse(tokens)[0], expected[0])
+
+    def test_recognize_random(self):
+        """Entradas aleatórias: `recognize` e `parse` sempre concordam."""
+        rng = random.Random(23)
+        pieces = ["a", "+", "*", "(", ")"]
+        for _ in range(500):
+            case = " ".join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+            with self.subTest(case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                accepted, position = self.parser.recognize(tokens)
+                self.assertEqual(accepted, self.parser.parse(tokens)[0])
+                if not accepted:
+                    # Prefixo viável (LL(1)): cortado na posição, só falha no fim da entrada
+                    prefix_accepted, prefix_position = self.parser.recognize(list(tokens)[:position])
+                    self.assertTrue(prefix_accepted or prefix_position == position)
+
+    def test_error_recovery(self):
+        """Com `errors`, todos os erros são coletados numa passada, com as posições dos tokens."""
+        cases = [
+            ("a + b * (c + d)", []),
+            ("a + * b + (c d) + e", [(2, ["(", "id"]), (7, ["+", "*", ")", "EOF"])]),
+            ("a + b c", [(3, ["+", "*", ")", "EOF"])]),
+            ("(a", [(2, [")"])]),
+            ("", [(0, ["(", "id"])]),
+            ("())", [(1, ["(", "id"]), (2, ["EOF"])]),  # sobra um ')'
+            ("a + (b * ) + c )", [(5, ["(", "id"]), (8, ["EOF"])]),
+        ]
+        compressed = LL1ParserTable(self.ll1_table.compress(), self.grammar.start_symbol)
+        for case, expected in cases:
+            with self.subTest(case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                for parser, source in [(self.parser, tokens), (self.parser, list(tokens)), (compressed, tokens)]:
+                    errors = []
+                    parsed, root = parser.parse(source, errors)
+                    self.assertEqual(parsed, not expected)
+                    self.assertEqual(root.name, self.E)
+                    self.assertEqual(
+                        [(error.position, [t.repr for t in error.expected]) for error in errors], expected
+                    )
+                    self.assertTrue(all(isinstance(error, SyntaxDiagnostic) for error in errors))
+                if not expected:
+                    trees = [self.parser.parse(tokens, [])[1], self.parser.parse(tokens)[1]]
+                    self.assertEqual(*[RenderTree(tree.to_anytree()).by_attr(lambda n: repr(n.name)) for tree in trees])
+
+    def test_error_recovery_random(self):
+        """O primeiro erro é o de `recognize`; as posições crescem e a passada sempre termina."""
+        rng = random.Random(24)
+        pieces = ["a", "+", "*", "(", ")"]
+        for _ in range(500):
+            case = " ".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            with self.subTest(case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                errors = []
+                parsed, _ = self.parser.parse(Tokenizer.iter_tokens(case, self.grammar), errors)
+                accepted, position = self.parser.recognize(tokens)
+                self.assertEqual(parsed, accepted)
+                if not accepted:
+                    self.assertEqual(errors[0].position, position)
+                positions = [error.position for error in errors]
+                self.assertEqual(positions, sorted(set(positions)))
+                self.assertTrue(all(position <= len(tokens) for position in positions))
+
+    def test_error_recovery_message(self):
+        tokens = Tokenizer.tokenize("a +\n* b", self.grammar)
+        errors = []
+        self.parser.parse(tokens, errors)
+        self.assertEqual(str(errors[0]), "Erro de sintaxe (linha 2, coluna 1): encontrado '*', esperado '(', 'id'")
+        errors = []
+        self.parser.parse([Token(self.left_p, "("), Token(self.iden, "a")], errors)
+        self.assertEqual(str(errors[0]), "Erro de sintaxe (token 2): encontrado fim da entrada, esperado ')'")
+        with self.assertRaises(ValueError):
+            LL1ParserTable(self.ll1_table, self.E, actions={}).parse(tokens, [])
+
+    def test_parse_start(self):
+        """Qualquer não terminal serve de símbolo inicial, com a mesma tabela."""
+        compressed = LL1ParserTable(self.ll1_table.compress(), self.grammar.start_symbol)
+        cases = [(self.T, "a * (b + c)", None), (self.T, "a + b", 1), (self.F, "(a)", None), (self.F, "a * b", 1)]
+        for start, case, position in cases:
+            with self.subTest(start=start, case=case):
+                tokens = Tokenizer.tokenize(case, self.grammar)
+                for parser in (self.parser, compressed):
+                    parsed, root = parser.parse(tokens, start=start)
+                    self.assertEqual(parsed, position is None)
+                    self.assertEqual(root.name, start)
+                    self.assertEqual(parser.recognize(tokens, start=start), (position is None, position))
+                    errors = []
+                    parser.parse(tokens, errors, start=start)
+                    self.assertEqual([error.position for error in errors], [] if position is None else [position])
+
+        # "$" não está no FOLLOW de A: no fim da entrada vale a produção anulável de A
+        S, A = NonTerminal("S"), NonTerminal("A")
+        a, b, c = Terminal("a", "a"), Terminal("b", "b"), Terminal("c", "c")
+        grammar = Grammar(S, [a, b, c], [S, A], [S >> [a, A, b], A >> [c, A], A >> []])
+        parser = LL1ParserTable(LL1Table(grammar), S)
+        for case, expected in [("", True), ("cc", True), ("cb", False), ("b", False)]:
+            with self.subTest(start=A, case=case):
+                tokens = Tokenizer.tokenize(case, grammar)
+                self.assertEqual(parser.parse(tokens, start=A)[0], expected)
+                self.assertEqual(parser.recognize(tokens, start=A)[0], expected)
+                self.assertEqual(parser.parse(tokens, [], start=A)[0], expected)
+        self.assertTrue(parser.parse(Tokenizer.tokenize("acb", grammar))[0])
+        self.assertFalse(parser.parse(Tokenizer.tokenize("ac", grammar))[0])
+
 
 if __name__ == "__main__":
     unittest.main()